@@ -0,0 +1,42 @@
+"""composite indexes for household list queries
+
+Revision ID: 0006_list_indexes
+Revises: 0005_table_prefs
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_list_indexes"
+down_revision = "0005_table_prefs"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_users_HouseholdId", "users", ["HouseholdId"]),
+    ("ix_refresh_tokens_UserId", "refresh_tokens", ["UserId"]),
+    ("ix_income_streams_HouseholdId_CreatedAt", "income_streams", ["HouseholdId", "CreatedAt"]),
+    ("ix_scenarios_HouseholdId_CreatedAt", "scenarios", ["HouseholdId", "CreatedAt"]),
+    ("ix_scenario_adjustments_ScenarioId", "scenario_adjustments", ["ScenarioId"]),
+    (
+        "ix_expenses_HouseholdId_DisplayOrder_CreatedAt",
+        "expenses",
+        ["HouseholdId", "DisplayOrder", sa.text('"CreatedAt" DESC')],
+    ),
+    ("ix_expense_accounts_HouseholdId_Name", "expense_accounts", ["HouseholdId", "Name"]),
+    ("ix_expense_types_HouseholdId_Name", "expense_types", ["HouseholdId", "Name"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table)}
+        if name not in existing_indexes:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
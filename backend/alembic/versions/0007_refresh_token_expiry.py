@@ -0,0 +1,32 @@
+"""refresh token expiry indexes
+
+Revision ID: 0007_refresh_token_expiry
+Revises: 0006_list_indexes
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_refresh_token_expiry"
+down_revision = "0006_list_indexes"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_refresh_tokens_ExpiresAt", "refresh_tokens", ["ExpiresAt"]),
+    ("ix_refresh_tokens_RevokedAt", "refresh_tokens", ["RevokedAt"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table)}
+        if name not in existing_indexes:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
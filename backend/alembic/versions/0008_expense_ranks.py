@@ -0,0 +1,59 @@
+"""sparse expense rank keys
+
+Revision ID: 0008_expense_ranks
+Revises: 0007_refresh_token_expiry
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_expense_ranks"
+down_revision = "0007_refresh_token_expiry"
+branch_labels = None
+depends_on = None
+
+# Kept in step with app.services.ordering.RANK_GAP; migrations do not import app code.
+RANK_GAP = 1024
+
+expenses = sa.table(
+    "expenses",
+    sa.column("Id", sa.Integer),
+    sa.column("HouseholdId", sa.Integer),
+    sa.column("DisplayOrder", sa.Integer),
+    sa.column("CreatedAt", sa.DateTime(timezone=True)),
+)
+
+
+def _Renumber(step: int) -> None:
+    # Renumbers each household in its current list order, which also breaks DisplayOrder ties.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(expenses.c.Id, expenses.c.HouseholdId).order_by(
+            expenses.c.HouseholdId, expenses.c.DisplayOrder.asc(), expenses.c.CreatedAt.desc()
+        )
+    ).all()
+    params = []
+    household_id = None
+    position = 0
+    for expense_id, row_household_id in rows:
+        if row_household_id != household_id:
+            household_id = row_household_id
+            position = 0
+        position += 1
+        params.append({"ExpenseId": expense_id, "Rank": position * step})
+    if params:
+        bind.execute(
+            expenses.update()
+            .where(expenses.c.Id == sa.bindparam("ExpenseId"))
+            .values(DisplayOrder=sa.bindparam("Rank")),
+            params,
+        )
+
+
+def upgrade() -> None:
+    _Renumber(RANK_GAP)
+
+
+def downgrade() -> None:
+    _Renumber(1)
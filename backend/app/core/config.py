@@ -3,13 +3,29 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DatabaseUrl: str = "sqlite:////data/household.db"
+    ReadReplicaUrls: str = ""
+    ReadReplicaStickySeconds: float = 5.0
+    SqliteProfileEnabled: bool = True
+    SqliteJournalMode: str = "WAL"
+    SqliteSynchronous: str = "NORMAL"
+    SqliteBusyTimeoutMs: int = 5000
+    SqliteCacheSizeKb: int = 20000
+    SqliteMmapSizeBytes: int = 268_435_456
+    SqliteTempStore: str = "MEMORY"
+    SqlitePoolSize: int = 5
     JwtSecretKey: str = "change-me"
     JwtAlgorithm: str = "HS256"
     AccessTokenTtlMinutes: int = 15
     RefreshTokenTtlDays: int = 30
+    RefreshTokenPruneEnabled: bool = True
+    RefreshTokenPruneIntervalSeconds: float = 3600.0
+    RefreshTokenPruneBatchSize: int = 500
+    RefreshTokenPruneMaxBatches: int = 200
+    RefreshTokenPrunePauseMs: int = 50
     AllowedOrigins: str = "http://localhost:5173,http://127.0.0.1:5173"
     FinancialYearStartMonth: int = 7
     FinancialYearStartDay: int = 1
+    CalendarMaxRangeDays: int = 3660
     LogLevel: str = "INFO"
     LogFilePath: str = "./logs/app.log"
     LogMaxBytes: int = 5_000_000
@@ -2,8 +2,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 import secrets
 
-from jose import jwt
+from jose import JWTError, jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
 
@@ -18,6 +19,16 @@ def VerifyPassword(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Argon2 is deliberately slow (tens of milliseconds per call), so async handlers hash and
+# verify on the threadpool instead of blocking the event loop.
+async def HashPasswordAsync(password: str) -> str:
+    return await run_in_threadpool(HashPassword, password)
+
+
+async def VerifyPasswordAsync(plain_password: str, hashed_password: str) -> bool:
+    return await run_in_threadpool(VerifyPassword, plain_password, hashed_password)
+
+
 def CreateAccessToken(subject: str, extra_claims: Dict[str, Any]) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.AccessTokenTtlMinutes)
     to_encode = {"sub": subject, "exp": expire, **extra_claims}
@@ -30,3 +41,23 @@ def CreateRefreshToken() -> str:
 
 def CreateRefreshTokenExpiry() -> datetime:
     return datetime.now(timezone.utc) + timedelta(days=settings.RefreshTokenTtlDays)
+
+
+# Read-your-writes marker handed to the client after a household commits, so whichever worker
+# serves the next read can keep it on the primary. Signed like the access token.
+def CreateLastWriteToken(household_id: int, written_at: float) -> str:
+    return jwt.encode(
+        {"hid": household_id, "at": written_at}, settings.JwtSecretKey, algorithm=settings.JwtAlgorithm
+    )
+
+
+def ReadLastWriteToken(token: str | None, household_id: int) -> float | None:
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(token, settings.JwtSecretKey, algorithms=[settings.JwtAlgorithm])
+    except JWTError:
+        return None
+    if payload.get("hid") != household_id or not isinstance(payload.get("at"), (int, float)):
+        return None
+    return float(payload["at"])
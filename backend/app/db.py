@@ -1,11 +1,168 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import itertools
+import threading
+import time
 
-from app.core.config import settings
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
-connect_args = {}
-if settings.DatabaseUrl.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
+from app.core.config import Settings, settings
 
-engine = create_engine(settings.DatabaseUrl, pool_pre_ping=True, connect_args=connect_args)
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def _IsMemoryDatabase(database_url: str) -> bool:
+    return database_url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in database_url
+
+
+def SqlitePragmas(config: Settings) -> list[str]:
+    journal_mode = config.SqliteJournalMode.upper()
+    synchronous = config.SqliteSynchronous.upper()
+    temp_store = config.SqliteTempStore.upper()
+    if journal_mode not in _JOURNAL_MODES:
+        raise ValueError(f"Unsupported SqliteJournalMode: {config.SqliteJournalMode}")
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(f"Unsupported SqliteSynchronous: {config.SqliteSynchronous}")
+    if temp_store not in _TEMP_STORES:
+        raise ValueError(f"Unsupported SqliteTempStore: {config.SqliteTempStore}")
+    return [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA busy_timeout={int(config.SqliteBusyTimeoutMs)}",
+        # A negative cache_size is in KiB rather than pages.
+        f"PRAGMA cache_size=-{int(config.SqliteCacheSizeKb)}",
+        f"PRAGMA mmap_size={int(config.SqliteMmapSizeBytes)}",
+        f"PRAGMA temp_store={temp_store}",
+    ]
+
+
+def _AttachSqlitePragmas(sqlite_engine: Engine, config: Settings) -> None:
+    pragmas = SqlitePragmas(config)
+
+    @event.listens_for(sqlite_engine, "connect")
+    def ApplySqlitePragmas(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def CreateDbEngine(database_url: str, config: Settings = settings) -> Engine:
+    if not database_url.startswith("sqlite"):
+        return create_engine(database_url, pool_pre_ping=True)
+
+    # A local file cannot go stale the way a server connection can, so there is no pre-ping.
+    # Connections are pooled and reused because the pragmas below are per connection.
+    options: dict = {"connect_args": {"check_same_thread": False}}
+    if _IsMemoryDatabase(database_url):
+        options["poolclass"] = StaticPool
+    else:
+        options.update(poolclass=QueuePool, pool_size=config.SqlitePoolSize, max_overflow=config.SqlitePoolSize)
+    sqlite_engine = create_engine(database_url, **options)
+    if config.SqliteProfileEnabled:
+        _AttachSqlitePragmas(sqlite_engine, config)
+    return sqlite_engine
+
+
+def AsyncDatabaseUrl(database_url: str) -> str:
+    # DatabaseUrl keeps naming the sync driver (Alembic and scripts use it); the request path
+    # swaps in the asyncio driver for the same database.
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    elif url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False)
+
+
+def CreateAsyncDbEngine(database_url: str, config: Settings = settings) -> AsyncEngine:
+    async_url = AsyncDatabaseUrl(database_url)
+    if not async_url.startswith("sqlite"):
+        return create_async_engine(async_url, pool_pre_ping=True)
+
+    options: dict = {}
+    if _IsMemoryDatabase(database_url):
+        options["poolclass"] = StaticPool
+    else:
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=config.SqlitePoolSize,
+            max_overflow=config.SqlitePoolSize,
+        )
+    sqlite_engine = create_async_engine(async_url, **options)
+    if config.SqliteProfileEnabled:
+        # aiosqlite exposes a DB-API style cursor on the adapted connection, so the same
+        # per-connection pragmas apply.
+        _AttachSqlitePragmas(sqlite_engine.sync_engine, config)
+    return sqlite_engine
+
+
+def ReadReplicaUrls(config: Settings = settings) -> list[str]:
+    return [url.strip() for url in config.ReadReplicaUrls.split(",") if url.strip()]
+
+
+# Commits on the primary, per household, so reads right after a write stay on the primary
+# (read-your-writes). This map only covers commits made through this process; the request's
+# state also records the commit so the response can carry it to the client as a signed
+# cookie, which keeps the next read on the primary whichever worker serves it.
+LAST_WRITE_COOKIE = "LastWrite"
+
+_LAST_COMMITS: dict[int, float] = {}
+_LAST_COMMITS_LOCK = threading.Lock()
+
+
+class PrimarySession(Session):
+    pass
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _RecordCommit(session: Session) -> None:
+    household_id = session.info.get("HouseholdId")
+    if household_id is None:
+        return
+    written_at = time.time()
+    with _LAST_COMMITS_LOCK:
+        _LAST_COMMITS[household_id] = written_at
+    request_state = session.info.get("RequestState")
+    if request_state is not None:
+        request_state.LastWrite = (household_id, written_at)
+
+
+engine = CreateDbEngine(settings.DatabaseUrl)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = CreateAsyncDbEngine(settings.DatabaseUrl)
+# Attributes stay loaded after commit so handlers can build responses without another
+# round trip (lazy loads are not available on an AsyncSession).
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False, sync_session_class=PrimarySession
+)
+
+read_engines = [CreateAsyncDbEngine(url) for url in ReadReplicaUrls()]
+_READ_SESSIONS = itertools.cycle(
+    [async_sessionmaker(read_engine, autoflush=False, expire_on_commit=False) for read_engine in read_engines]
+)
+
+
+def ReadSessionFor(
+    household_id: int,
+    last_write_at: float | None = None,
+    config: Settings = settings,
+) -> async_sessionmaker | None:
+    # None means the read should use the primary: no replicas are configured, or the household
+    # committed recently (here or, per the client's cookie, on another worker) and a replica may
+    # not have caught up yet.
+    if not read_engines:
+        return None
+    with _LAST_COMMITS_LOCK:
+        local_write_at = _LAST_COMMITS.get(household_id)
+    latest = max(filter(None, (local_write_at, last_write_at)), default=None)
+    if latest is not None and time.time() - latest < config.ReadReplicaStickySeconds:
+        return None
+    return next(_READ_SESSIONS)
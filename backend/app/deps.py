@@ -1,31 +1,41 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 import logging
-from typing import Generator
+from typing import AsyncGenerator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db import SessionLocal
+from app.core.security import ReadLastWriteToken
+from app.db import LAST_WRITE_COOKIE, AsyncSessionLocal, ReadSessionFor
 from app.models import User
+from app.services.schedules import BuildFiscalContext, FiscalContext
 
 security = HTTPBearer()
 logger = logging.getLogger("auth")
 
 
-def GetDb() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+async def GetDb(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        # Commits record themselves here so the response can set the read-your-writes cookie.
+        db.info["RequestState"] = request.state
         yield db
-    finally:
-        db.close()
 
 
-def GetCurrentUser(
+async def GetFiscalContext(as_of: date | None = Query(None, alias="asOf")) -> FiscalContext:
+    return BuildFiscalContext(
+        as_of or date.today(),
+        settings.FinancialYearStartMonth,
+        settings.FinancialYearStartDay,
+    )
+
+
+async def GetCurrentUser(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
 ) -> User:
     token = credentials.credentials
     try:
@@ -34,17 +44,35 @@ def GetCurrentUser(
     except (JWTError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.query(User).filter(User.Id == user_id).first()
+    user = await db.scalar(select(User).where(User.Id == user_id))
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    # Lets the primary session record which household a commit belongs to.
+    db.info["HouseholdId"] = user.HouseholdId
     return user
 
 
-def RequireAuthenticated(user: User = Depends(GetCurrentUser)) -> User:
+async def GetReadDb(
+    request: Request,
+    user: User = Depends(GetCurrentUser),
+    db: AsyncSession = Depends(GetDb),
+) -> AsyncGenerator[AsyncSession, None]:
+    # Pure reads go to a read replica when one is configured; the primary session from GetDb
+    # (already open for the user lookup) serves them otherwise.
+    last_write_at = ReadLastWriteToken(request.cookies.get(LAST_WRITE_COOKIE), user.HouseholdId)
+    read_session = ReadSessionFor(user.HouseholdId, last_write_at)
+    if read_session is None:
+        yield db
+        return
+    async with read_session() as read_db:
+        yield read_db
+
+
+async def RequireAuthenticated(user: User = Depends(GetCurrentUser)) -> User:
     return user
 
 
-def RequireRoleAdmin(user: User = Depends(GetCurrentUser)) -> User:
+async def RequireRoleAdmin(user: User = Depends(GetCurrentUser)) -> User:
     if user.Role != "Admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
     return user
@@ -69,5 +97,8 @@ def RequireCanWriteHousehold(household_id: int, user: User) -> None:
 def EnsureRefreshTokenActive(expires_at: datetime, revoked_at: datetime | None) -> None:
     if revoked_at is not None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
+    # SQLite hands back naive datetimes even for timezone-aware columns; they are stored as UTC.
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
     if expires_at < datetime.now(timezone.utc):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
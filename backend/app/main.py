@@ -1,4 +1,6 @@
+from contextlib import asynccontextmanager
 import logging
+import math
 import time
 import uuid
 from http import HTTPStatus
@@ -8,19 +10,42 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.logging import configure_logging
 from app.core.config import settings
+from app.core.security import CreateLastWriteToken
+from app.db import LAST_WRITE_COOKIE, AsyncSessionLocal, read_engines
 from app.routes.auth import router as auth_router
+from app.routes.calendar import router as calendar_router
 from app.routes.income_streams import router as income_router
+from app.routes.projections import router as projections_router
 from app.routes.scenarios import router as scenario_router
 from app.routes.tax_calculator import router as tax_calculator_router
 from app.routes.expenses import router as expense_router
 from app.routes.expense_accounts import router as expense_account_router
 from app.routes.expense_types import router as expense_type_router
+from app.routes.households import router as households_router
+from app.routes.maintenance import router as maintenance_router
 from app.routes.table_preferences import router as table_preferences_router
+from app.services.maintenance import MaintenanceScheduler, PruneRefreshTokens
+
+
+@asynccontextmanager
+async def Lifespan(_: FastAPI):
+    scheduler = MaintenanceScheduler()
+    if settings.RefreshTokenPruneEnabled:
+        scheduler.Add(
+            "refresh-token-prune",
+            settings.RefreshTokenPruneIntervalSeconds,
+            lambda: PruneRefreshTokens(AsyncSessionLocal),
+        )
+    scheduler.Start()
+    try:
+        yield
+    finally:
+        await scheduler.Stop()
 
 
 def CreateApp() -> FastAPI:
     configure_logging()
-    app = FastAPI(title="Household API")
+    app = FastAPI(title="Household API", lifespan=Lifespan)
 
     allowed_origins = [origin.strip() for origin in settings.AllowedOrigins.split(",") if origin.strip()]
     app.add_middleware(
@@ -29,8 +54,24 @@ def CreateApp() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
+    @app.middleware("http")
+    async def SetLastWriteCookie(request: Request, call_next):
+        response = await call_next(request)
+        last_write = getattr(request.state, "LastWrite", None)
+        if last_write is not None and read_engines:
+            household_id, written_at = last_write
+            response.set_cookie(
+                LAST_WRITE_COOKIE,
+                CreateLastWriteToken(household_id, written_at),
+                max_age=math.ceil(settings.ReadReplicaStickySeconds),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
     @app.middleware("http")
     async def LogRequests(request: Request, call_next):
         request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
@@ -55,7 +96,7 @@ def CreateApp() -> FastAPI:
         return response
 
     @app.get("/health")
-    def Health() -> dict:
+    async def Health() -> dict:
         return {"Status": "ok"}
 
     app.include_router(auth_router)
@@ -66,6 +107,10 @@ def CreateApp() -> FastAPI:
     app.include_router(expense_account_router)
     app.include_router(expense_type_router)
     app.include_router(table_preferences_router)
+    app.include_router(calendar_router)
+    app.include_router(projections_router)
+    app.include_router(households_router)
+    app.include_router(maintenance_router)
     return app
 
 
@@ -1,6 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Enum, ForeignKey, Integer, JSON, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    Numeric,
+    String,
+    Text,
+)
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -144,3 +157,23 @@ class TablePreference(Base):
     State = Column(JSON, nullable=False)
     CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     UpdatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+
+# Household-scoped list queries filter on the leading column and read rows already in the
+# requested order (migration 0006_list_indexes).
+Index("ix_users_HouseholdId", User.HouseholdId)
+Index("ix_refresh_tokens_UserId", RefreshToken.UserId)
+# Token pruning looks up expired or revoked rows (migration 0007_refresh_token_expiry).
+Index("ix_refresh_tokens_ExpiresAt", RefreshToken.ExpiresAt)
+Index("ix_refresh_tokens_RevokedAt", RefreshToken.RevokedAt)
+Index("ix_income_streams_HouseholdId_CreatedAt", IncomeStream.HouseholdId, IncomeStream.CreatedAt)
+Index("ix_scenarios_HouseholdId_CreatedAt", Scenario.HouseholdId, Scenario.CreatedAt)
+Index("ix_scenario_adjustments_ScenarioId", ScenarioAdjustment.ScenarioId)
+Index(
+    "ix_expenses_HouseholdId_DisplayOrder_CreatedAt",
+    Expense.HouseholdId,
+    Expense.DisplayOrder,
+    Expense.CreatedAt.desc(),
+)
+Index("ix_expense_accounts_HouseholdId_Name", ExpenseAccount.HouseholdId, ExpenseAccount.Name)
+Index("ix_expense_types_HouseholdId_Name", ExpenseType.HouseholdId, ExpenseType.Name)
@@ -4,14 +4,15 @@ import logging
 from urllib.parse import urlparse
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import (
     CreateAccessToken,
     CreateRefreshToken,
     CreateRefreshTokenExpiry,
-    HashPassword,
-    VerifyPassword,
+    HashPasswordAsync,
+    VerifyPasswordAsync,
 )
 from app.core.config import settings
 from app.deps import EnsureRefreshTokenActive, GetDb
@@ -22,46 +23,46 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserOut)
-def Register(payload: UserRegister, db: Session = Depends(GetDb)) -> UserOut:
-    existing = db.query(User).filter(User.Email == payload.Email).first()
+async def Register(payload: UserRegister, db: AsyncSession = Depends(GetDb)) -> UserOut:
+    existing = await db.scalar(select(User).where(User.Email == payload.Email))
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
     household = Household(Name=payload.HouseholdName)
     db.add(household)
-    db.flush()
+    await db.flush()
 
     user = User(
         Email=payload.Email,
-        PasswordHash=HashPassword(payload.Password),
+        PasswordHash=await HashPasswordAsync(payload.Password),
         Role="Admin",
         HouseholdId=household.Id,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return UserOut(Id=user.Id, Email=user.Email, Role=user.Role, HouseholdId=user.HouseholdId)
 
 
 @router.post("/login", response_model=TokenPair)
-def Login(payload: UserLogin, db: Session = Depends(GetDb)) -> TokenPair:
-    user = db.query(User).filter(User.Email == payload.Email).first()
-    if not user or not VerifyPassword(payload.Password, user.PasswordHash):
+async def Login(payload: UserLogin, db: AsyncSession = Depends(GetDb)) -> TokenPair:
+    user = await db.scalar(select(User).where(User.Email == payload.Email))
+    if not user or not await VerifyPasswordAsync(payload.Password, user.PasswordHash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    return IssueTokenPair(user, db)
+    return await IssueTokenPair(user, db)
 
 
 @router.post("/refresh", response_model=TokenPair)
-def Refresh(payload: RefreshRequest, db: Session = Depends(GetDb)) -> TokenPair:
+async def Refresh(payload: RefreshRequest, db: AsyncSession = Depends(GetDb)) -> TokenPair:
     try:
         token_id_str, refresh_secret = payload.RefreshToken.split(".", 1)
         token_id = int(token_id_str)
     except (ValueError, AttributeError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
-    record = db.query(RefreshToken).filter(RefreshToken.Id == token_id).first()
-    if not record or not VerifyPassword(refresh_secret, record.TokenHash):
+    record = await db.scalar(select(RefreshToken).where(RefreshToken.Id == token_id))
+    if not record or not await VerifyPasswordAsync(refresh_secret, record.TokenHash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
     EnsureRefreshTokenActive(record.ExpiresAt, record.RevokedAt)
@@ -69,15 +70,15 @@ def Refresh(payload: RefreshRequest, db: Session = Depends(GetDb)) -> TokenPair:
     record.RevokedAt = datetime.utcnow()
     db.add(record)
 
-    user = db.query(User).filter(User.Id == record.UserId).first()
+    user = await db.scalar(select(User).where(User.Id == record.UserId))
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
-    return IssueTokenPair(user, db)
+    return await IssueTokenPair(user, db)
 
 
 @router.get("/authelia", response_model=TokenPair)
-def AutheliaLogin(request: Request, db: Session = Depends(GetDb)) -> TokenPair:
+async def AutheliaLogin(request: Request, db: AsyncSession = Depends(GetDb)) -> TokenPair:
     logger = logging.getLogger("auth.authelia")
     if not settings.AutheliaEnabled:
         raise HTTPException(
@@ -108,27 +109,27 @@ def AutheliaLogin(request: Request, db: Session = Depends(GetDb)) -> TokenPair:
             detail="Authelia identity headers not found",
         )
 
-    user = db.query(User).filter(User.Email == email).first()
+    user = await db.scalar(select(User).where(User.Email == email))
     if not user:
-        household = db.query(Household).order_by(Household.Id.asc()).first()
+        household = await db.scalar(select(Household).order_by(Household.Id.asc()).limit(1))
         if not household:
             household = Household(Name="Household")
             db.add(household)
-            db.flush()
+            await db.flush()
             role = "Admin"
         else:
             role = "User"
         user = User(
             Email=email,
-            PasswordHash=HashPassword(CreateRefreshToken()),
+            PasswordHash=await HashPasswordAsync(CreateRefreshToken()),
             Role=role,
             HouseholdId=household.Id,
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
-    tokens = IssueTokenPair(user, db)
+    tokens = await IssueTokenPair(user, db)
     token_payload = {"AccessToken": tokens.AccessToken, "RefreshToken": tokens.RefreshToken}
     if return_to:
         safe_target = "/"
@@ -161,16 +162,16 @@ def AutheliaLogin(request: Request, db: Session = Depends(GetDb)) -> TokenPair:
     return tokens
 
 
-def IssueTokenPair(user: User, db: Session) -> TokenPair:
+async def IssueTokenPair(user: User, db: AsyncSession) -> TokenPair:
     refresh_secret = CreateRefreshToken()
     refresh_record = RefreshToken(
         UserId=user.Id,
-        TokenHash=HashPassword(refresh_secret),
+        TokenHash=await HashPasswordAsync(refresh_secret),
         ExpiresAt=CreateRefreshTokenExpiry(),
     )
     db.add(refresh_record)
-    db.commit()
-    db.refresh(refresh_record)
+    await db.commit()
+    await db.refresh(refresh_record)
 
     access = CreateAccessToken(str(user.Id), {"role": user.Role})
     refresh_token = f"{refresh_record.Id}.{refresh_secret}"
@@ -0,0 +1,160 @@
+from datetime import date
+from decimal import Decimal
+import heapq
+from itertools import islice
+from typing import Any, Iterator, Sequence
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold
+from app.models import Expense, IncomeStream, User
+from app.schemas import CalendarEventOut
+from app.services.due_dates import ExpenseScheduleRow, IterExpenseOccurrences
+from app.services.frequencies import GetFrequency
+from app.services.schedules import IterOccurrences
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+CalendarEvent = tuple[date, str, int, str, Decimal]
+# Starlette runs each next() of a sync body iterator on the threadpool, so events are
+# serialized this many at a time rather than one per hop.
+CALENDAR_CHUNK_EVENTS = 500
+_CALENDAR_EVENTS = TypeAdapter(list[CalendarEventOut])
+
+
+def _IsSchedulable(frequency: str) -> bool:
+    compiled = GetFrequency(frequency)
+    return compiled is not None and compiled.IsSchedulable
+
+
+def _IterSourceEvents(
+    kind: str, source_id: int, label: str, amount: Decimal, occurrences: Iterator[date]
+) -> Iterator[CalendarEvent]:
+    for occurrence in occurrences:
+        yield occurrence, kind, source_id, label, amount
+
+
+def _CalendarEventKey(event: CalendarEvent) -> tuple[date, str, int]:
+    return event[:3]
+
+
+def _IterCalendarEvents(
+    streams: Sequence[Any],
+    expenses: Sequence[ExpenseScheduleRow],
+    range_start: date,
+    range_end: date,
+) -> Iterator[CalendarEvent]:
+    sources = [
+        _IterSourceEvents(
+            "Income",
+            stream.Id,
+            stream.Label,
+            stream.NetAmount,
+            IterOccurrences(stream.FirstPayDate, stream.Frequency, range_start, range_end, stream.EndDate),
+        )
+        for stream in streams
+        if _IsSchedulable(stream.Frequency)
+    ]
+    # Expenses go through the due-date engine so Cadence, Interval and DayOfMonth apply exactly
+    # as they do for /expenses/upcoming and projections.
+    sources.extend(
+        _IterSourceEvents(
+            "Expense",
+            expense.Id,
+            expense.Label,
+            expense.Amount,
+            IterExpenseOccurrences(expense, range_start, range_end, range_start),
+        )
+        for expense in expenses
+    )
+    # Each source is already in date order, so merging keeps one pending event per source
+    # in memory. Ordered by date, then kind, then source id.
+    return heapq.merge(*sources, key=_CalendarEventKey)
+
+
+def _IterCalendarJson(events: Iterator[CalendarEvent]) -> Iterator[bytes]:
+    yield b"["
+    separator = b""
+    while chunk := list(islice(events, CALENDAR_CHUNK_EVENTS)):
+        body = _CALENDAR_EVENTS.dump_json(
+            [
+                CalendarEventOut(Date=event_date, Kind=kind, SourceId=source_id, Label=label, Amount=amount)
+                for event_date, kind, source_id, label, amount in chunk
+            ]
+        )
+        yield separator + body[1:-1]
+        separator = b","
+    yield b"]"
+
+
+@router.get("", response_model=list[CalendarEventOut])
+async def GetCalendar(
+    range_start: date = Query(alias="from"),
+    range_end: date = Query(alias="to"),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+) -> StreamingResponse:
+    RequireCanReadHousehold(user.HouseholdId, user)
+    if range_end < range_start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid date range")
+    if (range_end - range_start).days >= settings.CalendarMaxRangeDays:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Date range is limited to {settings.CalendarMaxRangeDays} days",
+        )
+
+    # Rows are read up front because the session closes before the body is streamed.
+    streams = (
+        await db.execute(
+            select(
+                IncomeStream.Id,
+                IncomeStream.Label,
+                IncomeStream.NetAmount,
+                IncomeStream.FirstPayDate,
+                IncomeStream.Frequency,
+                IncomeStream.EndDate,
+            )
+            .where(IncomeStream.HouseholdId == user.HouseholdId)
+        )
+    ).all()
+    expense_rows = (
+        await db.execute(
+            select(
+                Expense.Id,
+                Expense.Label,
+                Expense.Amount,
+                Expense.Frequency,
+                Expense.NextDueDate,
+                Expense.Cadence,
+                Expense.Interval,
+                Expense.Month,
+                Expense.DayOfMonth,
+                Expense.Enabled,
+            )
+            .where(Expense.HouseholdId == user.HouseholdId, Expense.Enabled.is_(True))
+        )
+    ).all()
+    expenses = [
+        ExpenseScheduleRow(
+            Id=row.Id,
+            Label=row.Label,
+            Amount=row.Amount,
+            Frequency=row.Frequency,
+            NextDueDate=row.NextDueDate,
+            Cadence=row.Cadence,
+            Interval=row.Interval,
+            Month=row.Month,
+            DayOfMonth=row.DayOfMonth,
+            Enabled=row.Enabled,
+        )
+        for row in expense_rows
+    ]
+    return StreamingResponse(
+        _IterCalendarJson(_IterCalendarEvents(streams, expenses, range_start, range_end)),
+        media_type="application/json",
+    )
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold, RequireCanWriteHousehold
 from app.models import Expense, ExpenseAccount, User
@@ -9,17 +10,18 @@ router = APIRouter(prefix="/expense-accounts", tags=["expense-accounts"])
 
 
 @router.get("", response_model=list[ExpenseAccountOut])
-def ListExpenseAccounts(
-    db: Session = Depends(GetDb),
+async def ListExpenseAccounts(
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> list[ExpenseAccountOut]:
     RequireCanReadHousehold(user.HouseholdId, user)
     accounts = (
-        db.query(ExpenseAccount)
-        .filter(ExpenseAccount.HouseholdId == user.HouseholdId)
-        .order_by(ExpenseAccount.Name.asc())
-        .all()
-    )
+        await db.scalars(
+            select(ExpenseAccount)
+            .where(ExpenseAccount.HouseholdId == user.HouseholdId)
+            .order_by(ExpenseAccount.Name.asc())
+        )
+    ).all()
     return [
         ExpenseAccountOut(
             Id=account.Id,
@@ -34,9 +36,9 @@ def ListExpenseAccounts(
 
 
 @router.post("", response_model=ExpenseAccountOut, status_code=status.HTTP_201_CREATED)
-def CreateExpenseAccount(
+async def CreateExpenseAccount(
     payload: ExpenseAccountCreate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> ExpenseAccountOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
@@ -47,8 +49,8 @@ def CreateExpenseAccount(
         Enabled=payload.Enabled,
     )
     db.add(account)
-    db.commit()
-    db.refresh(account)
+    await db.commit()
+    await db.refresh(account)
     return ExpenseAccountOut(
         Id=account.Id,
         HouseholdId=account.HouseholdId,
@@ -60,17 +62,17 @@ def CreateExpenseAccount(
 
 
 @router.put("/{account_id}", response_model=ExpenseAccountOut)
-def UpdateExpenseAccount(
+async def UpdateExpenseAccount(
     account_id: int,
     payload: ExpenseAccountUpdate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> ExpenseAccountOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    account = (
-        db.query(ExpenseAccount)
-        .filter(ExpenseAccount.Id == account_id, ExpenseAccount.HouseholdId == user.HouseholdId)
-        .first()
+    account = await db.scalar(
+        select(ExpenseAccount)
+        .where(ExpenseAccount.Id == account_id, ExpenseAccount.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not account:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
@@ -79,12 +81,14 @@ def UpdateExpenseAccount(
     account.Name = payload.Name
     account.Enabled = payload.Enabled
     if old_name != payload.Name:
-        db.query(Expense).filter(
-            Expense.HouseholdId == user.HouseholdId, Expense.Account == old_name
-        ).update({Expense.Account: payload.Name})
+        await db.execute(
+            update(Expense)
+            .where(Expense.HouseholdId == user.HouseholdId, Expense.Account == old_name)
+            .values({Expense.Account: payload.Name})
+        )
     db.add(account)
-    db.commit()
-    db.refresh(account)
+    await db.commit()
+    await db.refresh(account)
     return ExpenseAccountOut(
         Id=account.Id,
         HouseholdId=account.HouseholdId,
@@ -96,28 +100,28 @@ def UpdateExpenseAccount(
 
 
 @router.delete("/{account_id}", status_code=status.HTTP_204_NO_CONTENT)
-def DeleteExpenseAccount(
+async def DeleteExpenseAccount(
     account_id: int,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> None:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    account = (
-        db.query(ExpenseAccount)
-        .filter(ExpenseAccount.Id == account_id, ExpenseAccount.HouseholdId == user.HouseholdId)
-        .first()
+    account = await db.scalar(
+        select(ExpenseAccount)
+        .where(ExpenseAccount.Id == account_id, ExpenseAccount.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not account:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
-    in_use = (
-        db.query(Expense)
-        .filter(Expense.HouseholdId == user.HouseholdId, Expense.Account == account.Name)
-        .first()
+    in_use = await db.scalar(
+        select(Expense)
+        .where(Expense.HouseholdId == user.HouseholdId, Expense.Account == account.Name)
+        .limit(1)
     )
     if in_use:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Account is used by an expense",
         )
-    db.delete(account)
-    db.commit()
+    await db.delete(account)
+    await db.commit()
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold, RequireCanWriteHousehold
 from app.models import Expense, ExpenseType, User
@@ -9,17 +10,18 @@ router = APIRouter(prefix="/expense-types", tags=["expense-types"])
 
 
 @router.get("", response_model=list[ExpenseTypeOut])
-def ListExpenseTypes(
-    db: Session = Depends(GetDb),
+async def ListExpenseTypes(
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> list[ExpenseTypeOut]:
     RequireCanReadHousehold(user.HouseholdId, user)
     types = (
-        db.query(ExpenseType)
-        .filter(ExpenseType.HouseholdId == user.HouseholdId)
-        .order_by(ExpenseType.Name.asc())
-        .all()
-    )
+        await db.scalars(
+            select(ExpenseType)
+            .where(ExpenseType.HouseholdId == user.HouseholdId)
+            .order_by(ExpenseType.Name.asc())
+        )
+    ).all()
     return [
         ExpenseTypeOut(
             Id=entry.Id,
@@ -34,9 +36,9 @@ def ListExpenseTypes(
 
 
 @router.post("", response_model=ExpenseTypeOut, status_code=status.HTTP_201_CREATED)
-def CreateExpenseType(
+async def CreateExpenseType(
     payload: ExpenseTypeCreate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> ExpenseTypeOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
@@ -47,8 +49,8 @@ def CreateExpenseType(
         Enabled=payload.Enabled,
     )
     db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    await db.commit()
+    await db.refresh(entry)
     return ExpenseTypeOut(
         Id=entry.Id,
         HouseholdId=entry.HouseholdId,
@@ -60,17 +62,17 @@ def CreateExpenseType(
 
 
 @router.put("/{type_id}", response_model=ExpenseTypeOut)
-def UpdateExpenseType(
+async def UpdateExpenseType(
     type_id: int,
     payload: ExpenseTypeUpdate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> ExpenseTypeOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    entry = (
-        db.query(ExpenseType)
-        .filter(ExpenseType.Id == type_id, ExpenseType.HouseholdId == user.HouseholdId)
-        .first()
+    entry = await db.scalar(
+        select(ExpenseType)
+        .where(ExpenseType.Id == type_id, ExpenseType.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Type not found")
@@ -79,12 +81,14 @@ def UpdateExpenseType(
     entry.Name = payload.Name
     entry.Enabled = payload.Enabled
     if old_name != payload.Name:
-        db.query(Expense).filter(
-            Expense.HouseholdId == user.HouseholdId, Expense.Type == old_name
-        ).update({Expense.Type: payload.Name})
+        await db.execute(
+            update(Expense)
+            .where(Expense.HouseholdId == user.HouseholdId, Expense.Type == old_name)
+            .values({Expense.Type: payload.Name})
+        )
     db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    await db.commit()
+    await db.refresh(entry)
     return ExpenseTypeOut(
         Id=entry.Id,
         HouseholdId=entry.HouseholdId,
@@ -96,28 +100,28 @@ def UpdateExpenseType(
 
 
 @router.delete("/{type_id}", status_code=status.HTTP_204_NO_CONTENT)
-def DeleteExpenseType(
+async def DeleteExpenseType(
     type_id: int,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> None:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    entry = (
-        db.query(ExpenseType)
-        .filter(ExpenseType.Id == type_id, ExpenseType.HouseholdId == user.HouseholdId)
-        .first()
+    entry = await db.scalar(
+        select(ExpenseType)
+        .where(ExpenseType.Id == type_id, ExpenseType.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Type not found")
-    in_use = (
-        db.query(Expense)
-        .filter(Expense.HouseholdId == user.HouseholdId, Expense.Type == entry.Name)
-        .first()
+    in_use = await db.scalar(
+        select(Expense)
+        .where(Expense.HouseholdId == user.HouseholdId, Expense.Type == entry.Name)
+        .limit(1)
     )
     if in_use:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Type is used by an expense",
         )
-    db.delete(entry)
-    db.commit()
+    await db.delete(entry)
+    await db.commit()
@@ -1,78 +1,167 @@
-from datetime import date
+from datetime import timedelta
+import itertools
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
-from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold, RequireCanWriteHousehold
+from app.deps import (
+    GetDb,
+    GetReadDb,
+    GetFiscalContext,
+    RequireAuthenticated,
+    RequireCanReadHousehold,
+    RequireCanWriteHousehold,
+)
 from app.models import Expense, User
-from app.schemas import ExpenseCreate, ExpenseOrderUpdate, ExpenseOut, ExpenseUpdate
-from app.services.schedules import AnnualizedBreakdown, FinancialYearRange
+from app.schemas import (
+    ExpenseBulkDelete,
+    ExpenseBulkUpdate,
+    ExpenseCreate,
+    ExpenseMove,
+    ExpenseOrderUpdate,
+    ExpenseOut,
+    ExpenseUpdate,
+    ImportResultOut,
+    UpcomingExpenseOut,
+)
+from app.services.due_dates import (
+    INDEX_HORIZON_DAYS,
+    ComputeExpenseDueDates,
+    ExpenseScheduleRow,
+    GetDueDateIndex,
+    InvalidateDueDateIndex,
+)
+from app.services.imports import (
+    ImportFormatError,
+    ImportFormatFor,
+    ImportResultOutFor,
+    ImportRows,
+    IterImportRecords,
+)
+from app.services.ordering import (
+    RANK_GAP,
+    NextExpenseRank,
+    RankBetween,
+    RenormalizeExpenseRanks,
+    WriteExpenseRanks,
+)
+from app.services.schedules import BatchAnnualizedBreakdown, FiscalContext, FrequencyColumnsFor
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 
+# Columns a bulk patch may not set to null.
+_REQUIRED_BULK_FIELDS = ("Label", "Amount", "Frequency", "Enabled")
 
-def _BuildExpenseOut(expense: Expense) -> ExpenseOut:
-    today = date.today()
-    fy_start, fy_end = FinancialYearRange(
-        today, settings.FinancialYearStartMonth, settings.FinancialYearStartDay
-    )
-    breakdown = AnnualizedBreakdown(expense.Amount, expense.Frequency, fy_start, fy_end)
-    return ExpenseOut(
+
+def _ScheduleRow(expense: Expense) -> ExpenseScheduleRow:
+    return ExpenseScheduleRow(
         Id=expense.Id,
-        HouseholdId=expense.HouseholdId,
-        OwnerUserId=expense.OwnerUserId,
         Label=expense.Label,
         Amount=expense.Amount,
         Frequency=expense.Frequency,
-        Account=expense.Account,
-        Type=expense.Type,
         NextDueDate=expense.NextDueDate,
         Cadence=expense.Cadence,
         Interval=expense.Interval,
         Month=expense.Month,
         DayOfMonth=expense.DayOfMonth,
         Enabled=expense.Enabled,
-        Notes=expense.Notes,
-        DisplayOrder=expense.DisplayOrder,
-        CreatedAt=expense.CreatedAt,
-        PerDay=breakdown["PerDay"],
-        PerWeek=breakdown["PerWeek"],
-        PerFortnight=breakdown["PerFortnight"],
-        PerMonth=breakdown["PerMonth"],
-        PerYear=breakdown["PerYear"],
     )
 
 
+def _BuildExpenseOuts(expenses: list[Expense], fiscal: FiscalContext) -> list[ExpenseOut]:
+    due_dates = ComputeExpenseDueDates([_ScheduleRow(expense) for expense in expenses], fiscal.Today)
+    breakdown = BatchAnnualizedBreakdown(
+        [expense.Amount for expense in expenses],
+        FrequencyColumnsFor(due_dates.Frequencies),
+        fiscal.StartDate,
+        fiscal.EndDate,
+    )
+    upcoming = due_dates.NextDueDates.tolist()
+    return [
+        ExpenseOut(
+            Id=expense.Id,
+            HouseholdId=expense.HouseholdId,
+            OwnerUserId=expense.OwnerUserId,
+            Label=expense.Label,
+            Amount=expense.Amount,
+            Frequency=expense.Frequency,
+            Account=expense.Account,
+            Type=expense.Type,
+            NextDueDate=expense.NextDueDate,
+            Cadence=expense.Cadence,
+            Interval=expense.Interval,
+            Month=expense.Month,
+            DayOfMonth=expense.DayOfMonth,
+            Enabled=expense.Enabled,
+            Notes=expense.Notes,
+            DisplayOrder=expense.DisplayOrder,
+            CreatedAt=expense.CreatedAt,
+            UpcomingDueDate=upcoming[index],
+            PerDay=breakdown["PerDay"][index],
+            PerWeek=breakdown["PerWeek"][index],
+            PerFortnight=breakdown["PerFortnight"][index],
+            PerMonth=breakdown["PerMonth"][index],
+            PerYear=breakdown["PerYear"][index],
+        )
+        for index, expense in enumerate(expenses)
+    ]
+
+
+def _BuildExpenseOut(expense: Expense, fiscal: FiscalContext) -> ExpenseOut:
+    return _BuildExpenseOuts([expense], fiscal)[0]
+
+
 @router.get("", response_model=list[ExpenseOut])
-def ListExpenses(
-    db: Session = Depends(GetDb),
+async def ListExpenses(
+    db: AsyncSession = Depends(GetReadDb),
     user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
 ) -> list[ExpenseOut]:
     RequireCanReadHousehold(user.HouseholdId, user)
     expenses = (
-        db.query(Expense)
-        .filter(Expense.HouseholdId == user.HouseholdId)
-        .order_by(Expense.DisplayOrder.asc(), Expense.CreatedAt.desc())
-        .all()
-    )
-    return [_BuildExpenseOut(expense) for expense in expenses]
+        await db.scalars(
+            select(Expense)
+            .where(Expense.HouseholdId == user.HouseholdId)
+            .order_by(Expense.DisplayOrder.asc(), Expense.CreatedAt.desc())
+        )
+    ).all()
+    return _BuildExpenseOuts(expenses, fiscal)
+
+
+@router.get("/upcoming", response_model=list[UpcomingExpenseOut])
+async def ListUpcomingExpenses(
+    days: int = Query(14, ge=0, le=INDEX_HORIZON_DAYS),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
+) -> list[UpcomingExpenseOut]:
+    RequireCanReadHousehold(user.HouseholdId, user)
+
+    async def LoadRows() -> list[ExpenseScheduleRow]:
+        expenses = await db.scalars(select(Expense).where(Expense.HouseholdId == user.HouseholdId))
+        return [_ScheduleRow(expense) for expense in expenses]
+
+    index = await GetDueDateIndex(user.HouseholdId, fiscal.Today, LoadRows)
+    return [
+        UpcomingExpenseOut(
+            ExpenseId=row.Id,
+            Label=row.Label,
+            DueDate=due_date,
+            Amount=row.Amount,
+        )
+        for due_date, row in index.Between(fiscal.Today, fiscal.Today + timedelta(days=days))
+    ]
 
 
 @router.post("", response_model=ExpenseOut, status_code=status.HTTP_201_CREATED)
-def CreateExpense(
+async def CreateExpense(
     payload: ExpenseCreate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
 ) -> ExpenseOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    max_order = (
-        db.query(func.max(Expense.DisplayOrder))
-        .filter(Expense.HouseholdId == user.HouseholdId)
-        .scalar()
-    )
-    next_order = (max_order or 0) + 1
     expense = Expense(
         HouseholdId=user.HouseholdId,
         OwnerUserId=user.Id,
@@ -88,26 +177,203 @@ def CreateExpense(
         DayOfMonth=payload.DayOfMonth,
         Enabled=payload.Enabled,
         Notes=payload.Notes,
-        DisplayOrder=next_order,
+        DisplayOrder=NextExpenseRank(user.HouseholdId),
     )
     db.add(expense)
-    db.commit()
-    db.refresh(expense)
-    return _BuildExpenseOut(expense)
+    await db.commit()
+    await db.refresh(expense)
+    InvalidateDueDateIndex(user.HouseholdId)
+    return _BuildExpenseOut(expense, fiscal)
+
+
+@router.post("/import", response_model=ImportResultOut)
+async def ImportExpenses(
+    request: Request,
+    atomic: bool = Query(False),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+) -> ImportResultOut:
+    RequireCanWriteHousehold(user.HouseholdId, user)
+    try:
+        import_format = ImportFormatFor(request.headers.get("content-type"))
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(exc)) from exc
+    max_order = await db.scalar(
+        select(func.max(Expense.DisplayOrder)).where(Expense.HouseholdId == user.HouseholdId)
+    )
+    display_orders = itertools.count((max_order or 0) + RANK_GAP, RANK_GAP)
+
+    def ToRow(payload: ExpenseCreate) -> dict:
+        return {
+            **payload.model_dump(),
+            "HouseholdId": user.HouseholdId,
+            "OwnerUserId": user.Id,
+            "DisplayOrder": next(display_orders),
+        }
+
+    result = await ImportRows(
+        db,
+        IterImportRecords(request.stream(), import_format),
+        ExpenseCreate,
+        Expense,
+        ToRow,
+        atomic,
+    )
+    if result.Imported:
+        InvalidateDueDateIndex(user.HouseholdId)
+    return ImportResultOutFor(result)
+
+
+@router.put("/order", status_code=status.HTTP_204_NO_CONTENT)
+async def UpdateExpenseOrder(
+    payload: ExpenseOrderUpdate,
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+) -> None:
+    RequireCanWriteHousehold(user.HouseholdId, user)
+    expense_ids = (
+        await db.scalars(
+            select(Expense.Id)
+            .where(Expense.HouseholdId == user.HouseholdId, Expense.Id.in_(payload.OrderedIds))
+        )
+    ).all()
+    if len(expense_ids) != len(payload.OrderedIds):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid expense order")
+    await WriteExpenseRanks(db, payload.OrderedIds)
+    await db.commit()
+
+
+async def _MoveBounds(
+    db: AsyncSession, household_id: int, expense_id: int, payload: ExpenseMove
+) -> tuple[int | None, int | None]:
+    neighbour_ids = [neighbour_id for neighbour_id in (payload.AfterId, payload.BeforeId) if neighbour_id is not None]
+    ranks = dict(
+        (
+            await db.execute(
+                select(Expense.Id, Expense.DisplayOrder)
+                .where(Expense.HouseholdId == household_id, Expense.Id.in_(neighbour_ids))
+            )
+        ).all()
+    )
+    if len(ranks) != len(neighbour_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
+    lower = ranks.get(payload.AfterId)
+    upper = ranks.get(payload.BeforeId)
+    # With one neighbour given, the other bound is whichever expense sits next to it.
+    others = (Expense.HouseholdId == household_id, Expense.Id != expense_id)
+    if upper is None:
+        upper = await db.scalar(select(func.min(Expense.DisplayOrder)).where(*others, Expense.DisplayOrder > lower))
+    elif lower is None:
+        lower = await db.scalar(select(func.max(Expense.DisplayOrder)).where(*others, Expense.DisplayOrder < upper))
+    return lower, upper
+
+
+@router.put("/{expense_id}/move", response_model=ExpenseOut)
+async def MoveExpense(
+    expense_id: int,
+    payload: ExpenseMove,
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
+) -> ExpenseOut:
+    RequireCanWriteHousehold(user.HouseholdId, user)
+    if payload.AfterId is None and payload.BeforeId is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="AfterId or BeforeId is required")
+    if expense_id in (payload.AfterId, payload.BeforeId):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid expense order")
+    expense = await db.scalar(
+        select(Expense)
+        .where(Expense.Id == expense_id, Expense.HouseholdId == user.HouseholdId)
+        .limit(1)
+    )
+    if not expense:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
+
+    lower, upper = await _MoveBounds(db, user.HouseholdId, expense_id, payload)
+    if lower is not None and upper is not None and lower > upper:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid expense order")
+    rank = RankBetween(lower, upper)
+    if rank is None:
+        # The gap is used up (or tied legacy ranks): renumber once, then the midpoint is free.
+        await RenormalizeExpenseRanks(db, user.HouseholdId)
+        await db.refresh(expense, ["DisplayOrder"])
+        rank = RankBetween(*await _MoveBounds(db, user.HouseholdId, expense_id, payload))
+        if rank is None:
+            # Tied neighbours can come out of the renumbering in the opposite order to the one
+            # the client saw; it has to reload the list and drop again.
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Expense order has changed")
+    expense.DisplayOrder = rank
+    await db.commit()
+    return _BuildExpenseOut(expense, fiscal)
+
+
+@router.patch("/bulk", response_model=list[ExpenseOut])
+async def BulkUpdateExpenses(
+    payload: ExpenseBulkUpdate,
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
+) -> list[ExpenseOut]:
+    RequireCanWriteHousehold(user.HouseholdId, user)
+    changes = payload.Fields.model_dump(exclude_unset=True)
+    if not changes:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update")
+    for name in _REQUIRED_BULK_FIELDS:
+        if name in changes and changes[name] is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{name} cannot be null")
+    expense_ids = set(payload.Ids)
+    expenses = (
+        await db.scalars(
+            update(Expense)
+            .where(Expense.HouseholdId == user.HouseholdId, Expense.Id.in_(expense_ids))
+            .values(**changes)
+            .returning(Expense)
+        )
+    ).all()
+    # All or nothing: an id from another household, or one that no longer exists, fails the batch.
+    if len(expenses) != len(expense_ids):
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
+    await db.commit()
+    InvalidateDueDateIndex(user.HouseholdId)
+    expenses = sorted(expenses, key=lambda expense: (expense.DisplayOrder, -expense.Id))
+    return _BuildExpenseOuts(expenses, fiscal)
+
+
+@router.delete("/bulk", status_code=status.HTTP_204_NO_CONTENT)
+async def BulkDeleteExpenses(
+    payload: ExpenseBulkDelete,
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+) -> None:
+    RequireCanWriteHousehold(user.HouseholdId, user)
+    expense_ids = set(payload.Ids)
+    result = await db.execute(
+        delete(Expense)
+        .where(Expense.HouseholdId == user.HouseholdId, Expense.Id.in_(expense_ids))
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(expense_ids):
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
+    await db.commit()
+    InvalidateDueDateIndex(user.HouseholdId)
 
 
 @router.put("/{expense_id}", response_model=ExpenseOut)
-def UpdateExpense(
+async def UpdateExpense(
     expense_id: int,
     payload: ExpenseUpdate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
 ) -> ExpenseOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    expense = (
-        db.query(Expense)
-        .filter(Expense.Id == expense_id, Expense.HouseholdId == user.HouseholdId)
-        .first()
+    expense = await db.scalar(
+        select(Expense)
+        .where(Expense.Id == expense_id, Expense.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not expense:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
@@ -125,44 +391,26 @@ def UpdateExpense(
     expense.Enabled = payload.Enabled
     expense.Notes = payload.Notes
     db.add(expense)
-    db.commit()
-    db.refresh(expense)
-    return _BuildExpenseOut(expense)
-
-
-@router.put("/order", status_code=status.HTTP_204_NO_CONTENT)
-def UpdateExpenseOrder(
-    payload: ExpenseOrderUpdate,
-    db: Session = Depends(GetDb),
-    user: User = Depends(RequireAuthenticated),
-) -> None:
-    RequireCanWriteHousehold(user.HouseholdId, user)
-    expenses = (
-        db.query(Expense)
-        .filter(Expense.HouseholdId == user.HouseholdId, Expense.Id.in_(payload.OrderedIds))
-        .all()
-    )
-    if len(expenses) != len(payload.OrderedIds):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid expense order")
-    order_map = {expense_id: index + 1 for index, expense_id in enumerate(payload.OrderedIds)}
-    for expense in expenses:
-        expense.DisplayOrder = order_map[expense.Id]
-    db.commit()
+    await db.commit()
+    await db.refresh(expense)
+    InvalidateDueDateIndex(user.HouseholdId)
+    return _BuildExpenseOut(expense, fiscal)
 
 
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
-def DeleteExpense(
+async def DeleteExpense(
     expense_id: int,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> None:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    expense = (
-        db.query(Expense)
-        .filter(Expense.Id == expense_id, Expense.HouseholdId == user.HouseholdId)
-        .first()
+    expense = await db.scalar(
+        select(Expense)
+        .where(Expense.Id == expense_id, Expense.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not expense:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
-    db.delete(expense)
-    db.commit()
+    await db.delete(expense)
+    await db.commit()
+    InvalidateDueDateIndex(user.HouseholdId)
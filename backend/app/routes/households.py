@@ -0,0 +1,206 @@
+from datetime import date
+from decimal import Decimal
+
+from fastapi import APIRouter, Depends, Query
+import numpy as np
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.deps import GetDb, GetFiscalContext, RequireAuthenticated, RequireCanReadHousehold
+from app.models import IncomeStream, User
+from app.schemas import (
+    HouseholdIncomeTimelineOut,
+    HouseholdTaxMemberOut,
+    HouseholdTaxSummaryOut,
+    IncomeTimelineMemberOut,
+    IncomeTimelineYearOut,
+    TaxCalculatorRequest,
+)
+from app.services.frequencies import GetFrequency
+from app.services.income_timeline import BuildIncomeTimeline, FinancialYearStarts, IncomeTimelineItems
+from app.services.money import FromCents, ToCents
+from app.services.schedules import FiscalContext, FrequencyColumnsFor
+from app.services.tax_calculator import AnnualizeIncome, EstimateTaxBatch
+from app.services.tax_data import GetTaxYearForDate
+
+router = APIRouter(prefix="/households", tags=["households"])
+
+
+@router.get("/tax-summary", response_model=HouseholdTaxSummaryOut)
+async def GetHouseholdTaxSummary(
+    private_health: bool = Query(False, alias="privateHealth"),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
+) -> HouseholdTaxSummaryOut:
+    RequireCanReadHousehold(user.HouseholdId, user)
+    tax_year = GetTaxYearForDate(fiscal.Today)
+
+    # One row per (member, frequency): amounts sharing a frequency annualise linearly, so they
+    # are summed in SQL. Members without streams still come back through the outer join.
+    rows = (
+        await db.execute(
+            select(
+                User.Id,
+                User.Email,
+                IncomeStream.Frequency,
+                func.count(IncomeStream.Id),
+                func.sum(IncomeStream.GrossAmount),
+            )
+            .outerjoin(
+                IncomeStream,
+                and_(
+                    IncomeStream.OwnerUserId == User.Id,
+                    IncomeStream.HouseholdId == User.HouseholdId,
+                    or_(IncomeStream.EndDate.is_(None), IncomeStream.EndDate >= fiscal.StartDate),
+                ),
+            )
+            .where(User.HouseholdId == user.HouseholdId)
+            .group_by(User.Id, User.Email, IncomeStream.Frequency)
+            .order_by(User.Id)
+        )
+    ).all()
+
+    members: dict[int, tuple[str, int, Decimal]] = {}
+    for user_id, email, frequency, stream_count, gross_total in rows:
+        _, count, annual = members.get(user_id, (email, 0, Decimal("0")))
+        if frequency is not None:
+            count += stream_count
+            # SQLite sums Numeric columns as floats; the inputs are whole cents, so snap back.
+            gross_total = Decimal(str(gross_total)).quantize(Decimal("0.01"))
+            annual += AnnualizeIncome(gross_total, frequency)
+        members[user_id] = (email, count, annual)
+
+    estimates = EstimateTaxBatch(
+        TaxCalculatorRequest(
+            SalaryAmount=annual,
+            SalaryFrequency="Yearly",
+            IncludesSuper=False,
+            PrivateHealth=private_health,
+            TaxYear=tax_year.Label,
+        )
+        for _, _, annual in members.values()
+    )
+    member_outs = [
+        HouseholdTaxMemberOut(
+            UserId=user_id,
+            Email=email,
+            StreamCount=count,
+            GrossAnnual=estimate.GrossAnnual,
+            Estimate=estimate,
+        )
+        for (user_id, (email, count, _)), estimate in zip(members.items(), estimates)
+    ]
+    return HouseholdTaxSummaryOut(
+        HouseholdId=user.HouseholdId,
+        TaxYear=tax_year.Label,
+        IsEstimated=tax_year.IsEstimated,
+        GrossAnnual=sum((member.Estimate.GrossAnnual for member in member_outs), Decimal("0.00")),
+        IncomeTaxAnnual=sum((member.Estimate.IncomeTaxAnnual for member in member_outs), Decimal("0.00")),
+        MedicareAnnual=sum((member.Estimate.MedicareAnnual for member in member_outs), Decimal("0.00")),
+        MlsAnnual=sum((member.Estimate.MlsAnnual for member in member_outs), Decimal("0.00")),
+        NetAnnual=sum((member.Estimate.NetAnnual for member in member_outs), Decimal("0.00")),
+        Members=member_outs,
+    )
+
+
+async def _LoadIncomeTimelineItems(db: AsyncSession, household_id: int) -> IncomeTimelineItems:
+    streams = (
+        await db.execute(
+            select(
+                IncomeStream.OwnerUserId,
+                IncomeStream.GrossAmount,
+                IncomeStream.FirstPayDate,
+                IncomeStream.Frequency,
+                IncomeStream.EndDate,
+            )
+            .where(IncomeStream.HouseholdId == household_id)
+        )
+    ).all()
+    frequencies = [GetFrequency(stream.Frequency) for stream in streams]
+    work_unit = [frequency is not None and frequency.WorkUnit is not None for frequency in frequencies]
+    return IncomeTimelineItems(
+        OwnerIds=np.array([stream.OwnerUserId for stream in streams], dtype=np.int64),
+        FirstDates=np.array([stream.FirstPayDate for stream in streams], dtype="datetime64[D]"),
+        Frequencies=FrequencyColumnsFor(frequencies),
+        EndDates=np.array([stream.EndDate for stream in streams], dtype="datetime64[D]"),
+        AmountCents=np.array([ToCents(stream.GrossAmount) for stream in streams], dtype=np.int64),
+        WorkUnit=np.array(work_unit, dtype=bool),
+        AnnualCents=np.array(
+            [
+                ToCents(AnnualizeIncome(stream.GrossAmount, stream.Frequency)) if is_work else 0
+                for stream, is_work in zip(streams, work_unit)
+            ],
+            dtype=np.int64,
+        ),
+    )
+
+
+@router.get("/tax-timeline", response_model=HouseholdIncomeTimelineOut)
+async def GetHouseholdTaxTimeline(
+    years: int = Query(3, ge=1, le=10),
+    private_health: bool = Query(False, alias="privateHealth"),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
+) -> HouseholdIncomeTimelineOut:
+    RequireCanReadHousehold(user.HouseholdId, user)
+    members = (
+        await db.execute(
+            select(User.Id, User.Email)
+            .where(User.HouseholdId == user.HouseholdId)
+            .order_by(User.Id)
+        )
+    ).all()
+    timeline = await run_in_threadpool(
+        BuildIncomeTimeline,
+        await _LoadIncomeTimelineItems(db, user.HouseholdId),
+        FinancialYearStarts(fiscal.StartDate, years),
+    )
+    owner_rows = {owner_id: row for row, owner_id in enumerate(timeline.OwnerIds.tolist())}
+    year_starts: list[date] = timeline.YearStarts.tolist()
+    year_ends: list[date] = timeline.YearEnds.tolist()
+    # Each financial year is taxed with the brackets of the tax year it falls in; years past the
+    # published tables reuse the latest one and are flagged as estimated.
+    tax_years = [GetTaxYearForDate(start) for start in year_starts]
+
+    requests = [
+        TaxCalculatorRequest(
+            SalaryAmount=FromCents(
+                int(timeline.GrossCents[owner_rows[member.Id], year]) if member.Id in owner_rows else 0
+            ),
+            SalaryFrequency="Yearly",
+            IncludesSuper=False,
+            PrivateHealth=private_health,
+            TaxYear=tax_year.Label,
+        )
+        for year, tax_year in enumerate(tax_years)
+        for member in members
+    ]
+    estimates = await run_in_threadpool(list, EstimateTaxBatch(requests))
+
+    year_outs = []
+    for year, (start, end, tax_year) in enumerate(zip(year_starts, year_ends, tax_years)):
+        year_estimates = estimates[year * len(members) : (year + 1) * len(members)]
+        year_outs.append(
+            IncomeTimelineYearOut(
+                StartDate=start,
+                EndDate=end,
+                TaxYear=tax_year.Label,
+                IsEstimated=tax_year.IsEstimated or not tax_year.StartDate <= start <= tax_year.EndDate,
+                GrossAnnual=sum((estimate.GrossAnnual for estimate in year_estimates), Decimal("0.00")),
+                IncomeTaxAnnual=sum((estimate.IncomeTaxAnnual for estimate in year_estimates), Decimal("0.00")),
+                NetAnnual=sum((estimate.NetAnnual for estimate in year_estimates), Decimal("0.00")),
+                Members=[
+                    IncomeTimelineMemberOut(
+                        UserId=member.Id,
+                        Email=member.Email,
+                        GrossAnnual=estimate.GrossAnnual,
+                        Estimate=estimate,
+                    )
+                    for member, estimate in zip(members, year_estimates)
+                ],
+            )
+        )
+    return HouseholdIncomeTimelineOut(HouseholdId=user.HouseholdId, Years=year_outs)
@@ -1,76 +1,110 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold, RequireCanWriteHousehold
-from app.core.config import settings
+from app.deps import (
+    GetDb,
+    GetReadDb,
+    GetFiscalContext,
+    RequireAuthenticated,
+    RequireCanReadHousehold,
+    RequireCanWriteHousehold,
+)
 from app.models import IncomeStream, User
-from app.schemas import IncomeStreamCreate, IncomeStreamOut, IncomeStreamUpdate
-from app.services.schedules import FinancialYearRange, LastNextOccurrence, AnnualizedBreakdown
-from datetime import date
+from app.schemas import ImportResultOut, IncomeStreamCreate, IncomeStreamOut, IncomeStreamUpdate
+from app.services.imports import (
+    ImportFormatError,
+    ImportFormatFor,
+    ImportResultOutFor,
+    ImportRows,
+    IterImportRecords,
+)
+from app.services.schedules import (
+    BatchAnnualizedBreakdown,
+    BatchLastNextOccurrence,
+    CompileFrequencies,
+    FiscalContext,
+)
 
 router = APIRouter(prefix="/income-streams", tags=["income-streams"])
 
 
-def _BuildIncomeStreamOut(stream: IncomeStream) -> IncomeStreamOut:
-    today = date.today()
-    fy_start, fy_end = FinancialYearRange(
-        today, settings.FinancialYearStartMonth, settings.FinancialYearStartDay
+def _BuildIncomeStreamOuts(
+    streams: list[IncomeStream], fiscal: FiscalContext
+) -> list[IncomeStreamOut]:
+    frequencies = CompileFrequencies(stream.Frequency for stream in streams)
+    last_pays, next_pays = BatchLastNextOccurrence(
+        np.array([stream.FirstPayDate for stream in streams], dtype="datetime64[D]"),
+        frequencies,
+        fiscal.Today,
+        np.array([stream.EndDate for stream in streams], dtype="datetime64[D]"),
     )
-    last_pay, next_pay = LastNextOccurrence(
-        stream.FirstPayDate,
-        stream.Frequency,
-        today,
-        stream.EndDate,
+    net_breakdown = BatchAnnualizedBreakdown(
+        [stream.NetAmount for stream in streams], frequencies, fiscal.StartDate, fiscal.EndDate
     )
-    net_breakdown = AnnualizedBreakdown(stream.NetAmount, stream.Frequency, fy_start, fy_end)
-    gross_breakdown = AnnualizedBreakdown(stream.GrossAmount, stream.Frequency, fy_start, fy_end)
-    return IncomeStreamOut(
-        Id=stream.Id,
-        HouseholdId=stream.HouseholdId,
-        OwnerUserId=stream.OwnerUserId,
-        Label=stream.Label,
-        NetAmount=stream.NetAmount,
-        GrossAmount=stream.GrossAmount,
-        FirstPayDate=stream.FirstPayDate,
-        Frequency=stream.Frequency,
-        EndDate=stream.EndDate,
-        Notes=stream.Notes,
-        CreatedAt=stream.CreatedAt,
-        LastPayDate=last_pay,
-        NextPayDate=next_pay,
-        NetPerDay=net_breakdown["PerDay"],
-        NetPerWeek=net_breakdown["PerWeek"],
-        NetPerFortnight=net_breakdown["PerFortnight"],
-        NetPerMonth=net_breakdown["PerMonth"],
-        NetPerYear=net_breakdown["PerYear"],
-        GrossPerDay=gross_breakdown["PerDay"],
-        GrossPerWeek=gross_breakdown["PerWeek"],
-        GrossPerFortnight=gross_breakdown["PerFortnight"],
-        GrossPerMonth=gross_breakdown["PerMonth"],
-        GrossPerYear=gross_breakdown["PerYear"],
+    gross_breakdown = BatchAnnualizedBreakdown(
+        [stream.GrossAmount for stream in streams], frequencies, fiscal.StartDate, fiscal.EndDate
     )
+    return [
+        IncomeStreamOut(
+            Id=stream.Id,
+            HouseholdId=stream.HouseholdId,
+            OwnerUserId=stream.OwnerUserId,
+            Label=stream.Label,
+            NetAmount=stream.NetAmount,
+            GrossAmount=stream.GrossAmount,
+            FirstPayDate=stream.FirstPayDate,
+            Frequency=stream.Frequency,
+            EndDate=stream.EndDate,
+            Notes=stream.Notes,
+            CreatedAt=stream.CreatedAt,
+            LastPayDate=last_pay,
+            NextPayDate=next_pay,
+            NetPerDay=net_breakdown["PerDay"][index],
+            NetPerWeek=net_breakdown["PerWeek"][index],
+            NetPerFortnight=net_breakdown["PerFortnight"][index],
+            NetPerMonth=net_breakdown["PerMonth"][index],
+            NetPerYear=net_breakdown["PerYear"][index],
+            GrossPerDay=gross_breakdown["PerDay"][index],
+            GrossPerWeek=gross_breakdown["PerWeek"][index],
+            GrossPerFortnight=gross_breakdown["PerFortnight"][index],
+            GrossPerMonth=gross_breakdown["PerMonth"][index],
+            GrossPerYear=gross_breakdown["PerYear"][index],
+        )
+        for index, (stream, last_pay, next_pay) in enumerate(
+            zip(streams, last_pays.tolist(), next_pays.tolist())
+        )
+    ]
+
+
+def _BuildIncomeStreamOut(stream: IncomeStream, fiscal: FiscalContext) -> IncomeStreamOut:
+    return _BuildIncomeStreamOuts([stream], fiscal)[0]
 
 
 @router.get("", response_model=list[IncomeStreamOut])
-def ListIncomeStreams(
-    db: Session = Depends(GetDb),
+async def ListIncomeStreams(
+    db: AsyncSession = Depends(GetReadDb),
     user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
 ) -> list[IncomeStreamOut]:
     RequireCanReadHousehold(user.HouseholdId, user)
     streams = (
-        db.query(IncomeStream)
-        .filter(IncomeStream.HouseholdId == user.HouseholdId)
-        .order_by(IncomeStream.CreatedAt.desc())
-        .all()
-    )
-    return [_BuildIncomeStreamOut(stream) for stream in streams]
+        await db.scalars(
+            select(IncomeStream)
+            .where(IncomeStream.HouseholdId == user.HouseholdId)
+            .order_by(IncomeStream.CreatedAt.desc())
+        )
+    ).all()
+    return _BuildIncomeStreamOuts(streams, fiscal)
 
 
 @router.post("", response_model=IncomeStreamOut, status_code=status.HTTP_201_CREATED)
-def CreateIncomeStream(
+async def CreateIncomeStream(
     payload: IncomeStreamCreate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
 ) -> IncomeStreamOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
     stream = IncomeStream(
@@ -85,23 +119,51 @@ def CreateIncomeStream(
         Notes=payload.Notes,
     )
     db.add(stream)
-    db.commit()
-    db.refresh(stream)
-    return _BuildIncomeStreamOut(stream)
+    await db.commit()
+    await db.refresh(stream)
+    return _BuildIncomeStreamOut(stream, fiscal)
+
+
+@router.post("/import", response_model=ImportResultOut)
+async def ImportIncomeStreams(
+    request: Request,
+    atomic: bool = Query(False),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+) -> ImportResultOut:
+    RequireCanWriteHousehold(user.HouseholdId, user)
+    try:
+        import_format = ImportFormatFor(request.headers.get("content-type"))
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(exc)) from exc
+
+    def ToRow(payload: IncomeStreamCreate) -> dict:
+        return {**payload.model_dump(), "HouseholdId": user.HouseholdId, "OwnerUserId": user.Id}
+
+    result = await ImportRows(
+        db,
+        IterImportRecords(request.stream(), import_format),
+        IncomeStreamCreate,
+        IncomeStream,
+        ToRow,
+        atomic,
+    )
+    return ImportResultOutFor(result)
 
 
 @router.put("/{stream_id}", response_model=IncomeStreamOut)
-def UpdateIncomeStream(
+async def UpdateIncomeStream(
     stream_id: int,
     payload: IncomeStreamUpdate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
+    fiscal: FiscalContext = Depends(GetFiscalContext),
 ) -> IncomeStreamOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    stream = (
-        db.query(IncomeStream)
-        .filter(IncomeStream.Id == stream_id, IncomeStream.HouseholdId == user.HouseholdId)
-        .first()
+    stream = await db.scalar(
+        select(IncomeStream)
+        .where(IncomeStream.Id == stream_id, IncomeStream.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not stream:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Income stream not found")
@@ -114,6 +176,6 @@ def UpdateIncomeStream(
     stream.EndDate = payload.EndDate
     stream.Notes = payload.Notes
     db.add(stream)
-    db.commit()
-    db.refresh(stream)
-    return _BuildIncomeStreamOut(stream)
+    await db.commit()
+    await db.refresh(stream)
+    return _BuildIncomeStreamOut(stream, fiscal)
@@ -0,0 +1,16 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends
+
+from app.deps import RequireRoleAdmin
+from app.models import User
+from app.schemas import MaintenanceMetricsOut, PruneMetricsOut
+from app.services.maintenance import refresh_token_prune_metrics
+
+router = APIRouter(prefix="/maintenance", tags=["maintenance"])
+
+
+@router.get("/metrics", response_model=MaintenanceMetricsOut)
+async def GetMaintenanceMetrics(_: User = Depends(RequireRoleAdmin)) -> MaintenanceMetricsOut:
+    # Counters are per worker process.
+    return MaintenanceMetricsOut(RefreshTokenPrune=PruneMetricsOut(**asdict(refresh_token_prune_metrics)))
@@ -0,0 +1,120 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi import APIRouter, Depends, Query
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold
+from app.models import Expense, IncomeStream, User
+from app.schemas import CashFlowPointOut, CashFlowProjectionOut
+from app.services.due_dates import ExpenseScheduleRow
+from app.services.frequencies import Frequency, GetFrequency
+from app.services.money import FromCents, ToCents
+from app.services.projections import CashFlowItems, DownsampleCashFlow, ProjectCashFlow
+from app.services.schedules import AddYears, FrequencyColumnsFor
+
+router = APIRouter(prefix="/projections", tags=["projections"])
+
+
+async def _LoadCashFlowItems(db: AsyncSession, household_id: int) -> CashFlowItems:
+    streams = (
+        await db.execute(
+            select(
+                IncomeStream.NetAmount,
+                IncomeStream.FirstPayDate,
+                IncomeStream.Frequency,
+                IncomeStream.EndDate,
+            )
+            .where(IncomeStream.HouseholdId == household_id)
+        )
+    ).all()
+    expense_rows = (
+        await db.execute(
+            select(
+                Expense.Id,
+                Expense.Label,
+                Expense.Amount,
+                Expense.Frequency,
+                Expense.NextDueDate,
+                Expense.Cadence,
+                Expense.Interval,
+                Expense.Month,
+                Expense.DayOfMonth,
+                Expense.Enabled,
+            )
+            .where(Expense.HouseholdId == household_id, Expense.Enabled.is_(True))
+        )
+    ).all()
+
+    rows: list[tuple[date, Frequency, date | None, int]] = []
+    for stream in streams:
+        frequency = GetFrequency(stream.Frequency)
+        if frequency is None or not frequency.IsSchedulable:
+            continue
+        rows.append((stream.FirstPayDate, frequency, stream.EndDate, ToCents(stream.NetAmount)))
+    expenses = tuple(
+        ExpenseScheduleRow(
+            Id=row.Id,
+            Label=row.Label,
+            Amount=row.Amount,
+            Frequency=row.Frequency,
+            NextDueDate=row.NextDueDate,
+            Cadence=row.Cadence,
+            Interval=row.Interval,
+            Month=row.Month,
+            DayOfMonth=row.DayOfMonth,
+            Enabled=row.Enabled,
+        )
+        for row in expense_rows
+    )
+
+    first_dates, frequencies, end_dates, amounts = list(zip(*rows)) or [()] * 4
+    return CashFlowItems(
+        FirstDates=np.array(first_dates, dtype="datetime64[D]"),
+        Frequencies=FrequencyColumnsFor(frequencies),
+        EndDates=np.array(end_dates, dtype="datetime64[D]"),
+        AmountCents=np.array(amounts, dtype=np.int64),
+        Expenses=expenses,
+        ExpenseAmountCents=np.array([ToCents(expense.Amount) for expense in expenses], dtype=np.int64),
+    )
+
+
+@router.get("/cashflow", response_model=CashFlowProjectionOut)
+async def GetCashFlowProjection(
+    years: int = Query(1, ge=1, le=30),
+    resolution: str = Query("day", pattern="^(day|week|month)$"),
+    opening_balance: Decimal = Query(Decimal("0"), alias="openingBalance"),
+    start: date | None = Query(None, alias="from"),
+    db: AsyncSession = Depends(GetDb),
+    user: User = Depends(RequireAuthenticated),
+) -> CashFlowProjectionOut:
+    RequireCanReadHousehold(user.HouseholdId, user)
+    start = start or date.today()
+    items = await _LoadCashFlowItems(db, user.HouseholdId)
+    # A 30-year daily projection is heavy enough to keep off the event loop.
+    projection = await run_in_threadpool(ProjectCashFlow, items, start, years, ToCents(opening_balance))
+    sampled = DownsampleCashFlow(projection, resolution)
+    return CashFlowProjectionOut(
+        StartDate=start,
+        EndDate=AddYears(start, years) - timedelta(days=1),
+        Resolution=resolution,
+        OpeningBalance=FromCents(ToCents(opening_balance)),
+        ClosingBalance=FromCents(int(projection.BalanceCents[-1])),
+        Points=[
+            CashFlowPointOut(
+                Date=point_date,
+                Inflow=FromCents(inflow),
+                Outflow=FromCents(outflow),
+                Balance=FromCents(balance),
+            )
+            for point_date, inflow, outflow, balance in zip(
+                sampled.Dates.tolist(),
+                sampled.InflowCents.tolist(),
+                sampled.OutflowCents.tolist(),
+                sampled.BalanceCents.tolist(),
+            )
+        ],
+    )
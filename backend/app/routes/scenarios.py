@@ -1,12 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import base64
+import binascii
+from datetime import datetime
 
-from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold, RequireCanWriteHousehold
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.deps import (
+    GetDb,
+    GetReadDb,
+    RequireAuthenticated,
+    RequireCanReadHousehold,
+    RequireCanWriteHousehold,
+)
 from app.models import Scenario, ScenarioAdjustment, User
-from app.schemas import ScenarioCreate, ScenarioOut, ScenarioAdjustmentOut
+from app.schemas import ScenarioCreate, ScenarioOut, ScenarioAdjustmentOut, ScenarioSummaryOut
 
 router = APIRouter(prefix="/scenarios", tags=["scenarios"])
 
+SCENARIO_PAGE_MAX = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+# Keyset cursor over the list order (CreatedAt desc, Id desc). It carries both values rather
+# than an id to look up, so a page stays valid if the scenario it ended on is deleted.
+def _EncodeCursor(created_at: datetime, scenario_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{scenario_id}".encode()).decode().rstrip("=")
+
+
+def _DecodeCursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, scenario_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(scenario_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
 
 def _ToScenarioOut(scenario: Scenario) -> ScenarioOut:
     return ScenarioOut(
@@ -28,25 +58,62 @@ def _ToScenarioOut(scenario: Scenario) -> ScenarioOut:
     )
 
 
-@router.get("", response_model=list[ScenarioOut])
-def ListScenarios(
-    db: Session = Depends(GetDb),
+def _ToScenarioSummaryOut(scenario: Scenario, adjustment_count: int) -> ScenarioSummaryOut:
+    return ScenarioSummaryOut(
+        Id=scenario.Id,
+        HouseholdId=scenario.HouseholdId,
+        CreatedByUserId=scenario.CreatedByUserId,
+        Name=scenario.Name,
+        ScenarioType=scenario.ScenarioType,
+        CreatedAt=scenario.CreatedAt,
+        AdjustmentCount=adjustment_count,
+    )
+
+
+@router.get("", response_model=list[ScenarioOut] | list[ScenarioSummaryOut])
+async def ListScenarios(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=SCENARIO_PAGE_MAX),
+    after: str | None = Query(None),
+    summary: bool = Query(False),
+    db: AsyncSession = Depends(GetReadDb),
     user: User = Depends(RequireAuthenticated),
-) -> list[ScenarioOut]:
+) -> list[ScenarioOut] | list[ScenarioSummaryOut]:
     RequireCanReadHousehold(user.HouseholdId, user)
-    scenarios = (
-        db.query(Scenario)
-        .filter(Scenario.HouseholdId == user.HouseholdId)
-        .order_by(Scenario.CreatedAt.desc())
-        .all()
+    query = (
+        select(Scenario)
+        .where(Scenario.HouseholdId == user.HouseholdId)
+        .order_by(Scenario.CreatedAt.desc(), Scenario.Id.desc())
     )
-    return [_ToScenarioOut(scenario) for scenario in scenarios]
+    if after is not None:
+        query = query.where(tuple_(Scenario.CreatedAt, Scenario.Id) < tuple_(*_DecodeCursor(after)))
+    if limit is not None:
+        # One extra row tells whether another page follows.
+        query = query.limit(limit + 1)
+
+    if summary:
+        adjustment_count = (
+            select(func.count(ScenarioAdjustment.Id))
+            .where(ScenarioAdjustment.ScenarioId == Scenario.Id)
+            .scalar_subquery()
+        )
+        rows = (await db.execute(query.add_columns(adjustment_count))).all()
+    else:
+        rows = [(scenario, None) for scenario in await db.scalars(query.options(selectinload(Scenario.Adjustments)))]
+
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        response.headers[NEXT_CURSOR_HEADER] = _EncodeCursor(last.CreatedAt, last.Id)
+    if summary:
+        return [_ToScenarioSummaryOut(scenario, count) for scenario, count in rows]
+    return [_ToScenarioOut(scenario) for scenario, _ in rows]
 
 
 @router.post("", response_model=ScenarioOut, status_code=status.HTTP_201_CREATED)
-def CreateScenario(
+async def CreateScenario(
     payload: ScenarioCreate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> ScenarioOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
@@ -57,7 +124,7 @@ def CreateScenario(
         ScenarioType=payload.ScenarioType,
     )
     db.add(scenario)
-    db.flush()
+    await db.flush()
 
     for adjustment in payload.Adjustments:
         db.add(
@@ -70,21 +137,22 @@ def CreateScenario(
             )
         )
 
-    db.commit()
-    db.refresh(scenario)
+    await db.commit()
+    await db.refresh(scenario, ["Adjustments"])
     return _ToScenarioOut(scenario)
 
 
 @router.get("/{scenario_id}", response_model=ScenarioOut)
-def GetScenario(
+async def GetScenario(
     scenario_id: int,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> ScenarioOut:
-    scenario = (
-        db.query(Scenario)
-        .filter(Scenario.Id == scenario_id, Scenario.HouseholdId == user.HouseholdId)
-        .first()
+    scenario = await db.scalar(
+        select(Scenario)
+        .options(selectinload(Scenario.Adjustments))
+        .where(Scenario.Id == scenario_id, Scenario.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not scenario:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
@@ -93,21 +161,21 @@ def GetScenario(
 
 
 @router.delete("/{scenario_id}", status_code=status.HTTP_204_NO_CONTENT)
-def DeleteScenario(
+async def DeleteScenario(
     scenario_id: int,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> None:
     RequireCanWriteHousehold(user.HouseholdId, user)
-    scenario = (
-        db.query(Scenario)
-        .filter(Scenario.Id == scenario_id, Scenario.HouseholdId == user.HouseholdId)
-        .first()
+    scenario = await db.scalar(
+        select(Scenario)
+        .where(Scenario.Id == scenario_id, Scenario.HouseholdId == user.HouseholdId)
+        .limit(1)
     )
     if not scenario:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
 
-    db.query(ScenarioAdjustment).filter(ScenarioAdjustment.ScenarioId == scenario.Id).delete()
-    db.delete(scenario)
-    db.commit()
+    await db.execute(delete(ScenarioAdjustment).where(ScenarioAdjustment.ScenarioId == scenario.Id))
+    await db.delete(scenario)
+    await db.commit()
     return None
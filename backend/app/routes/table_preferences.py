@@ -1,9 +1,16 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.deps import GetDb, RequireAuthenticated, RequireCanReadHousehold, RequireCanWriteHousehold
+from app.deps import (
+    GetDb,
+    GetReadDb,
+    RequireAuthenticated,
+    RequireCanReadHousehold,
+    RequireCanWriteHousehold,
+)
 from app.models import TablePreference, User
 from app.schemas import TablePreferenceOut, TablePreferenceUpdate
 
@@ -11,16 +18,16 @@ router = APIRouter(prefix="/table-preferences", tags=["table-preferences"])
 
 
 @router.get("/{table_key}", response_model=TablePreferenceOut)
-def GetTablePreference(
+async def GetTablePreference(
     table_key: str,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetReadDb),
     user: User = Depends(RequireAuthenticated),
 ) -> TablePreferenceOut:
     RequireCanReadHousehold(user.HouseholdId, user)
-    pref = (
-        db.query(TablePreference)
-        .filter(TablePreference.UserId == user.Id, TablePreference.TableKey == table_key)
-        .first()
+    pref = await db.scalar(
+        select(TablePreference)
+        .where(TablePreference.UserId == user.Id, TablePreference.TableKey == table_key)
+        .limit(1)
     )
     if not pref:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preference not found")
@@ -28,19 +35,19 @@ def GetTablePreference(
 
 
 @router.put("/{table_key}", response_model=TablePreferenceOut)
-def UpsertTablePreference(
+async def UpsertTablePreference(
     table_key: str,
     payload: TablePreferenceUpdate,
-    db: Session = Depends(GetDb),
+    db: AsyncSession = Depends(GetDb),
     user: User = Depends(RequireAuthenticated),
 ) -> TablePreferenceOut:
     RequireCanWriteHousehold(user.HouseholdId, user)
     if payload.TableKey != table_key:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Table key mismatch")
-    pref = (
-        db.query(TablePreference)
-        .filter(TablePreference.UserId == user.Id, TablePreference.TableKey == table_key)
-        .first()
+    pref = await db.scalar(
+        select(TablePreference)
+        .where(TablePreference.UserId == user.Id, TablePreference.TableKey == table_key)
+        .limit(1)
     )
     now = datetime.utcnow()
     if not pref:
@@ -56,6 +63,6 @@ def UpsertTablePreference(
     else:
         pref.State = payload.State
         pref.UpdatedAt = now
-    db.commit()
-    db.refresh(pref)
+    await db.commit()
+    await db.refresh(pref)
     return pref
@@ -1,29 +1,153 @@
-from fastapi import APIRouter, Depends
+from decimal import Decimal
+from functools import lru_cache
+import hashlib
+from itertools import islice
+from typing import Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+import numpy as np
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 
 from app.deps import RequireAuthenticated
-from app.schemas import TaxCalculatorRequest, TaxCalculatorResponse, TaxYearOut
-from app.services.tax_calculator import EstimateTax
-from app.services.tax_data import ListTaxYears
+from app.schemas import (
+    TaxCalculatorBatchRequest,
+    TaxCalculatorRequest,
+    TaxCalculatorResponse,
+    TaxCurveOut,
+    TaxSolveGrossRequest,
+    TaxSolveGrossResponse,
+    TaxYearOut,
+)
+from app.services.tax_calculator import (
+    ESTIMATE_BATCH_CHUNK,
+    CachedEstimateTax,
+    EstimateTaxBatch,
+    SolveGrossSalary,
+    TaxCurve,
+)
+from app.services.tax_data import GetTaxYearByLabel, ListTaxYears, TaxYear
 
 router = APIRouter(prefix="/tax-calculator", tags=["tax-calculator"])
 
+CURVE_MAX_POINTS = 100_001
+# Tax years only change with a deploy; estimates are revalidated against their ETag each time.
+YEARS_CACHE_CONTROL = "private, max-age=86400"
+ESTIMATE_CACHE_CONTROL = "private, no-cache"
+_ESTIMATES = TypeAdapter(list[TaxCalculatorResponse])
 
-@router.get("/years", response_model=list[TaxYearOut])
-def GetTaxYears(_: None = Depends(RequireAuthenticated)) -> list[TaxYearOut]:
-    return [
+
+def _MatchesETag(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _CachedJsonResponse(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _MatchesETag(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=1)
+def _TaxYearsJson() -> tuple[bytes, str]:
+    body = b"[" + b",".join(
         TaxYearOut(
             Label=tax_year.Label,
             StartDate=tax_year.StartDate,
             EndDate=tax_year.EndDate,
             IsEstimated=tax_year.IsEstimated,
-        )
+        ).model_dump_json().encode()
         for tax_year in ListTaxYears()
-    ]
+    ) + b"]"
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _IterEstimatesJson(payloads: list[TaxCalculatorRequest]) -> Iterator[bytes]:
+    # Starlette runs each next() of a sync body iterator on the threadpool, so estimates are
+    # serialized a chunk at a time rather than one per hop.
+    estimates = EstimateTaxBatch(payloads)
+    yield b"["
+    separator = b""
+    while chunk := list(islice(estimates, ESTIMATE_BATCH_CHUNK)):
+        yield separator + _ESTIMATES.dump_json(chunk)[1:-1]
+        separator = b","
+    yield b"]"
+
+
+def _BuildTaxCurve(tax_year: TaxYear, salaries: np.ndarray, private_health: bool) -> TaxCurveOut:
+    curve = TaxCurve(tax_year, salaries, private_health)
+    return TaxCurveOut(
+        TaxYear=tax_year.Label,
+        IsEstimated=tax_year.IsEstimated,
+        PrivateHealth=private_health,
+        Salary=np.round(salaries, 2).tolist(),
+        IncomeTax=np.round(curve["IncomeTax"], 2).tolist(),
+        Medicare=np.round(curve["Medicare"], 2).tolist(),
+        Mls=np.round(curve["Mls"], 2).tolist(),
+        Net=np.round(curve["Net"], 2).tolist(),
+        EffectiveRate=np.round(curve["EffectiveRate"], 6).tolist(),
+        MarginalRate=np.round(curve["MarginalRate"], 6).tolist(),
+    )
+
+
+@router.get("/years", response_model=list[TaxYearOut])
+async def GetTaxYears(request: Request, _: None = Depends(RequireAuthenticated)) -> Response:
+    body, etag = _TaxYearsJson()
+    return _CachedJsonResponse(request, body, etag, YEARS_CACHE_CONTROL)
 
 
 @router.post("/estimate", response_model=TaxCalculatorResponse)
-def CalculateTax(
+async def CalculateTax(
     payload: TaxCalculatorRequest,
+    request: Request,
+    _: None = Depends(RequireAuthenticated),
+) -> Response:
+    cached = CachedEstimateTax(payload)
+    return _CachedJsonResponse(request, cached.Body, cached.ETag, ESTIMATE_CACHE_CONTROL)
+
+
+@router.post("/estimate/batch", response_model=list[TaxCalculatorResponse])
+async def CalculateTaxBatch(
+    payload: TaxCalculatorBatchRequest,
+    _: None = Depends(RequireAuthenticated),
+) -> StreamingResponse:
+    return StreamingResponse(_IterEstimatesJson(payload.Requests), media_type="application/json")
+
+
+@router.post("/solve-gross", response_model=TaxSolveGrossResponse)
+async def SolveGross(
+    payload: TaxSolveGrossRequest,
+    _: None = Depends(RequireAuthenticated),
+) -> TaxSolveGrossResponse:
+    try:
+        return await run_in_threadpool(SolveGrossSalary, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/curve", response_model=TaxCurveOut)
+async def GetTaxCurve(
+    range_start: Decimal = Query(Decimal("0"), alias="from", ge=0),
+    range_end: Decimal = Query(Decimal("500000"), alias="to", ge=0),
+    step: Decimal = Query(Decimal("1000"), gt=0),
+    tax_year_label: str | None = Query(None, alias="taxYear"),
+    private_health: bool = Query(False, alias="privateHealth"),
     _: None = Depends(RequireAuthenticated),
-) -> TaxCalculatorResponse:
-    return EstimateTax(payload)
+) -> TaxCurveOut:
+    if range_end < range_start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid salary range")
+    # Compared as a Decimal quotient first: integer division of a huge range by a tiny step
+    # raises InvalidOperation instead of returning a count.
+    if (range_end - range_start) / step >= CURVE_MAX_POINTS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Too many curve points")
+    points = int((range_end - range_start) // step) + 1
+
+    tax_year = GetTaxYearByLabel(tax_year_label)
+    salaries = float(range_start) + float(step) * np.arange(points)
+    return await run_in_threadpool(_BuildTaxCurve, tax_year, salaries, private_health)
+
@@ -5,6 +5,21 @@ from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
 
 
+class PruneMetricsOut(BaseModel):
+    Runs: int
+    Batches: int
+    RowsPruned: int
+    TotalDurationMs: float
+    LastRunAt: Optional[datetime] = None
+    LastRowsPruned: int
+    LastDurationMs: float
+    LastError: Optional[str] = None
+
+
+class MaintenanceMetricsOut(BaseModel):
+    RefreshTokenPrune: PruneMetricsOut
+
+
 class TokenPair(BaseModel):
     AccessToken: str
     RefreshToken: str
@@ -115,6 +130,16 @@ class ScenarioOut(BaseModel):
         from_attributes = True
 
 
+class ScenarioSummaryOut(BaseModel):
+    Id: int
+    HouseholdId: int
+    CreatedByUserId: int
+    Name: str
+    ScenarioType: str
+    CreatedAt: datetime
+    AdjustmentCount: int
+
+
 class TaxYearOut(BaseModel):
     Label: str
     StartDate: date
@@ -135,6 +160,24 @@ class TaxCalculatorRequest(BaseModel):
     TaxYear: str | None = None
 
 
+class TaxSolveGrossRequest(BaseModel):
+    TargetNetAmount: Decimal
+    TargetNetFrequency: str = "Yearly"
+    SalaryFrequency: str = "Yearly"
+    IncludesSuper: bool
+    SuperRate: Decimal = Decimal("0")
+    PrivateHealth: bool = False
+    NovatedLeaseAmount: Decimal = Decimal("0")
+    NovatedLeaseFrequency: str = "Yearly"
+    HoursPerWeek: Decimal | None = None
+    DaysPerWeek: Decimal | None = None
+    TaxYear: str | None = None
+
+
+class TaxCalculatorBatchRequest(BaseModel):
+    Requests: list[TaxCalculatorRequest] = Field(min_length=1, max_length=10000)
+
+
 class TaxPeriodAmounts(BaseModel):
     Weekly: Decimal
     Fortnightly: Decimal
@@ -162,6 +205,68 @@ class TaxCalculatorResponse(BaseModel):
     Super: TaxPeriodAmounts
 
 
+class TaxCurveOut(BaseModel):
+    TaxYear: str
+    IsEstimated: bool
+    PrivateHealth: bool
+    Salary: list[float]
+    IncomeTax: list[float]
+    Medicare: list[float]
+    Mls: list[float]
+    Net: list[float]
+    EffectiveRate: list[float]
+    MarginalRate: list[float]
+
+
+class HouseholdTaxMemberOut(BaseModel):
+    UserId: int
+    Email: str
+    StreamCount: int
+    GrossAnnual: Decimal
+    Estimate: TaxCalculatorResponse
+
+
+class HouseholdTaxSummaryOut(BaseModel):
+    HouseholdId: int
+    TaxYear: str
+    IsEstimated: bool
+    GrossAnnual: Decimal
+    IncomeTaxAnnual: Decimal
+    MedicareAnnual: Decimal
+    MlsAnnual: Decimal
+    NetAnnual: Decimal
+    Members: list[HouseholdTaxMemberOut]
+
+
+class IncomeTimelineMemberOut(BaseModel):
+    UserId: int
+    Email: str
+    GrossAnnual: Decimal
+    Estimate: TaxCalculatorResponse
+
+
+class IncomeTimelineYearOut(BaseModel):
+    StartDate: date
+    EndDate: date
+    TaxYear: str
+    IsEstimated: bool
+    GrossAnnual: Decimal
+    IncomeTaxAnnual: Decimal
+    NetAnnual: Decimal
+    Members: list[IncomeTimelineMemberOut]
+
+
+class HouseholdIncomeTimelineOut(BaseModel):
+    HouseholdId: int
+    Years: list[IncomeTimelineYearOut]
+
+
+class TaxSolveGrossResponse(BaseModel):
+    SalaryAmount: Decimal
+    SalaryFrequency: str
+    Estimate: TaxCalculatorResponse
+
+
 class ExpenseBase(BaseModel):
     Label: str = Field(min_length=1, max_length=200)
     Amount: Decimal
@@ -171,8 +276,8 @@ class ExpenseBase(BaseModel):
     NextDueDate: date | None = None
     Cadence: str | None = None
     Interval: int | None = None
-    Month: int | None = None
-    DayOfMonth: int | None = None
+    Month: int | None = Field(default=None, ge=1, le=12)
+    DayOfMonth: int | None = Field(default=None, ge=1, le=31)
     Enabled: bool = True
     Notes: str | None = None
 
@@ -185,12 +290,28 @@ class ExpenseUpdate(ExpenseBase):
     pass
 
 
+class ImportRowErrorOut(BaseModel):
+    # 1-based data row, not counting the CSV header or blank lines.
+    Row: int
+    Errors: list[str]
+
+
+class ImportResultOut(BaseModel):
+    Imported: int
+    Failed: int
+    Errors: list[ImportRowErrorOut]
+
+
 class ExpenseOut(ExpenseBase):
+    # Rows saved before Month/DayOfMonth were range-checked still have to be readable.
+    Month: int | None = None
+    DayOfMonth: int | None = None
     Id: int
     HouseholdId: int
     OwnerUserId: int
     CreatedAt: datetime
     DisplayOrder: int
+    UpcomingDueDate: date | None = None
     PerDay: Decimal
     PerWeek: Decimal
     PerFortnight: Decimal
@@ -201,6 +322,13 @@ class ExpenseOut(ExpenseBase):
         from_attributes = True
 
 
+class UpcomingExpenseOut(BaseModel):
+    ExpenseId: int
+    Label: str
+    DueDate: date
+    Amount: Decimal
+
+
 class ExpenseAccountBase(BaseModel):
     Name: str = Field(min_length=1, max_length=200)
     Enabled: bool = True
@@ -269,3 +397,59 @@ class TablePreferenceOut(TablePreferenceBase):
 
 class ExpenseOrderUpdate(BaseModel):
     OrderedIds: list[int] = Field(min_length=1)
+
+
+class ExpenseMove(BaseModel):
+    # The neighbours at the drop position: AfterId ends up above the moved expense, BeforeId below.
+    # Either one may be omitted to move to the top or bottom of the list.
+    AfterId: int | None = None
+    BeforeId: int | None = None
+
+
+class ExpenseBulkFields(BaseModel):
+    # Sparse: only the fields present in the request are written.
+    Label: str | None = Field(default=None, min_length=1, max_length=200)
+    Amount: Decimal | None = None
+    Frequency: str | None = None
+    Account: str | None = None
+    Type: str | None = None
+    NextDueDate: date | None = None
+    Cadence: str | None = None
+    Interval: int | None = None
+    Month: int | None = Field(default=None, ge=1, le=12)
+    DayOfMonth: int | None = Field(default=None, ge=1, le=31)
+    Enabled: bool | None = None
+    Notes: str | None = None
+
+
+class ExpenseBulkUpdate(BaseModel):
+    Ids: list[int] = Field(min_length=1, max_length=1000)
+    Fields: ExpenseBulkFields
+
+
+class ExpenseBulkDelete(BaseModel):
+    Ids: list[int] = Field(min_length=1, max_length=1000)
+
+
+class CalendarEventOut(BaseModel):
+    Date: date
+    Kind: str
+    SourceId: int
+    Label: str
+    Amount: Decimal
+
+
+class CashFlowPointOut(BaseModel):
+    Date: date
+    Inflow: Decimal
+    Outflow: Decimal
+    Balance: Decimal
+
+
+class CashFlowProjectionOut(BaseModel):
+    StartDate: date
+    EndDate: date
+    Resolution: str
+    OpeningBalance: Decimal
+    ClosingBalance: Decimal
+    Points: list[CashFlowPointOut]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+import threading
+import time
+from typing import Awaitable, Callable, Iterator, Sequence
+
+import numpy as np
+
+from app.services.frequencies import Frequency
+from app.services.schedules import (
+    BatchNextOccurrence,
+    BatchOccurrences,
+    ExpenseAnchor,
+    ExpenseFrequency,
+    FrequencyColumnsFor,
+    IterOccurrences,
+)
+
+INDEX_HORIZON_DAYS = 366
+
+
+@dataclass(frozen=True)
+class ExpenseScheduleRow:
+    Id: int
+    Label: str
+    Amount: Decimal
+    Frequency: str
+    NextDueDate: date | None
+    Cadence: str | None
+    Interval: int | None
+    Month: int | None
+    DayOfMonth: int | None
+    Enabled: bool
+
+
+@dataclass(frozen=True)
+class ExpenseDueDates:
+    Frequencies: tuple[Frequency | None, ...]
+    NextDueDates: np.ndarray
+
+
+def _Anchor(row: ExpenseScheduleRow, frequency: Frequency | None, today: date) -> tuple[date | None, int]:
+    if frequency is None:
+        return None, 0
+    return ExpenseAnchor(row.NextDueDate, row.Month, row.DayOfMonth, today)
+
+
+def _Anchors(
+    rows: Sequence[ExpenseScheduleRow], frequencies: Sequence[Frequency | None], today: date
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    anchors = [_Anchor(row, frequency, today) for row, frequency in zip(rows, frequencies)]
+    anchor_dates = np.array([anchor for anchor, _ in anchors], dtype="datetime64[D]")
+    due_days = np.array([due_day for _, due_day in anchors], dtype=np.int64)
+    return anchor_dates, ~np.isnat(anchor_dates), due_days
+
+
+def ComputeExpenseDueDates(rows: Sequence[ExpenseScheduleRow], today: date) -> ExpenseDueDates:
+    frequencies = tuple(ExpenseFrequency(row.Cadence, row.Interval, row.Frequency) for row in rows)
+    anchors, scheduled, due_days = _Anchors(rows, frequencies, today)
+    next_due = BatchNextOccurrence(
+        np.where(scheduled, anchors, np.datetime64(today, "D")),
+        FrequencyColumnsFor(frequencies),
+        today,
+        due_days,
+    )
+    return ExpenseDueDates(
+        Frequencies=frequencies,
+        NextDueDates=np.where(scheduled, next_due, np.datetime64("NaT", "D")),
+    )
+
+
+@dataclass(frozen=True)
+class DueDateIndex:
+    BuiltOn: date
+    HorizonEnd: date
+    Dates: np.ndarray
+    Rows: np.ndarray
+    Expenses: tuple[ExpenseScheduleRow, ...]
+
+    def Between(self, start: date, end: date) -> list[tuple[date, ExpenseScheduleRow]]:
+        low = np.searchsorted(self.Dates, np.datetime64(start, "D"), side="left")
+        high = np.searchsorted(self.Dates, np.datetime64(end, "D"), side="right")
+        return [
+            (due_date, self.Expenses[row])
+            for due_date, row in zip(self.Dates[low:high].tolist(), self.Rows[low:high].tolist())
+        ]
+
+
+def ExpenseOccurrences(
+    rows: Sequence[ExpenseScheduleRow], range_start: date, range_end: date, today: date
+) -> tuple[np.ndarray, np.ndarray]:
+    # Every due date in the range as (row position, date) arrays, grouped by row. Rows are not
+    # filtered on Enabled here; `today` anchors DayOfMonth-only rows as in ComputeExpenseDueDates.
+    frequencies = [ExpenseFrequency(row.Cadence, row.Interval, row.Frequency) for row in rows]
+    anchors, scheduled, due_days = _Anchors(rows, frequencies, today)
+    keep = np.flatnonzero(scheduled)
+    positions, dates = BatchOccurrences(
+        anchors[keep],
+        FrequencyColumnsFor([frequencies[index] for index in keep.tolist()]),
+        range_start,
+        range_end,
+        np.full(keep.size, np.datetime64("NaT", "D")),
+        due_days[keep],
+    )
+    return keep[positions], dates
+
+
+def IterExpenseOccurrences(
+    row: ExpenseScheduleRow, range_start: date, range_end: date, today: date
+) -> Iterator[date]:
+    # Lazy, single-row twin of ExpenseOccurrences for callers that stream long ranges.
+    frequency = ExpenseFrequency(row.Cadence, row.Interval, row.Frequency)
+    anchor, due_day = _Anchor(row, frequency, today)
+    if anchor is None:
+        return
+    if not frequency.IsSchedulable:
+        if range_start <= anchor <= range_end:
+            yield anchor
+        return
+    yield from IterOccurrences(anchor, frequency.Name, range_start, range_end, None, due_day)
+
+
+def BuildDueDateIndex(rows: Sequence[ExpenseScheduleRow], today: date) -> DueDateIndex:
+    rows = tuple(row for row in rows if row.Enabled)
+    horizon_end = today + timedelta(days=INDEX_HORIZON_DAYS)
+    positions, dates = ExpenseOccurrences(rows, today, horizon_end, today)
+    order = np.argsort(dates, kind="stable")
+    return DueDateIndex(
+        BuiltOn=today,
+        HorizonEnd=horizon_end,
+        Dates=dates[order],
+        Rows=positions[order],
+        Expenses=rows,
+    )
+
+
+# One index per household, rebuilt when the day rolls over, when an expense write in this
+# process invalidates it, or after INDEX_TTL_SECONDS so writes through other workers show up.
+INDEX_TTL_SECONDS = 300
+
+_INDEXES: dict[int, tuple[float, DueDateIndex]] = {}
+_GENERATIONS: dict[int, int] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+async def GetDueDateIndex(
+    household_id: int,
+    today: date,
+    load_rows: Callable[[], Awaitable[Sequence[ExpenseScheduleRow]]],
+) -> DueDateIndex:
+    with _INDEX_LOCK:
+        cached = _INDEXES.get(household_id)
+        generation = _GENERATIONS.get(household_id, 0)
+    if cached is not None:
+        built_at, index = cached
+        if index.BuiltOn == today and time.monotonic() - built_at < INDEX_TTL_SECONDS:
+            return index
+
+    built_at = time.monotonic()
+    index = BuildDueDateIndex(await load_rows(), today)
+    with _INDEX_LOCK:
+        # Skip storing if a write invalidated the household while the rows were loading.
+        if _GENERATIONS.get(household_id, 0) == generation:
+            _INDEXES[household_id] = (built_at, index)
+    return index
+
+
+def InvalidateDueDateIndex(household_id: int) -> None:
+    with _INDEX_LOCK:
+        _INDEXES.pop(household_id, None)
+        _GENERATIONS[household_id] = _GENERATIONS.get(household_id, 0) + 1
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+import re
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Frequency:
+    Name: str
+    Days: int = 0
+    Months: int = 0
+    PeriodsPerYear: Decimal = Decimal(0)
+    Weekday: int | None = None
+    WeekOfMonth: int = 0
+    WorkUnit: str | None = None
+    # Exact rational twin of PeriodsPerYear (365/7 rather than 52.1428...) for the cents path.
+    ExactPeriodsPerYear: Fraction = Fraction(0)
+
+    @property
+    def IsSchedulable(self) -> bool:
+        return bool(self.Days or self.Months)
+
+
+def _per_year(periods: int, every: int = 1) -> dict[str, Any]:
+    return {"PeriodsPerYear": Decimal(periods) / every, "ExactPeriodsPerYear": Fraction(periods, every)}
+
+
+_NAMED: dict[str, Frequency] = {
+    frequency.Name: frequency
+    for frequency in (
+        Frequency(Name="weekly", Days=7, **_per_year(52)),
+        Frequency(Name="fortnightly", Days=14, **_per_year(26)),
+        Frequency(Name="monthly", Months=1, **_per_year(12)),
+        Frequency(Name="quarterly", Months=3, **_per_year(4)),
+        Frequency(Name="yearly", Months=12, **_per_year(1)),
+        Frequency(Name="hourly", **_per_year(52), WorkUnit="hours"),
+        Frequency(Name="daily", **_per_year(52), WorkUnit="days"),
+        Frequency(Name="oneoff"),
+    )
+}
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_ORDINALS = {
+    "first": 1,
+    "1st": 1,
+    "second": 2,
+    "2nd": 2,
+    "third": 3,
+    "3rd": 3,
+    "fourth": 4,
+    "4th": 4,
+    "last": -1,
+}
+
+_EVERY_PATTERN = re.compile(r"^every (\d+) (day|week|month|year)s?$")
+_NTH_WEEKDAY_PATTERN = re.compile(
+    rf"^({'|'.join(_ORDINALS)}) ({'|'.join(_WEEKDAYS)}) of (?:the |each |every )?month$"
+)
+
+
+def _compile(name: str) -> Frequency | None:
+    named = _NAMED.get(name)
+    if named is not None:
+        return named
+
+    match = _EVERY_PATTERN.match(name)
+    if match:
+        count = int(match.group(1))
+        if count <= 0:
+            return None
+        unit = match.group(2)
+        if unit == "day":
+            return Frequency(Name=name, Days=count, **_per_year(365, count))
+        if unit == "week":
+            return Frequency(Name=name, Days=7 * count, **_per_year(52, count))
+        if unit == "month":
+            return Frequency(Name=name, Months=count, **_per_year(12, count))
+        return Frequency(Name=name, Months=12 * count, **_per_year(1, count))
+
+    match = _NTH_WEEKDAY_PATTERN.match(name)
+    if match:
+        return Frequency(
+            Name=name,
+            Months=1,
+            **_per_year(12),
+            Weekday=_WEEKDAYS.index(match.group(2)),
+            WeekOfMonth=_ORDINALS[match.group(1)],
+        )
+    return None
+
+
+@lru_cache(maxsize=512)
+def GetFrequency(value: str | None) -> Frequency | None:
+    # Raw strings are cached so each distinct spelling is normalised and parsed only once.
+    return _compile(" ".join((value or "").lower().split()))
+
+
+def EveryMonths(months: int) -> Frequency:
+    return GetFrequency(f"every {months} months")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import codecs
+import csv
+from dataclasses import dataclass, field
+import json
+from typing import Any, AsyncIterator, Callable
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas import ImportResultOut, ImportRowErrorOut
+
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+IMPORT_CHUNK_ROWS = 1000
+# Errors past this many are counted but not listed, so a bad file cannot bloat the response.
+MAX_REPORTED_ERRORS = 1000
+# Bounds on one CSV record, which may span lines inside a quoted field.
+MAX_CSV_RECORD_CHARS = 65536
+MAX_CSV_RECORD_LINES = 100
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+@dataclass
+class ImportResult:
+    Imported: int = 0
+    Failed: int = 0
+    Errors: list[tuple[int, list[str]]] = field(default_factory=list)
+
+    def AddError(self, row: int, messages: list[str]) -> None:
+        self.Failed += 1
+        if len(self.Errors) < MAX_REPORTED_ERRORS:
+            self.Errors.append((row, messages))
+
+
+def ImportResultOutFor(result: ImportResult) -> ImportResultOut:
+    return ImportResultOut(
+        Imported=result.Imported,
+        Failed=result.Failed,
+        Errors=[ImportRowErrorOut(Row=row, Errors=messages) for row, messages in result.Errors],
+    )
+
+
+def ImportFormatFor(content_type: str | None) -> str:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in CSV_CONTENT_TYPES:
+        return "csv"
+    if media_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    raise ImportFormatError("Import body must be text/csv or application/x-ndjson")
+
+
+async def _IterLines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    # Lines keep their terminator so CSV records with quoted newlines can be rejoined exactly.
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _EndsInsideQuotes(line: str, in_quotes: bool) -> bool:
+    # Follows csv's quoting rules: a quote only opens a quoted field at the start of a field,
+    # doubled quotes inside one are literal, and a stray quote in an unquoted field (TV 55")
+    # is just text. A continuation line starts inside the quoted field it continues.
+    at_field_start = not in_quotes
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if in_quotes:
+            if char == '"':
+                if line.startswith('"', index + 1):
+                    index += 1
+                else:
+                    in_quotes = False
+        elif char == '"' and at_field_start:
+            in_quotes = True
+        at_field_start = char == "," and not in_quotes
+        index += 1
+    return in_quotes
+
+
+def _ParseCsvRecord(record: str) -> list[str] | str:
+    try:
+        return next(csv.reader([record]), [])
+    except csv.Error as exc:
+        return f"Invalid CSV: {exc}"
+
+
+async def _IterCsvRecords(lines: AsyncIterator[str]) -> AsyncIterator[list[str] | str]:
+    # Yields the values of each record, or an error message for a record that could not be
+    # parsed. A record spans several lines only while a quoted field is open, and is abandoned
+    # once it passes MAX_CSV_RECORD_CHARS or MAX_CSV_RECORD_LINES so an unbalanced quote cannot
+    # buffer the rest of the body.
+    record = ""
+    record_lines = 0
+    in_quotes = False
+    async for line in lines:
+        record += line
+        record_lines += 1
+        in_quotes = ('"' in line or in_quotes) and _EndsInsideQuotes(line, in_quotes)
+        if in_quotes and len(record) <= MAX_CSV_RECORD_CHARS and record_lines <= MAX_CSV_RECORD_LINES:
+            continue
+        if in_quotes:
+            yield (
+                f"Quoted field is not closed within {MAX_CSV_RECORD_LINES} lines or "
+                f"{MAX_CSV_RECORD_CHARS} characters"
+            )
+            in_quotes = False
+        else:
+            yield _ParseCsvRecord(record)
+        record = ""
+        record_lines = 0
+    if in_quotes:
+        yield "Quoted field is not closed before the end of the file"
+    elif record:
+        yield _ParseCsvRecord(record)
+
+
+async def IterImportRecords(chunks: AsyncIterator[bytes], import_format: str) -> AsyncIterator[tuple[int, Any]]:
+    # Yields (row number, record) for each non-blank data row; a record is a dict of field values,
+    # or an error message when the row could not be parsed.
+    row = 0
+    if import_format == "ndjson":
+        async for line in _IterLines(chunks):
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                yield row, json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield row, f"Invalid JSON: {exc.msg}"
+        return
+
+    header: list[str] | None = None
+    async for values in _IterCsvRecords(_IterLines(chunks)):
+        if isinstance(values, str):
+            row += 1
+            yield row, values if header is not None else f"Header row: {values}"
+            if header is None:
+                return
+            continue
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) > len(header):
+            yield row, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # Empty cells are left out so the schema defaults apply.
+        yield row, {name: value for name, value in zip(header, values) if value != ""}
+
+
+def _ValidationMessages(exc: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors(include_url=False)
+    ]
+
+
+async def ImportRows(
+    db: AsyncSession,
+    records: AsyncIterator[tuple[int, Any]],
+    schema: type[BaseModel],
+    model: type,
+    to_row: Callable[[BaseModel], dict[str, Any]],
+    atomic: bool = False,
+) -> ImportResult:
+    # Valid rows are inserted in IMPORT_CHUNK_ROWS executemany batches and committed together at
+    # the end. With atomic, any invalid row rolls the whole import back.
+    result = ImportResult()
+    batch: list[dict[str, Any]] = []
+    async for row, record in records:
+        if isinstance(record, str):
+            result.AddError(row, [record])
+            continue
+        if not isinstance(record, dict):
+            result.AddError(row, ["Row must be an object"])
+            continue
+        try:
+            payload = schema.model_validate(record)
+        except ValidationError as exc:
+            result.AddError(row, _ValidationMessages(exc))
+            continue
+        if atomic and result.Failed:
+            continue
+        batch.append(to_row(payload))
+        if len(batch) >= IMPORT_CHUNK_ROWS:
+            await db.execute(insert(model), batch)
+            result.Imported += len(batch)
+            batch = []
+
+    if atomic and result.Failed:
+        await db.rollback()
+        result.Imported = 0
+        return result
+    if batch:
+        await db.execute(insert(model), batch)
+        result.Imported += len(batch)
+    await db.commit()
+    return result
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from app.services.money import BatchRoundHalfUp
+from app.services.schedules import AddYears, BatchOccurrences, FrequencyColumns
+
+
+@dataclass(frozen=True)
+class IncomeTimelineItems:
+    OwnerIds: np.ndarray
+    FirstDates: np.ndarray
+    Frequencies: FrequencyColumns
+    EndDates: np.ndarray
+    AmountCents: np.ndarray
+    # Hourly/daily rates have no pay dates; they carry an annualised amount that is spread over
+    # the days the stream is active instead.
+    WorkUnit: np.ndarray
+    AnnualCents: np.ndarray
+
+
+@dataclass(frozen=True)
+class IncomeTimeline:
+    YearStarts: np.ndarray
+    YearEnds: np.ndarray
+    OwnerIds: np.ndarray
+    GrossCents: np.ndarray
+
+
+def FinancialYearStarts(first_start: date, years: int) -> list[date]:
+    return [AddYears(first_start, offset) for offset in range(years)]
+
+
+def BuildIncomeTimeline(items: IncomeTimelineItems, year_starts: list[date]) -> IncomeTimeline:
+    bounds = np.array([*year_starts, AddYears(year_starts[-1], 1)], dtype="datetime64[D]")
+    owners, owner_rows = np.unique(items.OwnerIds, return_inverse=True)
+    gross = np.zeros((owners.size, len(year_starts)), dtype=np.int64)
+    if owners.size == 0:
+        return IncomeTimeline(bounds[:-1], bounds[1:] - 1, owners, gross)
+
+    # Every actual pay date in the horizon, bucketed into its financial year.
+    scheduled = np.flatnonzero(~items.WorkUnit)
+    rows, dates = BatchOccurrences(
+        items.FirstDates[scheduled],
+        items.Frequencies.Take(scheduled),
+        bounds[0].astype(date),
+        (bounds[-1] - 1).astype(date),
+        items.EndDates[scheduled],
+    )
+    rows = scheduled[rows]
+    years = np.searchsorted(bounds, dates, side="right") - 1
+    np.add.at(gross, (owner_rows[rows], years), items.AmountCents[rows])
+
+    # Work-unit rates are prorated by the share of each year the stream is active.
+    work = np.flatnonzero(items.WorkUnit)
+    if work.size:
+        first = items.FirstDates[work][:, None]
+        last = items.EndDates[work][:, None]
+        stop = np.where(np.isnat(last), bounds[None, 1:], np.minimum(last + 1, bounds[None, 1:]))
+        active = np.maximum((stop - np.maximum(first, bounds[None, :-1])).astype(np.int64), 0)
+        year_days = (bounds[1:] - bounds[:-1]).astype(np.int64)
+        prorated = BatchRoundHalfUp(items.AnnualCents[work][:, None] * active, year_days[None, :])
+        np.add.at(gross, owner_rows[work], prorated)
+
+    return IncomeTimeline(bounds[:-1], bounds[1:] - 1, owners, gross)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import ColumnElement, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import Settings, settings
+from app.models import RefreshToken
+
+logger = logging.getLogger("maintenance")
+
+# Jobs first run shortly after startup rather than a full interval later, so workers that restart
+# often still get to them.
+STARTUP_DELAY_SECONDS = 30.0
+
+
+@dataclass
+class PruneMetrics:
+    Runs: int = 0
+    Batches: int = 0
+    RowsPruned: int = 0
+    # Time inside delete statements and commits; the pauses between batches are not counted.
+    TotalDurationMs: float = 0.0
+    LastRunAt: datetime | None = None
+    LastRowsPruned: int = 0
+    LastDurationMs: float = 0.0
+    LastError: str | None = None
+
+
+refresh_token_prune_metrics = PruneMetrics()
+
+
+def _StaleRefreshTokenConditions(now: datetime) -> list[ColumnElement[bool]]:
+    # Pruned one condition at a time: each is a range on its own index, whereas SQLite plans
+    # the OR of the two as a table scan.
+    return [RefreshToken.ExpiresAt < now, RefreshToken.RevokedAt.isnot(None)]
+
+
+async def DeleteRefreshTokenBatch(db: AsyncSession, condition: ColumnElement[bool], batch_size: int) -> int:
+    # Delete by primary key from a bounded id list so each transaction holds the SQLite write
+    # lock for one small batch.
+    stale_ids = select(RefreshToken.Id).where(condition).limit(batch_size)
+    result = await db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.Id.in_(stale_ids.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def PruneRefreshTokens(
+    session_factory: async_sessionmaker,
+    metrics: PruneMetrics = refresh_token_prune_metrics,
+    config: Settings = settings,
+) -> int:
+    now = datetime.now(timezone.utc)
+    pruned = 0
+    busy = 0.0
+    batches_left = config.RefreshTokenPruneMaxBatches
+    try:
+        for condition in _StaleRefreshTokenConditions(now):
+            while batches_left > 0:
+                start = time.perf_counter()
+                async with session_factory() as db:
+                    deleted = await DeleteRefreshTokenBatch(db, condition, config.RefreshTokenPruneBatchSize)
+                busy += time.perf_counter() - start
+                batches_left -= 1
+                metrics.Batches += 1
+                pruned += deleted
+                if deleted < config.RefreshTokenPruneBatchSize:
+                    break
+                # Let queued writers take the lock before the next batch.
+                await asyncio.sleep(config.RefreshTokenPrunePauseMs / 1000)
+        metrics.LastError = None
+    except Exception as exc:
+        metrics.LastError = repr(exc)
+        raise
+    finally:
+        metrics.Runs += 1
+        metrics.RowsPruned += pruned
+        metrics.TotalDurationMs += busy * 1000
+        metrics.LastRunAt = now
+        metrics.LastRowsPruned = pruned
+        metrics.LastDurationMs = busy * 1000
+    if pruned:
+        logger.info("Pruned %s refresh tokens in %.1f ms", pruned, busy * 1000)
+    return pruned
+
+
+class MaintenanceScheduler:
+    # Runs each job on its own asyncio task in this process. With several workers every worker
+    # runs the jobs; they must be safe to overlap (deletes of already-deleted rows are no-ops).
+    def __init__(self, startup_delay_seconds: float = STARTUP_DELAY_SECONDS) -> None:
+        self._startup_delay_seconds = startup_delay_seconds
+        self._jobs: list[tuple[str, float, Callable[[], Awaitable[object]]]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def Add(self, name: str, interval_seconds: float, job: Callable[[], Awaitable[object]]) -> None:
+        self._jobs.append((name, interval_seconds, job))
+
+    def Start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._Run(name, interval_seconds, job), name=f"maintenance:{name}")
+            for name, interval_seconds, job in self._jobs
+        ]
+
+    async def Stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _Run(self, name: str, interval_seconds: float, job: Callable[[], Awaitable[object]]) -> None:
+        await asyncio.sleep(min(self._startup_delay_seconds, interval_seconds))
+        while True:
+            try:
+                await job()
+            except Exception:
+                logger.exception("Maintenance job %s failed", name)
+            await asyncio.sleep(interval_seconds)
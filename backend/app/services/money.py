@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+
+import numpy as np
+
+# Integer-cents representation for the services layer.
+#
+# Amounts are carried as int cents and anything that does not land on a whole cent (per-day
+# rates, periods-per-year such as 52/3, super and tax rates) as an exact Fraction of a cent.
+# Rounding happens once, at the edge, with the rule _QuantizeMoney uses: ROUND_HALF_UP, so
+# a remainder of exactly half a cent moves away from zero (0.5 -> 1, -0.5 -> -1).
+#
+# The Decimal path rounds every intermediate result to 28 significant digits before the final
+# quantize; the exact path does not. Away from a half-cent tie the exact value is at least
+# 1/denominator of a cent from the rounding boundary, far beyond the 28th digit, so both paths
+# give the same cents. On an exact tie reached through a non-terminating step (365/7 periods,
+# a per-day division, 1 + super rate) the Decimal chain ends one unit in the 28th digit to
+# either side of the half cent, so the true tie says nothing about which way it rounded.
+# The cents functions therefore detect exact ties (IsHalfCentTie) and take that figure from
+# the Decimal path instead: every cents figure equals ToCents() of the Decimal figure.
+# tests/test_money.py checks that on a corpus with constructed ties.
+
+
+def ToCents(amount: Decimal) -> int:
+    return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def FromCents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def RoundHalfUp(numerator: int, denominator: int = 1) -> int:
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def RoundCents(value: Fraction) -> int:
+    return RoundHalfUp(value.numerator, value.denominator)
+
+
+def IsHalfCentTie(value: Fraction) -> bool:
+    # In lowest terms a whole number of cents plus exactly one half has denominator 2.
+    return value.denominator == 2
+
+
+def BatchHalfTies(numerators: np.ndarray, denominator: int | np.ndarray) -> np.ndarray:
+    # Rows where numerator / denominator is exactly a whole number plus one half.
+    return 2 * (np.abs(np.asarray(numerators, dtype=np.int64)) % denominator) == denominator
+
+
+def BatchRoundHalfUp(numerators: np.ndarray, denominator: int | np.ndarray) -> np.ndarray:
+    # Same rule as RoundHalfUp on int64 arrays; denominators must be positive and callers keep
+    # numerators well inside int64.
+    numerators = np.asarray(numerators, dtype=np.int64)
+    magnitude = np.abs(numerators)
+    quotient, remainder = np.divmod(magnitude, denominator)
+    quotient += 2 * remainder >= denominator
+    return np.where(numerators < 0, -quotient, quotient)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Expense
+
+# Expense.DisplayOrder holds sparse rank keys RANK_GAP apart, so a move takes the midpoint of its
+# new neighbours and writes one row. About log2(RANK_GAP) moves into the same slot use up the gap;
+# only then is the household renumbered. Ranks stay within a 32-bit integer for Postgres.
+RANK_GAP = 1024
+RANK_MIN = -(2**31)
+RANK_MAX = 2**31 - 1
+
+
+def RankBetween(lower: int | None, upper: int | None) -> int | None:
+    # Returns None when there is no free rank between the bounds and the household must be
+    # renumbered first.
+    if lower is None and upper is None:
+        return RANK_GAP
+    if upper is None:
+        rank = lower + RANK_GAP
+    elif lower is None:
+        rank = upper - RANK_GAP
+    elif upper - lower < 2:
+        return None
+    else:
+        rank = lower + (upper - lower) // 2
+    return rank if RANK_MIN <= rank <= RANK_MAX else None
+
+
+def NextExpenseRank(household_id: int):
+    # Evaluated inside the INSERT, so appending needs no separate max() round trip.
+    return (
+        select(func.coalesce(func.max(Expense.DisplayOrder), 0) + RANK_GAP)
+        .where(Expense.HouseholdId == household_id)
+        .scalar_subquery()
+    )
+
+
+async def WriteExpenseRanks(db: AsyncSession, expense_ids: list[int]) -> None:
+    # Bulk UPDATE by primary key; callers scope expense_ids to one household.
+    if expense_ids:
+        await db.execute(
+            update(Expense),
+            [{"Id": expense_id, "DisplayOrder": (index + 1) * RANK_GAP} for index, expense_id in enumerate(expense_ids)],
+        )
+
+
+async def RenormalizeExpenseRanks(db: AsyncSession, household_id: int) -> None:
+    expense_ids = (
+        await db.scalars(
+            select(Expense.Id)
+            .where(Expense.HouseholdId == household_id)
+            .order_by(Expense.DisplayOrder.asc(), Expense.CreatedAt.desc())
+        )
+    ).all()
+    await WriteExpenseRanks(db, list(expense_ids))
@@ -1,8 +1,26 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Sequence
 import calendar
+import math
+
+import numpy as np
+
+from app.services.frequencies import EveryMonths, Frequency, GetFrequency
+from app.services.money import (
+    BatchHalfTies,
+    BatchRoundHalfUp,
+    FromCents,
+    IsHalfCentTie,
+    RoundHalfUp,
+    ToCents,
+)
 
 
 def _days_in_month(year: int, month: int) -> int:
@@ -29,49 +47,126 @@ def FinancialYearRange(today: date, start_month: int, start_day: int) -> tuple[d
     return start, end
 
 
+@dataclass(frozen=True)
+class FiscalContext:
+    Today: date
+    StartDate: date
+    EndDate: date
+
+
+def BuildFiscalContext(as_of: date, start_month: int, start_day: int) -> FiscalContext:
+    start, end = FinancialYearRange(as_of, start_month, start_day)
+    return FiscalContext(Today=as_of, StartDate=start, EndDate=end)
+
+
+def _schedule_frequency(frequency: str) -> Frequency:
+    compiled = GetFrequency(frequency)
+    if compiled is None or not compiled.IsSchedulable:
+        raise ValueError(f"Unsupported frequency: {frequency}")
+    return compiled
+
+
+def _nth_weekday(year: int, month: int, weekday: int, week_of_month: int) -> date:
+    if week_of_month < 0:
+        last_day = _days_in_month(year, month)
+        last = date(year, month, last_day)
+        return date(year, month, last_day - (last.weekday() - weekday) % 7)
+    first = date(year, month, 1)
+    return date(year, month, 1 + (weekday - first.weekday()) % 7 + 7 * (week_of_month - 1))
+
+
 def _advance(current: date, frequency: str) -> date:
-    freq = frequency.lower()
-    if freq == "weekly":
-        return current + timedelta(days=7)
-    if freq == "fortnightly":
-        return current + timedelta(days=14)
-    if freq == "monthly":
-        return AddMonths(current, 1)
-    if freq == "quarterly":
-        return AddMonths(current, 3)
-    if freq == "yearly":
-        return AddYears(current, 1)
-    raise ValueError(f"Unsupported frequency: {frequency}")
+    step = _schedule_frequency(frequency)
+    if step.Days:
+        return current + timedelta(days=step.Days)
+    if step.Weekday is not None:
+        year, month = divmod(_month_index(current) + step.Months, 12)
+        return _nth_weekday(year, month + 1, step.Weekday, step.WeekOfMonth)
+    return AddMonths(current, step.Months)
 
 
-def GenerateOccurrences(
+def _month_index(value: date) -> int:
+    return value.year * 12 + value.month - 1
+
+
+GREGORIAN_CYCLE_MONTHS = 400 * 12
+
+
+def _clamped_day(first_date: date, months: int, index: int) -> int:
+    # Repeated AddMonths calls keep the smallest day seen so far (Jan 31 -> Feb 28 -> Mar 28),
+    # so the day after `index` steps is the minimum month length visited. The Gregorian
+    # calendar repeats every 400 years, so the visited (month, leap year) pairs repeat every
+    # GREGORIAN_CYCLE_MONTHS / gcd(months, GREGORIAN_CYCLE_MONTHS) steps, which bounds the scan.
+    day = first_date.day
+    if day <= 28:
+        return day
+    base = _month_index(first_date)
+    cycle = GREGORIAN_CYCLE_MONTHS // math.gcd(months, GREGORIAN_CYCLE_MONTHS)
+    for step in range(1, min(index, cycle) + 1):
+        year, month = divmod(base + months * step, 12)
+        day = min(day, _days_in_month(year, month + 1))
+        if day == 28:
+            break
+    return day
+
+
+def _occurrence_at(first_date: date, frequency: str, index: int, due_day: int = 0) -> date:
+    step = _schedule_frequency(frequency)
+    # A fixed due day snaps month-stepped occurrences to that day, the first one included.
+    fixed_day = bool(due_day and step.Months)
+    if index == 0 and not fixed_day:
+        return first_date
+    if step.Days:
+        return first_date + timedelta(days=step.Days * index)
+    year, month = divmod(_month_index(first_date) + step.Months * index, 12)
+    if step.Weekday is not None and index > 0:
+        return _nth_weekday(year, month + 1, step.Weekday, step.WeekOfMonth)
+    day = due_day if fixed_day else _clamped_day(first_date, step.Months, index)
+    return date(year, month + 1, min(day, _days_in_month(year, month + 1)))
+
+
+def _first_index_on_or_after(first_date: date, frequency: str, target: date, due_day: int = 0) -> int:
+    if target <= first_date:
+        return 0
+    step = _schedule_frequency(frequency)
+    if step.Days:
+        return -(-(target - first_date).days // step.Days)
+    index = max(0, -(-(_month_index(target) - _month_index(first_date)) // step.Months))
+    if _occurrence_at(first_date, frequency, index, due_day) < target:
+        index += 1
+    return index
+
+
+def IterOccurrences(
     first_date: date,
     frequency: str,
     range_start: date,
-    range_end: date,
+    range_end: date | None,
     end_date: date | None,
-) -> list[date]:
-    occurrences: list[date] = []
-    current = first_date
-
-    safety = 0
-    while current < range_start:
-        current = _advance(current, frequency)
-        safety += 1
-        if safety > 10000:
-            break
+    due_day: int = 0,
+) -> Iterator[date]:
+    index = _first_index_on_or_after(first_date, frequency, range_start, due_day)
+    current = _occurrence_at(first_date, frequency, index, due_day)
 
-    while current <= range_end:
+    while range_end is None or current <= range_end:
         if end_date and current > end_date:
-            break
-        if current >= range_start:
-            occurrences.append(current)
-        current = _advance(current, frequency)
-        safety += 1
-        if safety > 10000:
-            break
+            return
+        yield current
+        if due_day:
+            index += 1
+            current = _occurrence_at(first_date, frequency, index, due_day)
+        else:
+            current = _advance(current, frequency)
+
 
-    return occurrences
+def GenerateOccurrences(
+    first_date: date,
+    frequency: str,
+    range_start: date,
+    range_end: date,
+    end_date: date | None,
+) -> list[date]:
+    return list(IterOccurrences(first_date, frequency, range_start, range_end, end_date))
 
 
 def LastNextOccurrence(
@@ -82,21 +177,32 @@ def LastNextOccurrence(
 ) -> tuple[date | None, date | None]:
     if end_date and end_date < first_date:
         return None, None
-    current = first_date
-    last = None
-    safety = 0
-    while current < today:
-        if end_date and current > end_date:
-            return last, None
-        last = current
-        current = _advance(current, frequency)
-        safety += 1
-        if safety > 10000:
-            break
+    next_index = _first_index_on_or_after(first_date, frequency, today)
+    current = _occurrence_at(first_date, frequency, next_index)
+
+    last_index = next_index - 1
+    if end_date and end_date < today:
+        last_index = _first_index_on_or_after(first_date, frequency, end_date + timedelta(days=1)) - 1
+    last = _occurrence_at(first_date, frequency, last_index) if last_index >= 0 else None
 
     if end_date and current > end_date:
         return last, None
-    return last if last else None, current
+    return last, current
+
+
+_BREAKDOWN_CACHE_SIZE = 4096
+
+
+def _periods_per_year(frequency: Frequency | None) -> Decimal:
+    if frequency is None or frequency.WorkUnit is not None:
+        return Decimal(0)
+    return frequency.PeriodsPerYear
+
+
+def _exact_periods_per_year(frequency: Frequency | None) -> Fraction:
+    if frequency is None or frequency.WorkUnit is not None:
+        return Fraction(0)
+    return frequency.ExactPeriodsPerYear
 
 
 def AnnualizedBreakdown(
@@ -105,15 +211,7 @@ def AnnualizedBreakdown(
     range_start: date,
     range_end: date,
 ) -> dict[str, Decimal]:
-    freq = frequency.lower()
-    multiplier = {
-        "weekly": Decimal(52),
-        "fortnightly": Decimal(26),
-        "monthly": Decimal(12),
-        "quarterly": Decimal(4),
-        "yearly": Decimal(1),
-    }.get(freq, Decimal(0))
-    per_year = amount * multiplier
+    per_year = amount * _periods_per_year(GetFrequency(frequency))
     days = (range_end - range_start).days + 1
     if days <= 0:
         return {
@@ -132,3 +230,375 @@ def AnnualizedBreakdown(
         "PerMonth": per_year / Decimal(12),
         "PerYear": per_year,
     }
+
+
+# Shared by every BatchAnnualizedBreakdown call, so list routes reuse breakdowns across rows
+# and requests. Keyed on the amount's text rather than the Decimal itself: 10.0 and 10.00
+# compare equal but produce differently scaled results.
+@lru_cache(maxsize=_BREAKDOWN_CACHE_SIZE)
+def _cached_breakdown(
+    amount_text: str,
+    frequency_name: str,
+    range_start: date,
+    range_end: date,
+) -> Mapping[str, Decimal]:
+    return MappingProxyType(
+        AnnualizedBreakdown(Decimal(amount_text), frequency_name, range_start, range_end)
+    )
+
+
+_BREAKDOWN_KEYS = ("PerDay", "PerWeek", "PerFortnight", "PerMonth", "PerYear")
+
+
+def PerDayRateCents(
+    amount_cents: int,
+    frequency: str,
+    range_start: date,
+    range_end: date,
+) -> Fraction:
+    days = (range_end - range_start).days + 1
+    if days <= 0:
+        return Fraction(0)
+    return amount_cents * _exact_periods_per_year(GetFrequency(frequency)) / days
+
+
+def _breakdown_cents_from_decimal(
+    amount_cents: int,
+    frequency: str,
+    range_start: date,
+    range_end: date,
+) -> dict[str, int]:
+    decimal = _cached_breakdown(str(FromCents(amount_cents)), frequency, range_start, range_end)
+    return {key: ToCents(decimal[key]) for key in _BREAKDOWN_KEYS}
+
+
+# Integer-cents counterpart of AnnualizedBreakdown: each figure is the exact rate rounded once
+# with RoundHalfUp (see app.services.money). Exact half-cent ties take the Decimal figure, so
+# every value matches ToCents() of the AnnualizedBreakdown figure.
+@lru_cache(maxsize=_BREAKDOWN_CACHE_SIZE)
+def AnnualizedBreakdownCents(
+    amount_cents: int,
+    frequency: str,
+    range_start: date,
+    range_end: date,
+) -> Mapping[str, int]:
+    days = (range_end - range_start).days + 1
+    if days <= 0:
+        return MappingProxyType(dict.fromkeys(_BREAKDOWN_KEYS, 0))
+    periods = _exact_periods_per_year(GetFrequency(frequency))
+    per_year = amount_cents * periods.numerator
+    exact = {
+        "PerDay": (per_year, periods.denominator * days),
+        "PerWeek": (per_year * 7, periods.denominator * days),
+        "PerFortnight": (per_year * 14, periods.denominator * days),
+        "PerMonth": (per_year, periods.denominator * 12),
+        "PerYear": (per_year, periods.denominator),
+    }
+    if any(IsHalfCentTie(Fraction(*ratio)) for ratio in exact.values()):
+        return MappingProxyType(_breakdown_cents_from_decimal(amount_cents, frequency, range_start, range_end))
+    return MappingProxyType({key: RoundHalfUp(*ratio) for key, ratio in exact.items()})
+
+
+@dataclass(frozen=True)
+class FrequencyColumns:
+    Names: np.ndarray
+    StepDays: np.ndarray
+    StepMonths: np.ndarray
+    Weekdays: np.ndarray
+    WeekOfMonth: np.ndarray
+    Schedulable: np.ndarray
+
+    def Take(self, rows: np.ndarray) -> FrequencyColumns:
+        return FrequencyColumns(
+            Names=self.Names[rows],
+            StepDays=self.StepDays[rows],
+            StepMonths=self.StepMonths[rows],
+            Weekdays=self.Weekdays[rows],
+            WeekOfMonth=self.WeekOfMonth[rows],
+            Schedulable=self.Schedulable[rows],
+        )
+
+
+def FrequencyColumnsFor(frequencies: Sequence[Frequency | None]) -> FrequencyColumns:
+    # Unknown frequencies (None) get no step and an empty name, like a one-off.
+    return FrequencyColumns(
+        Names=np.array([item.Name if item else "" for item in frequencies], dtype=object),
+        StepDays=np.array([item.Days if item else 0 for item in frequencies], dtype=np.int64),
+        StepMonths=np.array([item.Months if item else 0 for item in frequencies], dtype=np.int64),
+        Weekdays=np.array(
+            [-1 if item is None or item.Weekday is None else item.Weekday for item in frequencies],
+            dtype=np.int64,
+        ),
+        WeekOfMonth=np.array([item.WeekOfMonth if item else 0 for item in frequencies], dtype=np.int64),
+        Schedulable=np.array([bool(item and item.IsSchedulable) for item in frequencies], dtype=bool),
+    )
+
+
+def CompileFrequencies(frequencies: Iterable[str]) -> FrequencyColumns:
+    return FrequencyColumnsFor([GetFrequency(frequency) for frequency in frequencies])
+
+
+def _batch_days_in_month(month_index: np.ndarray) -> np.ndarray:
+    months = month_index.astype("datetime64[M]")
+    return ((months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")).astype(np.int64)
+
+
+def _batch_occurrence_at(
+    first_dates: np.ndarray,
+    columns: FrequencyColumns,
+    indexes: np.ndarray,
+    due_days: np.ndarray | None = None,
+) -> np.ndarray:
+    step_months = columns.StepMonths
+    first_months = first_dates.astype("datetime64[M]")
+    base = first_months.astype(np.int64)
+    day = (first_dates - first_months.astype("datetime64[D]")).astype(np.int64) + 1
+
+    # Same running clamp as _clamped_day, evaluated one step at a time across every row.
+    # Rows with a fixed due day skip it and clamp to each target month independently.
+    clamp = (day > 28) & (step_months > 0) & (indexes > 0) & (columns.Weekdays < 0)
+    if due_days is not None:
+        day = np.where(due_days > 0, due_days, day)
+        clamp &= due_days <= 0
+    if clamp.any():
+        limit = np.zeros_like(indexes)
+        limit[clamp] = np.minimum(
+            indexes[clamp], GREGORIAN_CYCLE_MONTHS // np.gcd(step_months[clamp], GREGORIAN_CYCLE_MONTHS)
+        )
+        for step in range(1, int(limit.max()) + 1):
+            # Rows already down to 28 cannot clamp any further.
+            active = (limit >= step) & (day > 28)
+            if not active.any():
+                break
+            visited = _batch_days_in_month(base[active] + step_months[active] * step)
+            day[active] = np.minimum(day[active], visited)
+
+    target = base + step_months * indexes
+    month_start = target.astype("datetime64[M]").astype("datetime64[D]")
+    month_days = _batch_days_in_month(target)
+    by_month = month_start + (np.minimum(day, month_days) - 1)
+
+    pinned = (columns.Weekdays >= 0) & (indexes > 0)
+    if pinned.any():
+        # 1970-01-01 was a Thursday, so (days + 3) % 7 numbers weekdays from Monday = 0.
+        first_weekday = (month_start.astype(np.int64) + 3) % 7
+        nth = 1 + (columns.Weekdays - first_weekday) % 7 + 7 * (columns.WeekOfMonth - 1)
+        last = month_days - (first_weekday + month_days - 1 - columns.Weekdays) % 7
+        weekday_day = np.where(columns.WeekOfMonth < 0, last, nth)
+        by_month = np.where(pinned, month_start + (weekday_day - 1), by_month)
+
+    by_day = first_dates + columns.StepDays * indexes
+    return np.where(step_months > 0, by_month, by_day)
+
+
+def _batch_first_index_on_or_after(
+    first_dates: np.ndarray,
+    columns: FrequencyColumns,
+    targets: np.ndarray,
+    due_days: np.ndarray | None = None,
+) -> np.ndarray:
+    step_days = columns.StepDays
+    step_months = columns.StepMonths
+    ahead = targets > first_dates
+    # Rows without a step only occur once, so anything after the first date is past the end.
+    indexes = (ahead & (step_days == 0) & (step_months == 0)).astype(np.int64)
+
+    by_day = ahead & (step_days > 0)
+    gap_days = (targets[by_day] - first_dates[by_day]).astype(np.int64)
+    indexes[by_day] = -(-gap_days // step_days[by_day])
+
+    by_month = ahead & (step_months > 0)
+    gap_months = (
+        targets[by_month].astype("datetime64[M]") - first_dates[by_month].astype("datetime64[M]")
+    ).astype(np.int64)
+    indexes[by_month] = np.maximum(0, -(-gap_months // step_months[by_month]))
+    occurrences = _batch_occurrence_at(first_dates, columns, indexes, due_days)
+    indexes[by_month & (occurrences < targets)] += 1
+    return indexes
+
+
+_CADENCE_MONTHS: dict[str, int] = {
+    "monthly": 1,
+    "quarterly": 3,
+    "yearly": 12,
+    "everynyears": 12,
+}
+
+
+def ExpenseFrequency(
+    cadence: str | None,
+    interval: int | None,
+    frequency: str | None,
+) -> Frequency | None:
+    if cadence:
+        key = cadence.lower()
+        if key == "oneoff":
+            return GetFrequency("oneoff")
+        if key in _CADENCE_MONTHS:
+            return EveryMonths(_CADENCE_MONTHS[key] * max(interval or 1, 1))
+    compiled = GetFrequency(frequency)
+    if compiled is None or not compiled.IsSchedulable:
+        return None
+    return compiled
+
+
+def ExpenseAnchor(
+    next_due_date: date | None,
+    month: int | None,
+    day_of_month: int | None,
+    today: date,
+) -> tuple[date | None, int]:
+    # Returns the first due date and the day of month later due dates snap back to
+    # (0 keeps the running clamp), or None when there is nothing to anchor the schedule to.
+    # DayOfMonth only wins when it agrees with NextDueDate. Out-of-range Month/DayOfMonth
+    # values saved before the schema checked them count as missing rather than raising.
+    if day_of_month and not 1 <= day_of_month <= 31:
+        day_of_month = None
+    if next_due_date is None:
+        if not day_of_month or (month and not 1 <= month <= 12):
+            return None, 0
+        return date(today.year, month or today.month, 1), day_of_month
+    if day_of_month and min(
+        day_of_month, _days_in_month(next_due_date.year, next_due_date.month)
+    ) == next_due_date.day:
+        return next_due_date, day_of_month
+    return next_due_date, 0
+
+
+def BatchLastNextOccurrence(
+    first_dates: np.ndarray,
+    columns: FrequencyColumns,
+    today: date,
+    end_dates: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    first_dates = np.asarray(first_dates, dtype="datetime64[D]")
+    end_dates = np.asarray(end_dates, dtype="datetime64[D]")
+    not_a_time = np.datetime64("NaT", "D")
+    today_value = np.datetime64(today, "D")
+
+    has_end = ~np.isnat(end_dates)
+    active = ~(has_end & (end_dates < first_dates))
+    first_dates = np.where(active, first_dates, today_value)
+    if (~columns.Schedulable & (first_dates < today_value)).any():
+        raise ValueError("Unsupported frequency in schedule batch")
+
+    todays = np.full(first_dates.shape, today_value)
+    next_index = _batch_first_index_on_or_after(first_dates, columns, todays)
+    next_dates = _batch_occurrence_at(first_dates, columns, next_index)
+
+    ended = has_end & (end_dates < today_value)
+    limits = np.where(ended, end_dates + 1, todays)
+    last_index = _batch_first_index_on_or_after(first_dates, columns, limits) - 1
+    last_dates = _batch_occurrence_at(first_dates, columns, np.maximum(last_index, 0))
+
+    last_dates = np.where(active & (last_index >= 0), last_dates, not_a_time)
+    next_dates = np.where(active & ~(has_end & (next_dates > end_dates)), next_dates, not_a_time)
+    return last_dates, next_dates
+
+
+def BatchNextOccurrence(
+    first_dates: np.ndarray,
+    columns: FrequencyColumns,
+    target: date,
+    due_days: np.ndarray | None = None,
+) -> np.ndarray:
+    # First occurrence on or after `target`; NaT for one-off rows that have already passed.
+    first_dates = np.asarray(first_dates, dtype="datetime64[D]")
+    targets = np.full(first_dates.shape, np.datetime64(target, "D"))
+    indexes = _batch_first_index_on_or_after(first_dates, columns, targets, due_days)
+    dates = _batch_occurrence_at(first_dates, columns, indexes, due_days)
+    one_off = (columns.StepDays == 0) & (columns.StepMonths == 0)
+    return np.where(one_off & (indexes > 0), np.datetime64("NaT", "D"), dates)
+
+
+def BatchOccurrences(
+    first_dates: np.ndarray,
+    columns: FrequencyColumns,
+    range_start: date,
+    range_end: date,
+    end_dates: np.ndarray,
+    due_days: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Rows with neither a day nor a month step are one-off and occur only on their first date.
+    first_dates = np.asarray(first_dates, dtype="datetime64[D]")
+    end_dates = np.asarray(end_dates, dtype="datetime64[D]")
+    starts = np.full(first_dates.shape, np.datetime64(range_start, "D"))
+    limits = np.full(first_dates.shape, np.datetime64(range_end, "D"))
+    limits = np.where(np.isnat(end_dates), limits, np.minimum(limits, end_dates)) + 1
+
+    start_index = _batch_first_index_on_or_after(first_dates, columns, starts, due_days)
+    stop_index = _batch_first_index_on_or_after(first_dates, columns, limits, due_days)
+    one_off = (columns.StepDays == 0) & (columns.StepMonths == 0)
+    stop_index = np.where(one_off, np.minimum(stop_index, 1), stop_index)
+    counts = np.maximum(stop_index - start_index, 0)
+
+    rows = np.repeat(np.arange(first_dates.size), counts)
+    offsets = np.arange(rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    dates = _batch_occurrence_at(
+        first_dates[rows],
+        columns.Take(rows),
+        start_index[rows] + offsets,
+        None if due_days is None else due_days[rows],
+    )
+    return rows, dates
+
+
+def BatchAnnualizedBreakdown(
+    amounts: Sequence[Decimal],
+    columns: FrequencyColumns,
+    range_start: date,
+    range_end: date,
+) -> dict[str, np.ndarray]:
+    # Rows sharing an (amount, frequency) pair are computed once through the breakdown cache
+    # and fanned back out; values stay Decimal so they match AnnualizedBreakdown exactly.
+    unique: dict[tuple[str, str], int] = {}
+    inverse = np.array(
+        [
+            unique.setdefault((str(amount), name), len(unique))
+            for amount, name in zip(amounts, columns.Names.tolist())
+        ],
+        dtype=np.int64,
+    )
+    entries = [
+        _cached_breakdown(amount_text, name, range_start, range_end) for amount_text, name in unique
+    ]
+    return {
+        key: np.array([entry[key] for entry in entries], dtype=object)[inverse]
+        for key in _BREAKDOWN_KEYS
+    }
+
+
+def BatchAnnualizedBreakdownCents(
+    amount_cents: np.ndarray,
+    columns: FrequencyColumns,
+    range_start: date,
+    range_end: date,
+) -> dict[str, np.ndarray]:
+    # Vectorised AnnualizedBreakdownCents. Periods per year are small ratios (365/n at most),
+    # so amount * numerator * 14 stays inside int64 for any amount below about 10^13 cents.
+    amount_cents = np.asarray(amount_cents, dtype=np.int64)
+    days = (range_end - range_start).days + 1
+    if days <= 0:
+        return {key: np.zeros(amount_cents.size, dtype=np.int64) for key in _BREAKDOWN_KEYS}
+    names = columns.Names.tolist()
+    ratios = {name: _exact_periods_per_year(GetFrequency(name)) for name in set(names)}
+    numerators = np.array([ratios[name].numerator for name in names], dtype=np.int64)
+    denominators = np.array([ratios[name].denominator for name in names], dtype=np.int64)
+    per_year = amount_cents * numerators
+    exact = {
+        "PerDay": (per_year, denominators * days),
+        "PerWeek": (per_year * 7, denominators * days),
+        "PerFortnight": (per_year * 14, denominators * days),
+        "PerMonth": (per_year, denominators * 12),
+        "PerYear": (per_year, denominators),
+    }
+    result = {key: BatchRoundHalfUp(*ratio) for key, ratio in exact.items()}
+    # Rows with an exact half-cent tie in any figure take the Decimal figures (see money.py).
+    ties = np.zeros(amount_cents.size, dtype=bool)
+    for ratio in exact.values():
+        ties |= BatchHalfTies(*ratio)
+    for row in np.flatnonzero(ties).tolist():
+        decimal = _breakdown_cents_from_decimal(int(amount_cents[row]), names[row], range_start, range_end)
+        for key in _BREAKDOWN_KEYS:
+            result[key][row] = decimal[key]
+    return result
@@ -1,11 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import astuple, dataclass
+from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+from functools import lru_cache
+import hashlib
+from itertools import islice
+import math
+
+import numpy as np
+from typing import Any, Callable, Iterable, Iterator
+
+from app.schemas import (
+    TaxCalculatorRequest,
+    TaxCalculatorResponse,
+    TaxPeriodAmounts,
+    TaxSolveGrossRequest,
+    TaxSolveGrossResponse,
+)
+from app.services.frequencies import GetFrequency
+from app.services.money import FromCents, IsHalfCentTie, RoundCents, ToCents
+from app.services.tax_data import GetTaxYearByLabel, TaxYear
 
-from app.schemas import TaxCalculatorRequest, TaxCalculatorResponse, TaxPeriodAmounts
-from app.services.tax_data import GetTaxYearByLabel, TaxBracket, TaxYear
+# The annual figures are computed once by _AnnualFigures, either on Decimals as given
+# (EstimateTax) or on exact Fractions (EstimateTaxCents).
+_Number = Callable[[Decimal], Any]
 
 
-def _NormalizeFrequency(value: str) -> str:
-    return (value or "").strip().lower()
+def _AsIs(value: Decimal) -> Decimal:
+    return value
+
+
+def _NumberFor(exact: bool) -> _Number:
+    return Fraction if exact else _AsIs
 
 
 def _QuantizeMoney(value: Decimal) -> Decimal:
@@ -13,25 +41,26 @@ def _QuantizeMoney(value: Decimal) -> Decimal:
 
 
 def _AnnualizeAmount(
-    amount: Decimal,
+    amount: Any,
     frequency: str,
-    hours_per_week: Decimal,
-    days_per_week: Decimal,
-) -> Decimal:
-    freq = _NormalizeFrequency(frequency)
-    if freq == "hourly":
-        return amount * hours_per_week * Decimal("52")
-    if freq == "daily":
-        return amount * days_per_week * Decimal("52")
-    if freq == "weekly":
-        return amount * Decimal("52")
-    if freq == "fortnightly":
-        return amount * Decimal("26")
-    if freq == "monthly":
-        return amount * Decimal("12")
-    if freq == "quarterly":
-        return amount * Decimal("4")
-    return amount
+    hours_per_week: Any,
+    days_per_week: Any,
+    exact: bool = False,
+) -> Any:
+    compiled = GetFrequency(frequency)
+    if compiled is None or compiled.PeriodsPerYear == 0:
+        return amount
+    periods_per_year = compiled.ExactPeriodsPerYear if exact else compiled.PeriodsPerYear
+    if compiled.WorkUnit == "hours":
+        return amount * hours_per_week * periods_per_year
+    if compiled.WorkUnit == "days":
+        return amount * days_per_week * periods_per_year
+    return amount * periods_per_year
+
+
+def AnnualizeIncome(amount: Decimal, frequency: str) -> Decimal:
+    # Same annualisation the calculator applies to a salary, with its default 38 hours / 5 days.
+    return _AnnualizeAmount(amount, frequency, Decimal("38"), Decimal("5"))
 
 
 def _PeriodAmounts(annual_amount: Decimal) -> TaxPeriodAmounts:
@@ -43,63 +72,430 @@ def _PeriodAmounts(annual_amount: Decimal) -> TaxPeriodAmounts:
     )
 
 
-def _CalculateIncomeTax(annual_taxable: Decimal, tax_year: TaxYear) -> Decimal:
-    taxable = max(annual_taxable, Decimal("0"))
-    for bracket in reversed(tax_year.Brackets):
-        if taxable > bracket.Threshold:
-            return bracket.BaseTax + (taxable - bracket.Threshold) * bracket.Rate
-    return Decimal("0")
+# Brackets converted to the working number type once per tax year, in threshold order, and
+# shared by every estimate against that year.
+@lru_cache(maxsize=32)
+def _CompiledBrackets(tax_year: TaxYear, exact: bool) -> tuple[tuple[Any, Any, Any], ...]:
+    number = _NumberFor(exact)
+    return tuple(
+        (number(bracket.Threshold), number(bracket.BaseTax), number(bracket.Rate))
+        for bracket in tax_year.Brackets
+    )
 
 
-def EstimateTax(payload: TaxCalculatorRequest) -> TaxCalculatorResponse:
-    tax_year = GetTaxYearByLabel(payload.TaxYear)
-    hours_per_week = payload.HoursPerWeek or Decimal("38")
-    days_per_week = payload.DaysPerWeek or Decimal("5")
+def _CalculateIncomeTax(annual_taxable: Any, tax_year: TaxYear, exact: bool = False) -> Any:
+    zero = _NumberFor(exact)(Decimal("0"))
+    taxable = max(annual_taxable, zero)
+    index = tax_year.BracketIndex(taxable)
+    if index < 0:
+        return zero
+    threshold, base_tax, rate = _CompiledBrackets(tax_year, exact)[index]
+    return base_tax + (taxable - threshold) * rate
+
+
+@dataclass(frozen=True)
+class _AnnualTaxFigures:
+    SalaryAnnual: Any
+    GrossAnnual: Any
+    TaxableAnnual: Any
+    SuperAnnual: Any
+    NovatedLeaseAnnual: Any
+    IncomeTaxAnnual: Any
+    MedicareAnnual: Any
+    MlsAnnual: Any
+    NetAnnual: Any
+
+
+def _AnnualFigures(payload: TaxCalculatorRequest, tax_year: TaxYear, exact: bool) -> _AnnualTaxFigures:
+    number = _NumberFor(exact)
+    zero = number(Decimal("0"))
+    hours_per_week = number(payload.HoursPerWeek or Decimal("38"))
+    days_per_week = number(payload.DaysPerWeek or Decimal("5"))
 
     salary_annual = _AnnualizeAmount(
-        payload.SalaryAmount,
+        number(payload.SalaryAmount),
         payload.SalaryFrequency,
         hours_per_week,
         days_per_week,
+        exact,
     )
     novated_annual = _AnnualizeAmount(
-        payload.NovatedLeaseAmount or Decimal("0"),
+        number(payload.NovatedLeaseAmount or Decimal("0")),
         payload.NovatedLeaseFrequency or "Yearly",
         hours_per_week,
         days_per_week,
+        exact,
     )
-    super_rate = (payload.SuperRate or Decimal("0")) / Decimal("100")
+    super_rate = number(payload.SuperRate or Decimal("0")) / number(Decimal("100"))
     includes_super = payload.IncludesSuper
 
     if includes_super and super_rate > 0:
-        taxable_base = salary_annual / (Decimal("1") + super_rate)
+        taxable_base = salary_annual / (number(Decimal("1")) + super_rate)
         super_annual = salary_annual - taxable_base
     else:
         taxable_base = salary_annual
         super_annual = taxable_base * super_rate
 
-    taxable_income = max(taxable_base - novated_annual, Decimal("0"))
-    income_tax = _CalculateIncomeTax(taxable_income, tax_year)
-    medicare = taxable_income * tax_year.MedicareLevyRate
-    mls = Decimal("0") if payload.PrivateHealth else taxable_income * tax_year.MlsRate
+    taxable_income = max(taxable_base - novated_annual, zero)
+    income_tax = _CalculateIncomeTax(taxable_income, tax_year, exact)
+    medicare = taxable_income * number(tax_year.MedicareLevyRate)
+    mls = zero if payload.PrivateHealth else taxable_income * number(tax_year.MlsRate)
     net_annual = taxable_base - novated_annual - income_tax - medicare - mls
 
+    return _AnnualTaxFigures(
+        SalaryAnnual=salary_annual,
+        GrossAnnual=taxable_base,
+        TaxableAnnual=taxable_income,
+        SuperAnnual=super_annual,
+        NovatedLeaseAnnual=novated_annual,
+        IncomeTaxAnnual=income_tax,
+        MedicareAnnual=medicare,
+        MlsAnnual=mls,
+        NetAnnual=net_annual,
+    )
+
+
+def _EstimateTaxForYear(payload: TaxCalculatorRequest, tax_year: TaxYear) -> TaxCalculatorResponse:
+    figures = _AnnualFigures(payload, tax_year, exact=False)
+
     return TaxCalculatorResponse(
         TaxYear=tax_year.Label,
         IsEstimated=tax_year.IsEstimated,
-        SalaryAnnual=_QuantizeMoney(salary_annual),
-        GrossAnnual=_QuantizeMoney(taxable_base),
-        TaxableAnnual=_QuantizeMoney(taxable_income),
-        SuperAnnual=_QuantizeMoney(super_annual),
-        NovatedLeaseAnnual=_QuantizeMoney(novated_annual),
-        IncomeTaxAnnual=_QuantizeMoney(income_tax),
-        MedicareAnnual=_QuantizeMoney(medicare),
-        MlsAnnual=_QuantizeMoney(mls),
-        NetAnnual=_QuantizeMoney(net_annual),
-        Gross=_PeriodAmounts(taxable_base),
-        Net=_PeriodAmounts(net_annual),
-        IncomeTax=_PeriodAmounts(income_tax),
-        Medicare=_PeriodAmounts(medicare),
-        Mls=_PeriodAmounts(mls),
-        Super=_PeriodAmounts(super_annual),
+        SalaryAnnual=_QuantizeMoney(figures.SalaryAnnual),
+        GrossAnnual=_QuantizeMoney(figures.GrossAnnual),
+        TaxableAnnual=_QuantizeMoney(figures.TaxableAnnual),
+        SuperAnnual=_QuantizeMoney(figures.SuperAnnual),
+        NovatedLeaseAnnual=_QuantizeMoney(figures.NovatedLeaseAnnual),
+        IncomeTaxAnnual=_QuantizeMoney(figures.IncomeTaxAnnual),
+        MedicareAnnual=_QuantizeMoney(figures.MedicareAnnual),
+        MlsAnnual=_QuantizeMoney(figures.MlsAnnual),
+        NetAnnual=_QuantizeMoney(figures.NetAnnual),
+        Gross=_PeriodAmounts(figures.GrossAnnual),
+        Net=_PeriodAmounts(figures.NetAnnual),
+        IncomeTax=_PeriodAmounts(figures.IncomeTaxAnnual),
+        Medicare=_PeriodAmounts(figures.MedicareAnnual),
+        Mls=_PeriodAmounts(figures.MlsAnnual),
+        Super=_PeriodAmounts(figures.SuperAnnual),
+    )
+
+
+def EstimateTax(payload: TaxCalculatorRequest) -> TaxCalculatorResponse:
+    return _EstimateTaxForYear(payload, GetTaxYearByLabel(payload.TaxYear))
+
+
+_ESTIMATE_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class CachedEstimate:
+    Body: bytes
+    ETag: str
+
+
+def _NormalizeFrequency(value: str | None, default: str) -> str:
+    return " ".join((value or default).casefold().split())
+
+
+# Every response figure is quantized to the cent, so 95000 and 95000.00 (or "Weekly" and
+# "weekly") give byte-identical responses and can share one cache entry. Defaults are applied
+# here so explicit and omitted values coincide as well.
+def _EstimateCacheKey(payload: TaxCalculatorRequest) -> tuple[Any, ...]:
+    return (
+        payload.SalaryAmount.normalize(),
+        _NormalizeFrequency(payload.SalaryFrequency, ""),
+        payload.IncludesSuper,
+        (payload.SuperRate or Decimal("0")).normalize(),
+        payload.PrivateHealth,
+        (payload.NovatedLeaseAmount or Decimal("0")).normalize(),
+        _NormalizeFrequency(payload.NovatedLeaseFrequency, "Yearly"),
+        (payload.HoursPerWeek or Decimal("38")).normalize(),
+        (payload.DaysPerWeek or Decimal("5")).normalize(),
+        GetTaxYearByLabel(payload.TaxYear).Label,
+    )
+
+
+@lru_cache(maxsize=_ESTIMATE_CACHE_SIZE)
+def _CachedEstimate(key: tuple[Any, ...]) -> CachedEstimate:
+    (
+        salary_amount,
+        salary_frequency,
+        includes_super,
+        super_rate,
+        private_health,
+        novated_amount,
+        novated_frequency,
+        hours_per_week,
+        days_per_week,
+        tax_year_label,
+    ) = key
+    estimate = EstimateTax(
+        TaxCalculatorRequest(
+            SalaryAmount=salary_amount,
+            SalaryFrequency=salary_frequency,
+            IncludesSuper=includes_super,
+            SuperRate=super_rate,
+            PrivateHealth=private_health,
+            NovatedLeaseAmount=novated_amount,
+            NovatedLeaseFrequency=novated_frequency,
+            HoursPerWeek=hours_per_week,
+            DaysPerWeek=days_per_week,
+            TaxYear=tax_year_label,
+        )
+    )
+    body = estimate.model_dump_json().encode()
+    return CachedEstimate(Body=body, ETag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def CachedEstimateTax(payload: TaxCalculatorRequest) -> CachedEstimate:
+    return _CachedEstimate(_EstimateCacheKey(payload))
+
+
+ESTIMATE_BATCH_CHUNK = 500
+
+
+# Requests are taken ESTIMATE_BATCH_CHUNK at a time and grouped by tax year within the chunk, so
+# each group runs against one resolved year and its compiled bracket table. Results come back
+# in request order, a chunk at a time, so callers can stream them.
+def EstimateTaxBatch(payloads: Iterable[TaxCalculatorRequest]) -> Iterator[TaxCalculatorResponse]:
+    today = date.today()
+    tax_years: dict[str | None, TaxYear] = {}
+    remaining = iter(payloads)
+    while chunk := list(islice(remaining, ESTIMATE_BATCH_CHUNK)):
+        groups: dict[str, tuple[TaxYear, list[int]]] = {}
+        for index, payload in enumerate(chunk):
+            tax_year = tax_years.get(payload.TaxYear)
+            if tax_year is None:
+                tax_year = tax_years[payload.TaxYear] = GetTaxYearByLabel(payload.TaxYear, today)
+            groups.setdefault(tax_year.Label, (tax_year, []))[1].append(index)
+        results: list[TaxCalculatorResponse | None] = [None] * len(chunk)
+        for tax_year, indexes in groups.values():
+            for index in indexes:
+                results[index] = _EstimateTaxForYear(chunk[index], tax_year)
+        yield from results
+
+
+def _NetForTaxable(taxable: Fraction, tax_year: TaxYear, levy_rate: Fraction) -> Fraction:
+    return taxable - _CalculateIncomeTax(taxable, tax_year, exact=True) - taxable * levy_rate
+
+
+# Net pay is piecewise linear in taxable income: inside bracket i it is
+# taxable - (base + (taxable - threshold) * rate) - taxable * levies, so the bracket holding the
+# target is found from the net value at each threshold and solved directly.
+def _SolveTaxable(target_net: Fraction, tax_year: TaxYear, levy_rate: Fraction) -> Fraction:
+    if target_net <= 0:
+        return Fraction(0)
+    brackets = _CompiledBrackets(tax_year, True)
+    for index, (threshold, _, rate) in enumerate(brackets):
+        if index + 1 < len(brackets):
+            upper = brackets[index + 1][0]
+            if _NetForTaxable(upper, tax_year, levy_rate) < target_net:
+                continue
+        slope = 1 - rate - levy_rate
+        if slope <= 0:
+            break
+        return threshold + (target_net - _NetForTaxable(threshold, tax_year, levy_rate)) / slope
+    raise ValueError("Target net income is not reachable")
+
+
+def SolveGrossSalary(payload: TaxSolveGrossRequest) -> TaxSolveGrossResponse:
+    tax_year = GetTaxYearByLabel(payload.TaxYear)
+    hours_per_week = Fraction(payload.HoursPerWeek or Decimal("38"))
+    days_per_week = Fraction(payload.DaysPerWeek or Decimal("5"))
+    target_net = _AnnualizeAmount(
+        Fraction(payload.TargetNetAmount),
+        payload.TargetNetFrequency,
+        hours_per_week,
+        days_per_week,
+        exact=True,
+    )
+    novated_annual = _AnnualizeAmount(
+        Fraction(payload.NovatedLeaseAmount or Decimal("0")),
+        payload.NovatedLeaseFrequency or "Yearly",
+        hours_per_week,
+        days_per_week,
+        exact=True,
+    )
+    levy_rate = Fraction(tax_year.MedicareLevyRate)
+    if not payload.PrivateHealth:
+        levy_rate += Fraction(tax_year.MlsRate)
+
+    # Below the novated lease, taxable income is zero and net is simply gross minus the lease.
+    if target_net > 0:
+        taxable_base = _SolveTaxable(target_net, tax_year, levy_rate) + novated_annual
+    else:
+        taxable_base = max(target_net + novated_annual, Fraction(0))
+
+    super_rate = Fraction(payload.SuperRate or Decimal("0")) / 100
+    salary_annual = taxable_base
+    if payload.IncludesSuper and super_rate > 0:
+        salary_annual = taxable_base * (1 + super_rate)
+    periods = _AnnualizeAmount(Fraction(1), payload.SalaryFrequency, hours_per_week, days_per_week, exact=True)
+    # Rounded up to the cent so the returned salary always reaches the target.
+    salary_amount = FromCents(math.ceil(salary_annual / periods * 100))
+
+    estimate = _EstimateTaxForYear(
+        TaxCalculatorRequest(
+            SalaryAmount=salary_amount,
+            SalaryFrequency=payload.SalaryFrequency,
+            IncludesSuper=payload.IncludesSuper,
+            SuperRate=payload.SuperRate,
+            PrivateHealth=payload.PrivateHealth,
+            NovatedLeaseAmount=payload.NovatedLeaseAmount,
+            NovatedLeaseFrequency=payload.NovatedLeaseFrequency,
+            HoursPerWeek=payload.HoursPerWeek,
+            DaysPerWeek=payload.DaysPerWeek,
+            TaxYear=tax_year.Label,
+        ),
+        tax_year,
+    )
+    return TaxSolveGrossResponse(
+        SalaryAmount=salary_amount,
+        SalaryFrequency=payload.SalaryFrequency,
+        Estimate=estimate,
+    )
+
+
+# Income tax, levies and rates for a whole grid of taxable incomes in one pass, in float64 for
+# charting; figures agree with EstimateTax to the cent apart from float rounding at half cents.
+def TaxCurve(tax_year: TaxYear, taxable_incomes: np.ndarray, private_health: bool) -> dict[str, np.ndarray]:
+    taxable = np.maximum(np.asarray(taxable_incomes, dtype=np.float64), 0.0)
+    indexes = tax_year.BracketIndexes(taxable)
+    brackets = np.maximum(indexes, 0)
+    in_bracket = indexes >= 0
+    income_tax = np.where(
+        in_bracket,
+        tax_year.BaseTaxArray[brackets] + (taxable - tax_year.ThresholdArray[brackets]) * tax_year.RateArray[brackets],
+        0.0,
+    )
+    mls_rate = 0.0 if private_health else float(tax_year.MlsRate)
+    levy_rate = float(tax_year.MedicareLevyRate) + mls_rate
+    medicare = taxable * float(tax_year.MedicareLevyRate)
+    mls = taxable * mls_rate
+    total = income_tax + medicare + mls
+    return {
+        "Taxable": taxable,
+        "IncomeTax": income_tax,
+        "Medicare": medicare,
+        "Mls": mls,
+        "Net": taxable - total,
+        "EffectiveRate": np.divide(total, taxable, out=np.zeros_like(total), where=taxable > 0),
+        "MarginalRate": np.where(in_bracket, tax_year.RateArray[brackets], 0.0) + levy_rate,
+    }
+
+
+@dataclass(frozen=True)
+class TaxPeriodCents:
+    Weekly: int
+    Fortnightly: int
+    Monthly: int
+    Yearly: int
+
+
+@dataclass(frozen=True)
+class TaxEstimateCents:
+    TaxYear: str
+    IsEstimated: bool
+    SalaryAnnual: int
+    GrossAnnual: int
+    TaxableAnnual: int
+    SuperAnnual: int
+    NovatedLeaseAnnual: int
+    IncomeTaxAnnual: int
+    MedicareAnnual: int
+    MlsAnnual: int
+    NetAnnual: int
+    Gross: TaxPeriodCents
+    Net: TaxPeriodCents
+    IncomeTax: TaxPeriodCents
+    Medicare: TaxPeriodCents
+    Mls: TaxPeriodCents
+    Super: TaxPeriodCents
+
+
+_PERIOD_DIVISORS = (52, 26, 12)
+
+
+def _PeriodCents(annual_amount: Fraction) -> TaxPeriodCents:
+    cents = annual_amount * 100
+    return TaxPeriodCents(
+        Weekly=RoundCents(cents / 52),
+        Fortnightly=RoundCents(cents / 26),
+        Monthly=RoundCents(cents / 12),
+        Yearly=RoundCents(cents),
+    )
+
+
+def _HasHalfCentTie(figures: _AnnualTaxFigures) -> bool:
+    period_figures = (
+        figures.GrossAnnual,
+        figures.NetAnnual,
+        figures.IncomeTaxAnnual,
+        figures.MedicareAnnual,
+        figures.MlsAnnual,
+        figures.SuperAnnual,
+    )
+    return any(IsHalfCentTie(value * 100) for value in astuple(figures)) or any(
+        IsHalfCentTie(value * 100 / divisor) for value in period_figures for divisor in _PERIOD_DIVISORS
+    )
+
+
+def _PeriodCentsFrom(amounts: TaxPeriodAmounts) -> TaxPeriodCents:
+    return TaxPeriodCents(
+        Weekly=ToCents(amounts.Weekly),
+        Fortnightly=ToCents(amounts.Fortnightly),
+        Monthly=ToCents(amounts.Monthly),
+        Yearly=ToCents(amounts.Yearly),
+    )
+
+
+def _EstimateCentsFrom(response: TaxCalculatorResponse) -> TaxEstimateCents:
+    return TaxEstimateCents(
+        TaxYear=response.TaxYear,
+        IsEstimated=response.IsEstimated,
+        SalaryAnnual=ToCents(response.SalaryAnnual),
+        GrossAnnual=ToCents(response.GrossAnnual),
+        TaxableAnnual=ToCents(response.TaxableAnnual),
+        SuperAnnual=ToCents(response.SuperAnnual),
+        NovatedLeaseAnnual=ToCents(response.NovatedLeaseAnnual),
+        IncomeTaxAnnual=ToCents(response.IncomeTaxAnnual),
+        MedicareAnnual=ToCents(response.MedicareAnnual),
+        MlsAnnual=ToCents(response.MlsAnnual),
+        NetAnnual=ToCents(response.NetAnnual),
+        Gross=_PeriodCentsFrom(response.Gross),
+        Net=_PeriodCentsFrom(response.Net),
+        IncomeTax=_PeriodCentsFrom(response.IncomeTax),
+        Medicare=_PeriodCentsFrom(response.Medicare),
+        Mls=_PeriodCentsFrom(response.Mls),
+        Super=_PeriodCentsFrom(response.Super),
+    )
+
+
+# Opt-in integer-cents estimate: exact Fraction arithmetic, rounded once per figure with the
+# same ROUND_HALF_UP rule. An exact half-cent tie in any figure takes the whole estimate from
+# the Decimal path (see app.services.money), so every field equals ToCents() of the EstimateTax
+# field.
+def EstimateTaxCents(payload: TaxCalculatorRequest) -> TaxEstimateCents:
+    tax_year = GetTaxYearByLabel(payload.TaxYear)
+    figures = _AnnualFigures(payload, tax_year, exact=True)
+    if _HasHalfCentTie(figures):
+        return _EstimateCentsFrom(_EstimateTaxForYear(payload, tax_year))
+
+    return TaxEstimateCents(
+        TaxYear=tax_year.Label,
+        IsEstimated=tax_year.IsEstimated,
+        SalaryAnnual=RoundCents(figures.SalaryAnnual * 100),
+        GrossAnnual=RoundCents(figures.GrossAnnual * 100),
+        TaxableAnnual=RoundCents(figures.TaxableAnnual * 100),
+        SuperAnnual=RoundCents(figures.SuperAnnual * 100),
+        NovatedLeaseAnnual=RoundCents(figures.NovatedLeaseAnnual * 100),
+        IncomeTaxAnnual=RoundCents(figures.IncomeTaxAnnual * 100),
+        MedicareAnnual=RoundCents(figures.MedicareAnnual * 100),
+        MlsAnnual=RoundCents(figures.MlsAnnual * 100),
+        NetAnnual=RoundCents(figures.NetAnnual * 100),
+        Gross=_PeriodCents(figures.GrossAnnual),
+        Net=_PeriodCents(figures.NetAnnual),
+        IncomeTax=_PeriodCents(figures.IncomeTaxAnnual),
+        Medicare=_PeriodCents(figures.MedicareAnnual),
+        Mls=_PeriodCents(figures.MlsAnnual),
+        Super=_PeriodCents(figures.SuperAnnual),
     )
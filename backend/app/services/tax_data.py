@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
+from typing import Any
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -19,6 +23,27 @@ class TaxYear:
     MedicareLevyRate: Decimal
     MlsRate: Decimal
     IsEstimated: bool = False
+    # Filled in from Brackets: ascending thresholds for bisect, float columns for NumPy callers.
+    Thresholds: tuple[Decimal, ...] = field(init=False, repr=False, compare=False)
+    ThresholdArray: np.ndarray = field(init=False, repr=False, compare=False)
+    BaseTaxArray: np.ndarray = field(init=False, repr=False, compare=False)
+    RateArray: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        thresholds = tuple(bracket.Threshold for bracket in self.Brackets)
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError(f"Brackets for {self.Label} are not in ascending order")
+        object.__setattr__(self, "Thresholds", thresholds)
+        object.__setattr__(self, "ThresholdArray", np.array([float(value) for value in thresholds]))
+        object.__setattr__(self, "BaseTaxArray", np.array([float(bracket.BaseTax) for bracket in self.Brackets]))
+        object.__setattr__(self, "RateArray", np.array([float(bracket.Rate) for bracket in self.Brackets]))
+
+    def BracketIndex(self, taxable: Any) -> int:
+        # Index of the highest bracket whose threshold the amount exceeds, or -1 for none.
+        return bisect_left(self.Thresholds, taxable) - 1
+
+    def BracketIndexes(self, taxables: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.ThresholdArray, taxables, side="left") - 1
 
 
 TAX_YEARS: tuple[TaxYear, ...] = (
@@ -68,17 +93,25 @@ TAX_YEARS: tuple[TaxYear, ...] = (
 )
 
 
+_TAX_YEARS_BY_LABEL: dict[str, TaxYear] = {tax_year.Label: tax_year for tax_year in TAX_YEARS}
+_TAX_YEARS_BY_START: tuple[TaxYear, ...] = tuple(sorted(TAX_YEARS, key=lambda item: item.StartDate))
+_TAX_YEAR_STARTS: tuple[date, ...] = tuple(tax_year.StartDate for tax_year in _TAX_YEARS_BY_START)
+
+
 def ListTaxYears() -> list[TaxYear]:
     return list(TAX_YEARS)
 
 
-def GetTaxYearByLabel(label: str | None) -> TaxYear:
+def GetTaxYearForDate(value: date) -> TaxYear:
+    index = bisect_right(_TAX_YEAR_STARTS, value) - 1
+    if index >= 0 and value <= _TAX_YEARS_BY_START[index].EndDate:
+        return _TAX_YEARS_BY_START[index]
+    return _TAX_YEARS_BY_START[-1]
+
+
+def GetTaxYearByLabel(label: str | None, today: date | None = None) -> TaxYear:
     if label:
-        for tax_year in TAX_YEARS:
-            if tax_year.Label == label:
-                return tax_year
-    today = date.today()
-    for tax_year in TAX_YEARS:
-        if tax_year.StartDate <= today <= tax_year.EndDate:
+        tax_year = _TAX_YEARS_BY_LABEL.get(label)
+        if tax_year is not None:
             return tax_year
-    return max(TAX_YEARS, key=lambda item: item.StartDate)
+    return GetTaxYearForDate(today or date.today())
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import re
+import sqlite3
+import sys
+import tempfile
+from datetime import date, timedelta
+from typing import Any
+
+# Runs the read routes against a migrated SQLite database, captures every SELECT they send and
+# checks its EXPLAIN QUERY PLAN for full table scans. Settings are read at import time, so the
+# scratch database must be configured before anything under app/ is imported. When settings are
+# already loaded (the test suite imports this module) the caller's database is used as is.
+if "app.core.config" not in sys.modules:
+    _WORKDIR = Path(tempfile.mkdtemp(prefix="household-plans-"))
+    os.environ["DatabaseUrl"] = f"sqlite:///{_WORKDIR / 'plans.db'}"
+    os.environ["LogFilePath"] = str(_WORKDIR / "plans.log")
+    os.environ.setdefault("LogLevel", "WARNING")
+    os.environ["ReadReplicaUrls"] = ""
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, make_url  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import CreateAccessToken  # noqa: E402
+from app.db import SessionLocal, async_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Base  # noqa: E402
+from benchmarks.synthetic import HouseholdProfile, SeedHouseholds  # noqa: E402
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+_DATABASE_PATH = Path(make_url(settings.DatabaseUrl).database)
+_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+def Migrate() -> None:
+    config = Config(str(_BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    command.upgrade(config, "head")
+
+
+def RoutePaths(seeded: Any, today: date) -> list[str]:
+    return [
+        "/expenses",
+        "/expenses/upcoming?days=30",
+        "/income-streams",
+        "/scenarios",
+        "/scenarios?limit=3&summary=true",
+        f"/scenarios/{seeded.ScenarioIds[0]}",
+        "/expense-accounts",
+        "/expense-types",
+        "/table-preferences/plans",
+        f"/calendar?from={today}&to={today + timedelta(days=90)}",
+        "/projections/cashflow?years=1",
+        "/households/tax-summary",
+        "/households/tax-timeline?years=2",
+    ]
+
+
+def CaptureRouteQueries(client: TestClient, headers: dict[str, str], paths: list[str]) -> list[tuple[str, str, Any]]:
+    captured: list[tuple[str, str, Any]] = []
+    current = [""]
+
+    def Capture(_conn, _cursor, statement: str, parameters: Any, _context, _executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((current[0], statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", Capture)
+    try:
+        for path in paths:
+            current[0] = path
+            response = client.get(path, headers=headers)
+            if response.status_code >= 400:
+                raise RuntimeError(f"GET {path} returned {response.status_code}: {response.text[:200]}")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", Capture)
+    return captured
+
+
+def FindTableScans(database_path: Path, queries: list[tuple[str, str, Any]]) -> list[tuple[str, str, str]]:
+    tables = set(Base.metadata.tables)
+    scans: list[tuple[str, str, str]] = []
+    with sqlite3.connect(database_path) as connection:
+        for path, statement, parameters in queries:
+            for _, _, _, detail in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters):
+                match = _SCAN.match(detail)
+                if match and match.group(1) in tables:
+                    scans.append((path, detail, " ".join(statement.split())))
+    return scans
+
+
+def CheckRouteQueryPlans(
+    client: TestClient, households: int, expenses: int
+) -> tuple[list[tuple[str, str, Any]], list[tuple[str, str, str]]]:
+    # Seeds the migrated database, runs the read routes through client and returns every captured
+    # query along with the ones whose plan scans a table.
+    today = date.today()
+    profile = HouseholdProfile(
+        Households=households,
+        ExpensesPerHousehold=expenses,
+        ScenariosPerHousehold=10,
+        AdjustmentsPerScenario=5,
+        HistoryYears=5,
+    )
+    db = SessionLocal()
+    try:
+        seeded = SeedHouseholds(db, profile, today)[0]
+    finally:
+        db.close()
+
+    token = CreateAccessToken(str(seeded.UserIds[0]), {"role": "Admin"})
+    headers = {"Authorization": f"Bearer {token}"}
+    client.put("/table-preferences/plans", json={"TableKey": "plans", "State": {}}, headers=headers)
+    queries = CaptureRouteQueries(client, headers, RoutePaths(seeded, today))
+    return queries, FindTableScans(_DATABASE_PATH, queries)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Fail when a read route's query plan scans a whole table.")
+    parser.add_argument("--households", type=int, default=3)
+    parser.add_argument("--expenses", type=int, default=500)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    Migrate()
+    with TestClient(app) as client:
+        queries, scans = CheckRouteQueryPlans(client, args.households, args.expenses)
+
+    if args.verbose:
+        with sqlite3.connect(_DATABASE_PATH) as connection:
+            for path, statement, parameters in queries:
+                plan = [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+                print(f"{path}: {' | '.join(plan)}")
+
+    for path, detail, statement in scans:
+        print(f"{path}: {detail}\n    {statement}")
+    print(f"{len(queries)} queries checked, {len(scans)} table scan(s)")
+    return 1 if scans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
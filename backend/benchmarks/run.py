@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable
+
+# Settings are read at import time, so the scratch database and quiet logging must be in
+# place before anything under app/ is imported.
+_WORKDIR = Path(tempfile.mkdtemp(prefix="household-bench-"))
+os.environ.setdefault("DatabaseUrl", f"sqlite:///{_WORKDIR / 'bench.db'}")
+os.environ.setdefault("LogFilePath", str(_WORKDIR / "bench.log"))
+os.environ.setdefault("LogLevel", "WARNING")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import delete, insert  # noqa: E402
+
+from app.core.security import CreateAccessToken  # noqa: E402
+from app.db import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Base, Expense, IncomeStream  # noqa: E402
+from app.schemas import TaxCalculatorRequest  # noqa: E402
+from app.services.schedules import (  # noqa: E402
+    AnnualizedBreakdown,
+    FinancialYearRange,
+    GenerateOccurrences,
+    LastNextOccurrence,
+)
+from app.services.tax_calculator import EstimateTax  # noqa: E402
+from benchmarks.synthetic import PASSWORD, HouseholdProfile, SeedHouseholds  # noqa: E402
+
+
+def _Time(action: Callable[[], Any], repeat: int) -> dict[str, float]:
+    action()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "Runs": repeat,
+        "MinMs": round(samples[0], 3),
+        "MedianMs": round(statistics.median(samples), 3),
+        "P95Ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+    }
+
+
+def _Expect(response: Any, status_code: int = 200) -> Any:
+    if response.status_code != status_code:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url} returned {response.status_code}: "
+            f"{response.text[:200]}"
+        )
+    return response
+
+
+def _ServiceCases(today: date) -> dict[str, Callable[[], Any]]:
+    db = SessionLocal()
+    try:
+        streams = db.query(IncomeStream).all()
+        db.expunge_all()
+    finally:
+        db.close()
+    fy_start, fy_end = FinancialYearRange(today, 7, 1)
+    oldest = min(streams, key=lambda stream: stream.FirstPayDate)
+    requests = [
+        TaxCalculatorRequest(
+            SalaryAmount=Decimal(salary),
+            SalaryFrequency=frequency,
+            IncludesSuper=salary % 2 == 0,
+            SuperRate=Decimal("11.5"),
+            PrivateHealth=salary % 3 == 0,
+            NovatedLeaseAmount=Decimal("500") if salary % 5 == 0 else Decimal("0"),
+            NovatedLeaseFrequency="Monthly",
+        )
+        for salary in range(40000, 240000, 2000)
+        for frequency in ("Yearly", "Monthly")
+    ]
+    return {
+        "services.GenerateOccurrences.oldest_weekly_fy": lambda: GenerateOccurrences(
+            oldest.FirstPayDate, "Weekly", fy_start, fy_end, None
+        ),
+        "services.GenerateOccurrences.all_streams_fy": lambda: [
+            GenerateOccurrences(s.FirstPayDate, s.Frequency, fy_start, fy_end, s.EndDate) for s in streams
+        ],
+        "services.LastNextOccurrence.all_streams": lambda: [
+            LastNextOccurrence(s.FirstPayDate, s.Frequency, today, s.EndDate) for s in streams
+        ],
+        "services.AnnualizedBreakdown.all_streams": lambda: [
+            AnnualizedBreakdown(s.GrossAmount, s.Frequency, fy_start, fy_end) for s in streams
+        ],
+        "services.EstimateTax.salary_grid": lambda: [EstimateTax(request) for request in requests],
+    }
+
+
+# Password hashing dominates the auth routes, so they get a smaller run budget.
+_SLOW_CASE_REPEAT = 5
+
+
+def _RouteCases(client: TestClient, seeded: Any, today: date) -> dict[str, tuple[Callable[[], Any], int | None]]:
+    token = CreateAccessToken(str(seeded.UserIds[0]), {"role": "Admin"})
+    headers = {"Authorization": f"Bearer {token}"}
+    login = {"Email": seeded.Emails[0], "Password": PASSWORD}
+    stream_id = seeded.StreamIds[0]
+    scenario_id = seeded.ScenarioIds[0]
+    stream_payload = {
+        "Label": "Benchmark stream",
+        "NetAmount": "2100.00",
+        "GrossAmount": "3000.00",
+        "FirstPayDate": "2000-01-06",
+        "Frequency": "Fortnightly",
+    }
+    expense_payload = {"Label": "Benchmark expense", "Amount": "42.00", "Frequency": "Monthly"}
+    tax_payload = {
+        "SalaryAmount": "120000",
+        "SalaryFrequency": "Yearly",
+        "IncludesSuper": False,
+        "SuperRate": "11.5",
+    }
+    batch_payload = {
+        "Requests": [
+            {**tax_payload, "SalaryAmount": str(salary), "IncludesSuper": salary % 2 == 0}
+            for salary in range(40000, 240000, 200)
+        ]
+    }
+    order_payload = {"OrderedIds": list(seeded.ExpenseIds)}
+    solve_payload = {"TargetNetAmount": "85000", "IncludesSuper": False, "SuperRate": "11.5", "PrivateHealth": True}
+    bulk_patch_payload = {"Ids": list(seeded.ExpenseIds[:500]), "Fields": {"Enabled": True}}
+    move_payload = {"AfterId": seeded.ExpenseIds[0], "BeforeId": seeded.ExpenseIds[1]}
+    import_label = "Benchmark import"
+    expense_csv = (
+        "Label,Amount,Frequency,NextDueDate\n"
+        + "".join(f"{import_label},{index % 500 + 1}.25,Monthly,{today}\n" for index in range(1000))
+    ).encode()
+    stream_ndjson = "".join(
+        json.dumps({**stream_payload, "Label": import_label, "NetAmount": f"{index + 1000}.00"}) + "\n"
+        for index in range(1000)
+    ).encode()
+
+    def Get(path: str) -> Callable[[], Any]:
+        return lambda: _Expect(client.get(path, headers=headers))
+
+    def Login() -> Any:
+        return _Expect(client.post("/auth/login", json=login))
+
+    def Refresh() -> Any:
+        tokens = Login().json()
+        return _Expect(client.post("/auth/refresh", json={"RefreshToken": tokens["RefreshToken"]}))
+
+    def CreateAndDeleteExpense() -> None:
+        created = _Expect(client.post("/expenses", json=expense_payload, headers=headers), 201).json()
+        _Expect(client.delete(f"/expenses/{created['Id']}", headers=headers), 204)
+
+    def ClearImported(model: Any) -> None:
+        # Imported rows are removed so repeats do not grow the household under later cases.
+        with SessionLocal() as db:
+            db.execute(delete(model).where(model.HouseholdId == seeded.HouseholdId, model.Label == import_label))
+            db.commit()
+
+    def ImportExpenses() -> None:
+        imported = _Expect(
+            client.post("/expenses/import", content=expense_csv, headers={**headers, "Content-Type": "text/csv"})
+        ).json()
+        if imported["Failed"]:
+            raise RuntimeError(f"Expense import failed rows: {imported['Errors'][:3]}")
+        ClearImported(Expense)
+
+    def ImportIncomeStreams() -> None:
+        imported = _Expect(
+            client.post(
+                "/income-streams/import",
+                content=stream_ndjson,
+                headers={**headers, "Content-Type": "application/x-ndjson"},
+            )
+        ).json()
+        if imported["Failed"]:
+            raise RuntimeError(f"Income stream import failed rows: {imported['Errors'][:3]}")
+        ClearImported(IncomeStream)
+
+    def CreateAndBulkDeleteExpenses() -> None:
+        with SessionLocal() as db:
+            ids = db.scalars(
+                insert(Expense).returning(Expense.Id),
+                [
+                    {
+                        "HouseholdId": seeded.HouseholdId,
+                        "OwnerUserId": seeded.UserIds[0],
+                        "Label": import_label,
+                        "Amount": Decimal("10.00"),
+                        "Frequency": "Monthly",
+                    }
+                    for _ in range(200)
+                ],
+            ).all()
+            db.commit()
+        _Expect(client.request("DELETE", "/expenses/bulk", json={"Ids": ids}, headers=headers), 204)
+
+    def CreateAndDeleteScenario() -> None:
+        payload = {
+            "Name": "Benchmark scenario",
+            "ScenarioType": "Raise",
+            "Adjustments": [
+                {"StreamId": stream_id, "Amount": "100", "Frequency": "Weekly", "Included": True}
+            ],
+        }
+        created = _Expect(client.post("/scenarios", json=payload, headers=headers), 201).json()
+        _Expect(client.delete(f"/scenarios/{created['Id']}", headers=headers), 204)
+
+    return {
+        "routes.health": (lambda: _Expect(client.get("/health")), None),
+        "routes.auth.login": (Login, _SLOW_CASE_REPEAT),
+        "routes.auth.refresh": (Refresh, _SLOW_CASE_REPEAT),
+        "routes.income_streams.list": (Get("/income-streams"), None),
+        "routes.income_streams.update": (
+            lambda: _Expect(client.put(f"/income-streams/{stream_id}", json=stream_payload, headers=headers)),
+            None,
+        ),
+        "routes.expenses.list": (Get("/expenses"), None),
+        "routes.expenses.upcoming": (Get("/expenses/upcoming?days=14"), None),
+        "routes.expenses.create_delete": (CreateAndDeleteExpense, None),
+        "routes.expenses.order": (
+            lambda: _Expect(client.put("/expenses/order", json=order_payload, headers=headers), 204),
+            None,
+        ),
+        "routes.expenses.import_csv_1000": (ImportExpenses, _SLOW_CASE_REPEAT),
+        "routes.expenses.bulk_patch_500": (
+            lambda: _Expect(client.patch("/expenses/bulk", json=bulk_patch_payload, headers=headers)),
+            None,
+        ),
+        "routes.expenses.bulk_delete_200": (CreateAndBulkDeleteExpenses, None),
+        "routes.expenses.move": (
+            lambda: _Expect(client.put(f"/expenses/{seeded.ExpenseIds[-1]}/move", json=move_payload, headers=headers)),
+            None,
+        ),
+        "routes.income_streams.import_ndjson_1000": (ImportIncomeStreams, _SLOW_CASE_REPEAT),
+        "routes.expense_accounts.list": (Get("/expense-accounts"), None),
+        "routes.expense_types.list": (Get("/expense-types"), None),
+        "routes.scenarios.list": (Get("/scenarios"), None),
+        "routes.scenarios.get": (Get(f"/scenarios/{scenario_id}"), None),
+        "routes.scenarios.summary_page": (Get("/scenarios?limit=20&summary=true"), None),
+        "routes.scenarios.create_delete": (CreateAndDeleteScenario, None),
+        "routes.tax_calculator.years": (Get("/tax-calculator/years"), None),
+        "routes.tax_calculator.estimate": (
+            lambda: _Expect(client.post("/tax-calculator/estimate", json=tax_payload, headers=headers)),
+            None,
+        ),
+        "routes.tax_calculator.estimate_batch_1000": (
+            lambda: _Expect(client.post("/tax-calculator/estimate/batch", json=batch_payload, headers=headers)),
+            None,
+        ),
+        "routes.tax_calculator.solve_gross": (
+            lambda: _Expect(client.post("/tax-calculator/solve-gross", json=solve_payload, headers=headers)),
+            None,
+        ),
+        "routes.tax_calculator.curve_5001": (Get("/tax-calculator/curve?from=0&to=500000&step=100"), None),
+        "routes.households.tax_summary": (Get("/households/tax-summary"), None),
+        "routes.households.tax_timeline_3y": (Get("/households/tax-timeline?years=3"), None),
+        "routes.maintenance.metrics": (Get("/maintenance/metrics"), None),
+        "routes.table_preferences.get": (Get("/table-preferences/expenses"), None),
+        "routes.calendar.one_year": (Get(f"/calendar?from={today.year}-01-01&to={today.year}-12-31"), None),
+        "routes.projections.cashflow_10y": (Get("/projections/cashflow?years=10&resolution=week"), None),
+    }
+
+
+def _Compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    regressions = []
+    print(f"{'case':<52} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, current in sorted(results["Results"].items()):
+        previous = baseline.get("Results", {}).get(name)
+        if previous is None:
+            print(f"{name:<52} {'-':>10} {current['MedianMs']:>10.3f} {'new':>7}")
+            continue
+        ratio = current["MedianMs"] / previous["MedianMs"] if previous["MedianMs"] else 1.0
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<52} {previous['MedianMs']:>10.3f} {current['MedianMs']:>10.3f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark services and routes against synthetic data.")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--compare", type=Path, help="Baseline JSON produced by an earlier run.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed median slowdown (0.25 = 25%%).")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--only", help="Only run cases whose name contains this text.")
+    parser.add_argument("--households", type=int, default=HouseholdProfile.Households)
+    parser.add_argument("--users", type=int, default=HouseholdProfile.UsersPerHousehold)
+    parser.add_argument("--streams", type=int, default=HouseholdProfile.StreamsPerUser)
+    parser.add_argument("--expenses", type=int, default=HouseholdProfile.ExpensesPerHousehold)
+    parser.add_argument("--scenarios", type=int, default=HouseholdProfile.ScenariosPerHousehold)
+    parser.add_argument("--adjustments", type=int, default=HouseholdProfile.AdjustmentsPerScenario)
+    parser.add_argument("--history-years", type=int, default=HouseholdProfile.HistoryYears)
+    args = parser.parse_args(argv)
+
+    profile = HouseholdProfile(
+        Households=args.households,
+        UsersPerHousehold=args.users,
+        StreamsPerUser=args.streams,
+        ExpensesPerHousehold=args.expenses,
+        ScenariosPerHousehold=args.scenarios,
+        AdjustmentsPerScenario=args.adjustments,
+        HistoryYears=args.history_years,
+    )
+    today = date.today()
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        seeded = SeedHouseholds(db, profile, today)
+    finally:
+        db.close()
+
+    results: dict[str, Any] = {}
+    for name, action in _ServiceCases(today).items():
+        if not args.only or args.only in name:
+            results[name] = _Time(action, args.repeat)
+            print(f"{name:<52} {results[name]['MedianMs']:>10.3f} ms")
+
+    with TestClient(app) as client:
+        for name, (action, max_repeat) in _RouteCases(client, seeded[0], today).items():
+            if not args.only or args.only in name:
+                results[name] = _Time(action, min(args.repeat, max_repeat or args.repeat))
+                print(f"{name:<52} {results[name]['MedianMs']:>10.3f} ms")
+
+    payload = {
+        "Meta": {
+            "CreatedAt": datetime.now(timezone.utc).isoformat(),
+            "Python": platform.python_version(),
+            "Platform": platform.platform(),
+            "Profile": profile.__dict__,
+            "Repeat": args.repeat,
+        },
+        "Results": results,
+    }
+    args.output.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        regressions = _Compare(payload, json.loads(args.compare.read_text()), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+from pathlib import Path
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+import random
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import Settings
+from app.db import CreateDbEngine
+from app.models import Base, Expense, Household, User
+
+# Concurrent read/write throughput against one SQLite file, comparing the engine app/db.py used
+# to build (pool_pre_ping, no pragmas) with the configurable SQLite profile. Each worker process
+# stands in for a uvicorn worker and runs several threads, like Starlette's threadpool.
+
+MODES = ("legacy", "profile")
+
+
+def _Engine(mode: str, database_url: str) -> Engine:
+    if mode == "legacy":
+        return create_engine(database_url, pool_pre_ping=True, connect_args={"check_same_thread": False})
+    return CreateDbEngine(database_url, Settings(SqliteProfileEnabled=True))
+
+
+def _Seed(database_url: str, expenses: int) -> None:
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        household = Household(Name="Benchmark")
+        db.add(household)
+        db.flush()
+        user = User(Email="bench@bench.example.com", PasswordHash="x", Role="Admin", HouseholdId=household.Id)
+        db.add(user)
+        db.flush()
+        db.add_all(
+            Expense(
+                HouseholdId=household.Id,
+                OwnerUserId=user.Id,
+                Label=f"Expense {index}",
+                Amount=Decimal(index % 500) + Decimal("0.99"),
+                Frequency="Monthly",
+                DisplayOrder=index,
+            )
+            for index in range(expenses)
+        )
+        db.commit()
+    engine.dispose()
+
+
+def _Thread(
+    session_factory: sessionmaker,
+    deadline: float,
+    write_ratio: float,
+    seed: int,
+    stats: dict[str, Any],
+    lock: threading.Lock,
+) -> None:
+    rng = random.Random(seed)
+    local = {"Reads": [], "Writes": [], "Errors": 0}
+    while time.perf_counter() < deadline:
+        is_write = rng.random() < write_ratio
+        start = time.perf_counter()
+        try:
+            with session_factory() as db:
+                if is_write:
+                    db.add(
+                        Expense(
+                            HouseholdId=1,
+                            OwnerUserId=1,
+                            Label="Written",
+                            Amount=Decimal("12.34"),
+                            Frequency="Weekly",
+                            NextDueDate=date.today(),
+                            CreatedAt=datetime.utcnow(),
+                        )
+                    )
+                    db.commit()
+                else:
+                    db.query(Expense).filter(Expense.HouseholdId == 1).order_by(
+                        Expense.DisplayOrder
+                    ).limit(200).all()
+        except OperationalError:
+            local["Errors"] += 1
+            continue
+        local["Writes" if is_write else "Reads"].append((time.perf_counter() - start) * 1000)
+    with lock:
+        for key in ("Reads", "Writes"):
+            stats[key].extend(local[key])
+        stats["Errors"] += local["Errors"]
+
+
+def _Worker(mode: str, database_url: str, threads: int, seconds: float, write_ratio: float, seed: int, queue: Any) -> None:
+    engine = _Engine(mode, database_url)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    stats: dict[str, Any] = {"Reads": [], "Writes": [], "Errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    workers = [
+        threading.Thread(
+            target=_Thread,
+            args=(session_factory, deadline, write_ratio, seed * 100 + index, stats, lock),
+        )
+        for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    engine.dispose()
+    queue.put(stats)
+
+
+def _P95(samples: list[float]) -> float:
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3)
+
+
+def RunMode(mode: str, processes: int, threads: int, seconds: float, write_ratio: float, expenses: int) -> dict[str, Any]:
+    workdir = Path(tempfile.mkdtemp(prefix=f"household-sqlite-{mode}-"))
+    database_url = f"sqlite:///{workdir / 'bench.db'}"
+    _Seed(database_url, expenses)
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    children = [
+        context.Process(target=_Worker, args=(mode, database_url, threads, seconds, write_ratio, index, queue))
+        for index in range(processes)
+    ]
+    for child in children:
+        child.start()
+    results = [queue.get() for _ in children]
+    for child in children:
+        child.join()
+
+    reads = [sample for result in results for sample in result["Reads"]]
+    writes = [sample for result in results for sample in result["Writes"]]
+    return {
+        "ReadsPerSecond": round(len(reads) / seconds, 1),
+        "WritesPerSecond": round(len(writes) / seconds, 1),
+        "ReadMedianMs": round(statistics.median(reads), 3) if reads else 0.0,
+        "ReadP95Ms": _P95(reads),
+        "WriteMedianMs": round(statistics.median(writes), 3) if writes else 0.0,
+        "WriteP95Ms": _P95(writes),
+        "LockErrors": sum(result["Errors"] for result in results),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare SQLite engine profiles under concurrent clients.")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--expenses", type=int, default=2000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    results = {
+        mode: RunMode(mode, args.processes, args.threads, args.seconds, args.write_ratio, args.expenses)
+        for mode in MODES
+    }
+    print(f"{'mode':<10} {'reads/s':>10} {'writes/s':>10} {'read p95':>10} {'write p95':>10} {'locked':>8}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<10} {result['ReadsPerSecond']:>10} {result['WritesPerSecond']:>10} "
+            f"{result['ReadP95Ms']:>10} {result['WriteP95Ms']:>10} {result['LockErrors']:>8}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps({"Meta": vars(args) | {"output": str(args.output)}, "Results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import random
+
+from sqlalchemy.orm import Session
+
+from app.core.security import HashPassword
+from app.models import (
+    Expense,
+    ExpenseAccount,
+    ExpenseType,
+    Household,
+    IncomeStream,
+    Scenario,
+    ScenarioAdjustment,
+    TablePreference,
+    User,
+)
+
+FREQUENCIES = ("Weekly", "Fortnightly", "Monthly", "Quarterly", "Yearly")
+CADENCES = (None, "Monthly", "Quarterly", "Yearly", "EveryNYears", "OneOff")
+PASSWORD = "benchmark-password"
+
+
+@dataclass(frozen=True)
+class HouseholdProfile:
+    Households: int = 1
+    UsersPerHousehold: int = 4
+    StreamsPerUser: int = 25
+    ExpensesPerHousehold: int = 2000
+    AccountsPerHousehold: int = 10
+    TypesPerHousehold: int = 20
+    ScenariosPerHousehold: int = 50
+    AdjustmentsPerScenario: int = 40
+    HistoryYears: int = 30
+    Seed: int = 1234
+
+
+@dataclass(frozen=True)
+class SeededHousehold:
+    HouseholdId: int
+    UserIds: tuple[int, ...]
+    Emails: tuple[str, ...]
+    StreamIds: tuple[int, ...]
+    ExpenseIds: tuple[int, ...]
+    ScenarioIds: tuple[int, ...]
+
+
+def _Amount(rng: random.Random, low: int, high: int) -> Decimal:
+    return Decimal(rng.randint(low * 100, high * 100)) / Decimal(100)
+
+
+def SeedHouseholds(db: Session, profile: HouseholdProfile, today: date) -> list[SeededHousehold]:
+    rng = random.Random(profile.Seed)
+    password_hash = HashPassword(PASSWORD)
+    history_days = profile.HistoryYears * 365
+    now = datetime.utcnow()
+    seeded: list[SeededHousehold] = []
+
+    for household_number in range(profile.Households):
+        household = Household(Name=f"Benchmark {household_number + 1}")
+        db.add(household)
+        db.flush()
+
+        users = [
+            User(
+                Email=f"user{household_number + 1}-{user_number + 1}@bench.example.com",
+                PasswordHash=password_hash,
+                Role="Admin" if user_number == 0 else "User",
+                HouseholdId=household.Id,
+            )
+            for user_number in range(profile.UsersPerHousehold)
+        ]
+        db.add_all(users)
+        db.flush()
+
+        streams = []
+        for user in users:
+            for stream_number in range(profile.StreamsPerUser):
+                first_pay = today - timedelta(days=rng.randint(0, history_days))
+                ended = rng.random() < 0.2
+                gross = _Amount(rng, 200, 9000)
+                streams.append(
+                    IncomeStream(
+                        HouseholdId=household.Id,
+                        OwnerUserId=user.Id,
+                        Label=f"Income {stream_number + 1}",
+                        NetAmount=(gross * Decimal("0.7")).quantize(Decimal("0.01")),
+                        GrossAmount=gross,
+                        FirstPayDate=first_pay,
+                        Frequency=rng.choice(FREQUENCIES),
+                        EndDate=first_pay + timedelta(days=rng.randint(30, history_days)) if ended else None,
+                        CreatedAt=now - timedelta(seconds=len(streams)),
+                    )
+                )
+        db.add_all(streams)
+
+        accounts = [f"Account {index + 1}" for index in range(profile.AccountsPerHousehold)]
+        types = [f"Type {index + 1}" for index in range(profile.TypesPerHousehold)]
+        db.add_all(
+            ExpenseAccount(HouseholdId=household.Id, OwnerUserId=users[0].Id, Name=name)
+            for name in accounts
+        )
+        db.add_all(
+            ExpenseType(HouseholdId=household.Id, OwnerUserId=users[0].Id, Name=name)
+            for name in types
+        )
+
+        expenses = []
+        for expense_number in range(profile.ExpensesPerHousehold):
+            due = today + timedelta(days=rng.randint(-365, 365))
+            cadence = rng.choice(CADENCES)
+            expenses.append(
+                Expense(
+                    HouseholdId=household.Id,
+                    OwnerUserId=rng.choice(users).Id,
+                    Label=f"Expense {expense_number + 1}",
+                    Amount=_Amount(rng, 1, 2500),
+                    Frequency=rng.choice(FREQUENCIES),
+                    Account=rng.choice(accounts),
+                    Type=rng.choice(types),
+                    NextDueDate=due if rng.random() < 0.8 else None,
+                    Cadence=cadence,
+                    Interval=rng.randint(1, 3) if cadence == "EveryNYears" else None,
+                    Month=due.month,
+                    DayOfMonth=due.day,
+                    Enabled=rng.random() < 0.9,
+                    DisplayOrder=expense_number + 1,
+                    CreatedAt=now - timedelta(seconds=expense_number),
+                )
+            )
+        db.add_all(expenses)
+        db.flush()
+
+        scenarios = []
+        for scenario_number in range(profile.ScenariosPerHousehold):
+            scenario = Scenario(
+                HouseholdId=household.Id,
+                CreatedByUserId=rng.choice(users).Id,
+                Name=f"Scenario {scenario_number + 1}",
+                ScenarioType=rng.choice(("Raise", "Change", "Leave")),
+                CreatedAt=now - timedelta(seconds=scenario_number),
+            )
+            scenarios.append(scenario)
+        db.add_all(scenarios)
+        db.flush()
+        db.add_all(
+            ScenarioAdjustment(
+                ScenarioId=scenario.Id,
+                StreamId=rng.choice(streams).Id,
+                Amount=_Amount(rng, 100, 9000),
+                Frequency=rng.choice(FREQUENCIES),
+                Included=rng.random() < 0.8,
+            )
+            for scenario in scenarios
+            for _ in range(profile.AdjustmentsPerScenario)
+        )
+        db.add_all(
+            TablePreference(
+                HouseholdId=household.Id,
+                UserId=user.Id,
+                TableKey="expenses",
+                State={"Columns": {"Label": {"Visible": True}}},
+                CreatedAt=now,
+                UpdatedAt=now,
+            )
+            for user in users
+        )
+        db.commit()
+
+        seeded.append(
+            SeededHousehold(
+                HouseholdId=household.Id,
+                UserIds=tuple(user.Id for user in users),
+                Emails=tuple(user.Email for user in users),
+                StreamIds=tuple(stream.Id for stream in streams),
+                ExpenseIds=tuple(expense.Id for expense in expenses),
+                ScenarioIds=tuple(scenario.Id for scenario in scenarios),
+            )
+        )
+    return seeded
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tempfile
+
+# Settings are read when app.core.config is first imported, so the scratch database has to be
+# configured before anything under app/ is imported.
+_WORKDIR = Path(tempfile.mkdtemp(prefix="household-tests-"))
+os.environ["DatabaseUrl"] = f"sqlite:///{_WORKDIR / 'test.db'}"
+os.environ["LogFilePath"] = str(_WORKDIR / "test.log")
+os.environ["LogLevel"] = "WARNING"
+os.environ["AutheliaEnabled"] = "false"
+os.environ["ReadReplicaUrls"] = ""
+os.environ["RefreshTokenPruneEnabled"] = "false"
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+import pytest  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    config = Config(str(_BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    command.upgrade(config, "head")
+    # One client for the whole session: the async engine's pooled connections belong to its loop.
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client: TestClient) -> dict[str, str]:
+    credentials = {"Email": "owner@tests.example.com", "Password": "password1"}
+    response = client.post("/auth/register", json={**credentials, "HouseholdName": "Tests"})
+    assert response.status_code == 200, response.text
+    tokens = client.post("/auth/login", json=credentials).json()
+    return {"Authorization": f"Bearer {tokens['AccessToken']}"}
@@ -0,0 +1,17 @@
+from fastapi.testclient import TestClient
+
+from app.services.schedules import _cached_breakdown
+
+
+def test_expense_listing_reuses_cached_breakdowns(client: TestClient, auth_headers: dict[str, str]) -> None:
+    for index in range(3):
+        expense = {"Label": f"Streaming {index}", "Amount": "15.99", "Frequency": "Monthly"}
+        assert client.post("/expenses", json=expense, headers=auth_headers).status_code == 201
+
+    url = "/expenses?asOf=2026-10-17"
+    assert client.get(url, headers=auth_headers).status_code == 200
+    before = _cached_breakdown.cache_info()
+    assert client.get(url, headers=auth_headers).status_code == 200
+    after = _cached_breakdown.cache_info()
+    assert after.misses == before.misses
+    assert after.hits > before.hits
@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import islice
+import random
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.routes.calendar import _IterCalendarEvents
+from app.services.due_dates import ExpenseOccurrences, ExpenseScheduleRow, IterExpenseOccurrences
+
+AS_OF = date(2026, 10, 17)
+
+
+def test_calendar_expenses_match_due_date_engine(client: TestClient, auth_headers: dict[str, str]) -> None:
+    expenses = [
+        {"Label": "Rates", "Amount": 450, "Frequency": "Monthly", "Cadence": "Quarterly", "Interval": 1,
+         "NextDueDate": "2026-11-30", "DayOfMonth": 30},
+        {"Label": "Insurance", "Amount": 1200, "Frequency": "Yearly", "Cadence": "Monthly", "Interval": 2,
+         "NextDueDate": "2026-10-31", "DayOfMonth": 31},
+        {"Label": "Gym", "Amount": 30, "Frequency": "Monthly", "DayOfMonth": 15},
+        {"Label": "Coffee", "Amount": 5, "Frequency": "Weekly", "NextDueDate": "2026-10-20"},
+    ]
+    created_ids = set()
+    for expense in expenses:
+        response = client.post("/expenses", json=expense, headers=auth_headers)
+        assert response.status_code == 201
+        created_ids.add(response.json()["Id"])
+
+    end = AS_OF + timedelta(days=365)
+    calendar = client.get(f"/calendar?from={AS_OF}&to={end}", headers=auth_headers)
+    upcoming = client.get(f"/expenses/upcoming?days=365&asOf={AS_OF}", headers=auth_headers)
+    assert calendar.status_code == 200 and upcoming.status_code == 200
+
+    events = calendar.json()
+    assert [(e["Date"], e["Kind"], e["SourceId"]) for e in events] == sorted(
+        (e["Date"], e["Kind"], e["SourceId"]) for e in events
+    )
+    calendar_due = sorted((e["Date"], e["SourceId"]) for e in events if e["Kind"] == "Expense")
+    engine_due = sorted((row["DueDate"], row["ExpenseId"]) for row in upcoming.json())
+    assert calendar_due == engine_due
+    assert created_ids <= {source_id for _, source_id in calendar_due}
+
+
+def test_calendar_empty_range_is_empty_list(client: TestClient, auth_headers: dict[str, str]) -> None:
+    response = client.get("/calendar?from=1990-01-01&to=1990-01-02", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_calendar_rejects_windows_wider_than_the_limit(client: TestClient, auth_headers: dict[str, str]) -> None:
+    response = client.get("/calendar?from=0001-01-01&to=9999-12-31", headers=auth_headers)
+    assert response.status_code == 422
+    limit = settings.CalendarMaxRangeDays
+    end = AS_OF + timedelta(days=limit - 1)
+    assert client.get(f"/calendar?from={AS_OF}&to={end}", headers=auth_headers).status_code == 200
+    end = AS_OF + timedelta(days=limit)
+    assert client.get(f"/calendar?from={AS_OF}&to={end}", headers=auth_headers).status_code == 422
+
+
+def test_calendar_events_are_merged_lazily() -> None:
+    expenses = [
+        ExpenseScheduleRow(
+            Id=index, Label="Daily", Amount=Decimal("1"), Frequency="every 1 day", NextDueDate=date(1, 1, 1),
+            Cadence=None, Interval=None, Month=None, DayOfMonth=None, Enabled=True,
+        )
+        for index in range(3)
+    ]
+    # Pulling the first events of a 10,000-year window must not build the whole schedule.
+    events = _IterCalendarEvents([], expenses, date(1, 1, 1), date(9999, 12, 31))
+    first = list(islice(events, 6))
+    assert [(event_date, source_id) for event_date, _, source_id, *_ in first] == [
+        (date(1, 1, day), source_id) for day in (1, 2) for source_id in range(3)
+    ]
+
+
+def test_lazy_expense_occurrences_match_the_batch_engine() -> None:
+    generator = random.Random(20261017)
+    cadences = [(None, None, "Weekly"), (None, None, "Monthly"), (None, None, "Quarterly"),
+                ("Monthly", 2, "Monthly"), ("EveryNYears", 4, "Yearly"), ("Quarterly", 1, "Monthly"),
+                ("OneOff", None, "Monthly"), (None, None, "last friday of the month"), (None, None, "daily")]
+    rows = []
+    for index in range(400):
+        cadence, interval, frequency = generator.choice(cadences)
+        next_due = date(2020, 1, 1) + timedelta(days=generator.randint(0, 3000))
+        rows.append(
+            ExpenseScheduleRow(
+                Id=index, Label="Row", Amount=Decimal("1"), Frequency=frequency,
+                NextDueDate=generator.choice([next_due, None]), Cadence=cadence, Interval=interval,
+                Month=generator.choice([None, generator.randint(1, 12)]),
+                DayOfMonth=generator.choice([None, next_due.day, generator.randint(1, 31)]), Enabled=True,
+            )
+        )
+    range_start, range_end = date(2022, 3, 1), date(2031, 2, 28)
+    positions, dates = ExpenseOccurrences(rows, range_start, range_end, range_start)
+    batch = sorted(zip(positions.tolist(), dates.tolist()))
+    lazy = [
+        (position, occurrence)
+        for position, row in enumerate(rows)
+        for occurrence in IterExpenseOccurrences(row, range_start, range_end, range_start)
+    ]
+    assert lazy == batch
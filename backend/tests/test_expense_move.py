@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.db import SessionLocal
+from app.models import Expense
+
+
+def _Create(client: TestClient, headers: dict[str, str], label: str) -> int:
+    response = client.post("/expenses", json={"Label": label, "Amount": 1, "Frequency": "Monthly"}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["Id"]
+
+
+def _Order(client: TestClient, headers: dict[str, str], ids: set[int]) -> list[int]:
+    return [expense["Id"] for expense in client.get("/expenses", headers=headers).json() if expense["Id"] in ids]
+
+
+def test_move_writes_midpoint_between_neighbours(client: TestClient, auth_headers: dict[str, str]) -> None:
+    first, second, moved = (_Create(client, auth_headers, f"Move {index}") for index in range(3))
+    response = client.put(f"/expenses/{moved}/move", json={"AfterId": first, "BeforeId": second}, headers=auth_headers)
+    assert response.status_code == 200
+    assert _Order(client, auth_headers, {first, second, moved}) == [first, moved, second]
+
+
+def test_move_between_inverted_tied_neighbours_conflicts(client: TestClient, auth_headers: dict[str, str]) -> None:
+    older, newer, moved = (_Create(client, auth_headers, f"Tie {index}") for index in range(3))
+    # Legacy rows sharing a rank list newest first, so renumbering puts `newer` above `older`.
+    with SessionLocal() as db:
+        db.execute(update(Expense).where(Expense.Id.in_([older, newer])).values(DisplayOrder=7))
+        db.commit()
+
+    response = client.put(f"/expenses/{moved}/move", json={"AfterId": older, "BeforeId": newer}, headers=auth_headers)
+    assert response.status_code == 409
+    moved_row = next(e for e in client.get("/expenses", headers=auth_headers).json() if e["Id"] == moved)
+    assert moved_row["DisplayOrder"] is not None
+
+    response = client.put(f"/expenses/{moved}/move", json={"AfterId": newer, "BeforeId": older}, headers=auth_headers)
+    assert response.status_code == 200
+    assert _Order(client, auth_headers, {older, newer, moved}) == [newer, moved, older]
@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+import pytest
+
+from app.services.imports import MAX_CSV_RECORD_LINES
+
+CSV_HEADER = "Label,Amount,Frequency\n"
+
+
+@pytest.fixture(scope="module")
+def import_headers(client: TestClient) -> dict[str, str]:
+    credentials = {"Email": "imports@tests.example.com", "Password": "password1"}
+    assert client.post("/auth/register", json={**credentials, "HouseholdName": "Imports"}).status_code == 200
+    tokens = client.post("/auth/login", json=credentials).json()
+    return {"Authorization": f"Bearer {tokens['AccessToken']}", "Content-Type": "text/csv"}
+
+
+def _Import(client: TestClient, headers: dict[str, str], body: str) -> dict:
+    response = client.post("/expenses/import", content=body.encode(), headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_stray_quote_in_unquoted_field_is_literal(client: TestClient, import_headers: dict[str, str]) -> None:
+    body = CSV_HEADER + 'TV 55" screen,10,Monthly\n"Two\nlines",5,Monthly\nRent,500,Monthly\n'
+    assert _Import(client, import_headers, body) == {"Imported": 3, "Failed": 0, "Errors": []}
+    labels = {expense["Label"] for expense in client.get("/expenses", headers=import_headers).json()}
+    assert {'TV 55" screen', "Two\nlines", "Rent"} <= labels
+
+
+def test_unparseable_record_is_a_row_error(client: TestClient, import_headers: dict[str, str]) -> None:
+    # Past csv's field size limit, which the csv module reports as csv.Error.
+    body = CSV_HEADER + f"{'x' * 200_000},10,Monthly\nAfter,1,Monthly\n"
+    result = _Import(client, import_headers, body)
+    assert (result["Imported"], result["Failed"]) == (1, 1)
+    assert result["Errors"][0]["Row"] == 1
+    assert result["Errors"][0]["Errors"][0].startswith("Invalid CSV:")
+
+
+def test_unclosed_quote_is_capped_and_reported(client: TestClient, import_headers: dict[str, str]) -> None:
+    lines = [f"Row {index},1,Monthly\n" for index in range(MAX_CSV_RECORD_LINES + 20)]
+    body = CSV_HEADER + '"Unclosed,10,Monthly\n' + "".join(lines)
+    result = _Import(client, import_headers, body)
+    assert result["Failed"] == 1
+    assert "not closed within" in result["Errors"][0]["Errors"][0]
+    # Lines after the abandoned record are read as records again.
+    assert result["Imported"] == len(lines) - MAX_CSV_RECORD_LINES
+
+
+def test_unclosed_quote_at_end_of_file_is_reported(client: TestClient, import_headers: dict[str, str]) -> None:
+    result = _Import(client, import_headers, CSV_HEADER + 'Fine,1,Monthly\n"Unclosed,10,Monthly\nTail,2,Monthly\n')
+    assert (result["Imported"], result["Failed"]) == (1, 1)
+    assert result["Errors"] == [{"Row": 2, "Errors": ["Quoted field is not closed before the end of the file"]}]
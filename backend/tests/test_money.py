@@ -0,0 +1,157 @@
+from dataclasses import asdict
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP, localcontext
+from fractions import Fraction
+import random
+from typing import Any
+
+import numpy as np
+
+from app.schemas import TaxCalculatorRequest
+from app.services.frequencies import GetFrequency
+from app.services.money import BatchRoundHalfUp, FromCents, IsHalfCentTie, ToCents
+from app.services.schedules import (
+    AnnualizedBreakdown,
+    AnnualizedBreakdownCents,
+    BatchAnnualizedBreakdownCents,
+    CompileFrequencies,
+)
+from app.services.tax_calculator import EstimateTax, EstimateTaxCents, _AnnualFigures, _HasHalfCentTie
+from app.services.tax_data import GetTaxYearByLabel
+
+CORPUS_SIZE = 200_000
+
+
+def _ReferenceRound(numerator: int, denominator: int) -> int:
+    # Enough precision that the quotient is exact or, when it does not terminate, far from a tie.
+    with localcontext() as context:
+        context.prec = 60
+        quotient = Decimal(numerator) / Decimal(denominator)
+        return int(quotient.quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def test_batch_round_half_up_matches_decimal_on_random_corpus() -> None:
+    rng = random.Random(20261017)
+    numerators = [rng.randint(-10**12, 10**12) for _ in range(CORPUS_SIZE)]
+    denominators = [rng.choice((7, 12, 26, 52, 365, 366)) * rng.randint(1, 3660) for _ in range(CORPUS_SIZE)]
+    # Exact half ties in both signs, which random draws almost never produce.
+    for index in range(0, CORPUS_SIZE, 10):
+        denominator = 2 * rng.randint(1, 10**5)
+        numerators[index] = (2 * rng.randint(-10**6, 10**6) + 1) * (denominator // 2)
+        denominators[index] = denominator
+
+    rounded = BatchRoundHalfUp(np.array(numerators), np.array(denominators)).tolist()
+    expected = [_ReferenceRound(n, d) for n, d in zip(numerators, denominators)]
+    mismatches = [
+        (n, d, got, want) for n, d, got, want in zip(numerators, denominators, rounded, expected) if got != want
+    ]
+    assert mismatches == []
+
+
+def test_batch_round_half_up_moves_ties_away_from_zero() -> None:
+    rounded = BatchRoundHalfUp(np.array([1, -1, 3, -3, 5, -5]), 2).tolist()
+    assert rounded == [1, -1, 2, -2, 3, -3]
+
+
+def test_cents_round_trip_matches_quantize_on_random_corpus() -> None:
+    rng = random.Random(17)
+    for _ in range(CORPUS_SIZE):
+        amount = Decimal(rng.randint(-10**10, 10**10)).scaleb(-rng.randint(0, 4))
+        cents = ToCents(amount)
+        assert FromCents(cents) == amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+_FREQUENCIES = ("Weekly", "Fortnightly", "Monthly", "Quarterly", "Yearly", "every 3 days", "every 6 weeks",
+                "every 5 months", "Hourly", "OneOff", "Unknown")
+
+
+def _BreakdownCorpus(size: int) -> list[tuple[int, str, date, date]]:
+    rng = random.Random(20261018)
+    corpus = []
+    for _ in range(size):
+        range_start = date(2020, 1, 1) + timedelta(days=rng.randint(0, 2000))
+        days = rng.choice((365, 366, rng.randint(1, 800)))
+        corpus.append((rng.randint(-10**9, 10**9), rng.choice(_FREQUENCIES), range_start,
+                       range_start + timedelta(days=days - 1)))
+    # Exact half-cent ties reached through non-terminating steps (365/n periods, per-day rates),
+    # searched for so the tie fallback is exercised. 1750434 cents every 7 days is exactly
+    # 76060.525 a month, which the Decimal chain rounds down.
+    corpus.append((1750434, "every 7 days", date(2025, 7, 1), date(2026, 6, 30)))
+    ties = 0
+    while ties < 200:
+        row = (rng.randint(1, 10**7), rng.choice(("every 3 days", "every 7 days", "every 9 days")),
+               date(2025, 7, 1), date(2026, 6, 30))
+        if _HasTie(*row):
+            corpus.append(row)
+            ties += 1
+    return corpus
+
+
+def _HasTie(amount_cents: int, frequency: str, range_start: date, range_end: date) -> bool:
+    compiled = GetFrequency(frequency)
+    periods = compiled.ExactPeriodsPerYear if compiled and compiled.WorkUnit is None else Fraction(0)
+    days = (range_end - range_start).days + 1
+    per_year = amount_cents * periods
+    return any(IsHalfCentTie(value) for value in (per_year, per_year / 12, per_year / days, per_year * 7 / days,
+                                                  per_year * 14 / days))
+
+
+def test_breakdown_cents_match_decimal_breakdown_on_corpus() -> None:
+    corpus = _BreakdownCorpus(20_000)
+    expected = [
+        {key: ToCents(value) for key, value in AnnualizedBreakdown(FromCents(cents), frequency, start, end).items()}
+        for cents, frequency, start, end in corpus
+    ]
+    assert [dict(AnnualizedBreakdownCents(*row)) for row in corpus] == expected
+    range_start, range_end = date(2025, 7, 1), date(2026, 6, 30)
+    fy_rows = [row for row in corpus if row[2:] == (range_start, range_end)]
+    batch = BatchAnnualizedBreakdownCents(
+        np.array([cents for cents, *_ in fy_rows]),
+        CompileFrequencies(frequency for _, frequency, *_ in fy_rows),
+        range_start,
+        range_end,
+    )
+    for key, values in batch.items():
+        assert values.tolist() == [dict(AnnualizedBreakdownCents(*row))[key] for row in fy_rows]
+
+
+def _DecimalEstimateCents(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _DecimalEstimateCents(item) for key, item in value.items()}
+    return ToCents(value) if isinstance(value, Decimal) else value
+
+
+def test_estimate_tax_cents_matches_decimal_estimate_on_corpus() -> None:
+    rng = random.Random(20261019)
+    requests = [
+        TaxCalculatorRequest(
+            SalaryAmount=Decimal(rng.randint(0, 30_000_000)).scaleb(-2),
+            SalaryFrequency=rng.choice(("Yearly", "Monthly", "Fortnightly", "Weekly", "Hourly", "Daily")),
+            IncludesSuper=rng.random() < 0.5,
+            SuperRate=Decimal(rng.choice(("0", "10.5", "11", "11.5", "12"))),
+            PrivateHealth=rng.random() < 0.5,
+            NovatedLeaseAmount=Decimal(rng.choice((0, 0, rng.randint(0, 200_000)))).scaleb(-2),
+            NovatedLeaseFrequency=rng.choice(("Yearly", "Monthly", "Weekly")),
+            TaxYear=rng.choice((None, "2023-24", "2024-25")),
+        )
+        for _ in range(3000)
+    ]
+    # Exact half-cent ties reached through non-terminating steps (365/3 periods, 1 + super rate,
+    # the weekly split), searched for so the tie fallback is exercised.
+    tax_year = GetTaxYearByLabel("2024-25")
+    ties = 0
+    while ties < 200:
+        request = TaxCalculatorRequest(
+            SalaryAmount=Decimal(3 * rng.randint(1, 10**5)).scaleb(-2),
+            SalaryFrequency=rng.choice(("every 3 days", "every 6 days", "Weekly")),
+            IncludesSuper=rng.random() < 0.5,
+            SuperRate=Decimal("11.5"),
+            PrivateHealth=True,
+            TaxYear=tax_year.Label,
+        )
+        if _HasHalfCentTie(_AnnualFigures(request, tax_year, exact=True)):
+            requests.append(request)
+            ties += 1
+    for request in requests:
+        expected = _DecimalEstimateCents(EstimateTax(request).model_dump())
+        assert asdict(EstimateTaxCents(request)) == expected, request
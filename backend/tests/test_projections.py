@@ -0,0 +1,44 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+START = date(2026, 10, 17)
+
+
+def _HouseholdHeaders(client: TestClient, email: str) -> dict[str, str]:
+    credentials = {"Email": email, "Password": "password1"}
+    assert client.post("/auth/register", json={**credentials, "HouseholdName": "Projections"}).status_code == 200
+    tokens = client.post("/auth/login", json=credentials).json()
+    return {"Authorization": f"Bearer {tokens['AccessToken']}"}
+
+
+def test_projection_schedules_expenses_like_calendar(client: TestClient) -> None:
+    headers = _HouseholdHeaders(client, "projections@tests.example.com")
+    expenses = [
+        # Neither NextDueDate nor DayOfMonth: the due-date engine has nothing to anchor it to.
+        {"Label": "Unanchored", "Amount": 20, "Frequency": "Monthly"},
+        {"Label": "Rates", "Amount": 450, "Frequency": "Monthly", "Cadence": "Quarterly", "Interval": 1,
+         "NextDueDate": "2026-11-30", "DayOfMonth": 30},
+        {"Label": "Gym", "Amount": 30, "Frequency": "Monthly", "DayOfMonth": 31},
+        {"Label": "Coffee", "Amount": 5, "Frequency": "Weekly", "NextDueDate": "2026-10-20"},
+    ]
+    ids = {}
+    for expense in expenses:
+        response = client.post("/expenses", json=expense, headers=headers)
+        assert response.status_code == 201
+        ids[expense["Label"]] = response.json()["Id"]
+
+    projection = client.get(f"/projections/cashflow?from={START}", headers=headers)
+    assert projection.status_code == 200
+    body = projection.json()
+    calendar = client.get(f"/calendar?from={START}&to={body['EndDate']}", headers=headers).json()
+
+    outflows = {point["Date"]: Decimal(point["Outflow"]) for point in body["Points"] if Decimal(point["Outflow"])}
+    expected: dict[str, Decimal] = {}
+    for event in calendar:
+        expected[event["Date"]] = expected.get(event["Date"], Decimal(0)) + Decimal(event["Amount"])
+    assert outflows == expected
+    assert ids["Unanchored"] not in {event["SourceId"] for event in calendar}
+    assert Decimal(body["ClosingBalance"]) == -sum(expected.values())
+    assert body["EndDate"] == str(date(2027, 10, 17) - timedelta(days=1))
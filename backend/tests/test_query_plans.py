@@ -0,0 +1,9 @@
+from fastapi.testclient import TestClient
+
+from benchmarks.query_plans import CheckRouteQueryPlans
+
+
+def test_read_routes_do_not_scan_tables(client: TestClient) -> None:
+    queries, scans = CheckRouteQueryPlans(client, households=2, expenses=200)
+    assert queries
+    assert scans == [], "\n".join(f"{path}: {detail}\n    {statement}" for path, detail, statement in scans)
@@ -0,0 +1,77 @@
+import itertools
+from pathlib import Path
+import sqlite3
+import time
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import db as app_db
+from app.core.config import settings
+from app.core.security import CreateLastWriteToken
+
+
+def _Labels(client: TestClient, headers: dict[str, str], cookie: str | None = None) -> set[str]:
+    client.cookies.clear()
+    if cookie is not None:
+        client.cookies.set(app_db.LAST_WRITE_COOKIE, cookie)
+    response = client.get("/expenses", headers=headers)
+    assert response.status_code == 200
+    return {expense["Label"] for expense in response.json()}
+
+
+@pytest.fixture
+def replica(client: TestClient, tmp_path: Path):
+    # A second SQLite file holding a snapshot of the primary: writes made after the snapshot
+    # are what a lagging replica would not have yet.
+    primary_path = settings.DatabaseUrl.removeprefix("sqlite:///")
+    replica_path = tmp_path / "replica.db"
+    with sqlite3.connect(primary_path) as source, sqlite3.connect(replica_path) as target:
+        source.backup(target)
+    replica_engine = app_db.CreateAsyncDbEngine(f"sqlite:///{replica_path}")
+    sessions = app_db._READ_SESSIONS
+    app_db.read_engines.append(replica_engine)
+    app_db._READ_SESSIONS = itertools.cycle([async_sessionmaker(replica_engine, expire_on_commit=False)])
+    try:
+        yield
+    finally:
+        app_db.read_engines.remove(replica_engine)
+        app_db._READ_SESSIONS = sessions
+        client.cookies.clear()
+        # Pooled aiosqlite connections belong to the client's event loop.
+        client.portal.call(replica_engine.dispose)
+
+
+def test_last_write_cookie_keeps_reads_on_primary_across_workers(
+    client: TestClient, auth_headers: dict[str, str], replica: None
+) -> None:
+    client.cookies.clear()
+    created = client.post(
+        "/expenses", json={"Label": "Written after snapshot", "Amount": 3, "Frequency": "Weekly"}, headers=auth_headers
+    )
+    assert created.status_code == 201
+    cookie = created.cookies.get(app_db.LAST_WRITE_COOKIE)
+    assert cookie
+
+    # Another worker has no record of the commit in its process.
+    app_db._LAST_COMMITS.clear()
+    assert "Written after snapshot" in _Labels(client, auth_headers, cookie)
+    assert "Written after snapshot" not in _Labels(client, auth_headers)
+
+    household_id = created.json()["HouseholdId"]
+    expired = CreateLastWriteToken(household_id, time.time() - settings.ReadReplicaStickySeconds - 1)
+    assert "Written after snapshot" not in _Labels(client, auth_headers, expired)
+    other_household = CreateLastWriteToken(household_id + 1000, time.time())
+    assert "Written after snapshot" not in _Labels(client, auth_headers, other_household)
+    assert "Written after snapshot" not in _Labels(client, auth_headers, cookie[:-2] + "xx")
+
+
+def test_same_worker_write_keeps_reads_on_primary_without_cookie(
+    client: TestClient, auth_headers: dict[str, str], replica: None
+) -> None:
+    created = client.post(
+        "/expenses", json={"Label": "Same worker write", "Amount": 3, "Frequency": "Weekly"}, headers=auth_headers
+    )
+    assert created.status_code == 201
+    assert "Same worker write" in _Labels(client, auth_headers)
@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+import calendar
+import random
+
+import numpy as np
+
+from app.services.schedules import (
+    CompileFrequencies,
+    GenerateOccurrences,
+    _advance,
+    _batch_occurrence_at,
+    _occurrence_at,
+)
+
+
+def _stepped(first_date: date, frequency: str, count: int) -> list[date]:
+    dates = [first_date]
+    for _ in range(count - 1):
+        dates.append(_advance(dates[-1], frequency))
+    return dates
+
+
+def test_leap_day_anchor_skips_gregorian_century_leap_year() -> None:
+    # 2100 is not a leap year, so the 2104 occurrence has already clamped to the 28th.
+    for frequency in ("every 48 months", "every 4 years"):
+        stepped = _stepped(date(2004, 2, 29), frequency, 27)
+        assert stepped[25] == date(2104, 2, 28)
+        assert _occurrence_at(date(2004, 2, 29), frequency, 25) == date(2104, 2, 28)
+        assert GenerateOccurrences(
+            date(2004, 2, 29), frequency, date(2100, 1, 1), date(2110, 12, 31), None
+        ) == stepped[24:27]
+
+
+def test_closed_form_matches_stepping_for_arbitrary_month_steps() -> None:
+    generator = random.Random(20261017)
+    first_dates: list[date] = []
+    frequencies: list[str] = []
+    indexes: list[int] = []
+    expected: list[date] = []
+    for _ in range(300):
+        months = generator.choice([1, 2, 3, 6, 12, 24, 48, 96, 100, 400, generator.randint(1, 240)])
+        frequency = f"every {months} months"
+        year = generator.randint(1600, 2400)
+        if generator.random() < 0.4:
+            # Leap days are the anchors whose clamp depends on the century rule.
+            while not calendar.isleap(year):
+                year -= 1
+            first_date = date(year, 2, 29)
+        else:
+            # Month ends are the anchors that clamp at all.
+            first_date = date(year, generator.randint(2, 12), 1) - timedelta(days=1)
+        count = generator.randint(1, min(400, 600 * 12 // months))
+        stepped = _stepped(first_date, frequency, count + 1)
+        for index in (count, generator.randint(0, count)):
+            assert _occurrence_at(first_date, frequency, index) == stepped[index], (first_date, months, index)
+            first_dates.append(first_date)
+            frequencies.append(frequency)
+            indexes.append(index)
+            expected.append(stepped[index])
+
+    batch = _batch_occurrence_at(
+        np.array(first_dates, dtype="datetime64[D]"),
+        CompileFrequencies(frequencies),
+        np.array(indexes, dtype=np.int64),
+    )
+    assert batch.tolist() == expected
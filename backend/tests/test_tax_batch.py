@@ -0,0 +1,26 @@
+from fastapi.testclient import TestClient
+
+from app.services.tax_calculator import ESTIMATE_BATCH_CHUNK
+from app.services.tax_data import ListTaxYears
+
+
+def test_batch_matches_single_estimates_in_request_order(client: TestClient, auth_headers: dict[str, str]) -> None:
+    labels = [tax_year.Label for tax_year in ListTaxYears()]
+    # Spans more than one chunk and interleaves tax years, so grouping must not reorder results.
+    requests = [
+        {
+            "SalaryAmount": 40000 + 97 * index,
+            "SalaryFrequency": "Yearly",
+            "TaxYear": labels[index % len(labels)],
+            "SuperRate": 11.5,
+            "IncludesSuper": index % 2 == 0,
+        }
+        for index in range(ESTIMATE_BATCH_CHUNK + 37)
+    ]
+    response = client.post("/tax-calculator/estimate/batch", json={"Requests": requests}, headers=auth_headers)
+    assert response.status_code == 200
+    estimates = response.json()
+    assert len(estimates) == len(requests)
+    for index in (0, 1, ESTIMATE_BATCH_CHUNK - 1, ESTIMATE_BATCH_CHUNK, len(requests) - 1):
+        single = client.post("/tax-calculator/estimate", json=requests[index], headers=auth_headers)
+        assert estimates[index] == single.json()
@@ -0,0 +1,27 @@
+from fastapi.testclient import TestClient
+
+from app.routes.tax_calculator import CURVE_MAX_POINTS
+
+
+def test_curve_counts_points_inclusively(client: TestClient, auth_headers: dict[str, str]) -> None:
+    response = client.get("/tax-calculator/curve?from=0&to=10000&step=2500", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["Salary"] == [0, 2500, 5000, 7500, 10000]
+
+
+def test_curve_accepts_the_maximum_point_count(client: TestClient, auth_headers: dict[str, str]) -> None:
+    response = client.get(f"/tax-calculator/curve?from=0&to={CURVE_MAX_POINTS - 1}&step=1", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()["Salary"]) == CURVE_MAX_POINTS
+
+
+def test_curve_rejects_too_many_points(client: TestClient, auth_headers: dict[str, str]) -> None:
+    response = client.get(f"/tax-calculator/curve?from=0&to={CURVE_MAX_POINTS}&step=1", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_curve_rejects_huge_range_with_tiny_step(client: TestClient, auth_headers: dict[str, str]) -> None:
+    # Integer division of this range by this step is DivisionImpossible in the default context.
+    response = client.get("/tax-calculator/curve?from=0&to=1e30&step=0.0001", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Too many curve points"